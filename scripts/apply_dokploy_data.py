@@ -15,32 +15,86 @@ updates each matched template's index.md with:
     - description  (pass --overwrite-description to always replace)
     - tags         (pass --overwrite-tags to always replace; default: merge)
 
+Only the frontmatter keys that change are rewritten; every other line of
+index.md is left byte-for-byte as it was.
+
+Templates are processed in two phases: every index.md is parsed and its
+change set computed first (in a process pool with --jobs > 1), then changed
+files are written atomically (temp file + rename). Changed templates are
+validated (validate_templates.py) with their new frontmatter first, and are
+reported as errors instead of written if they would be invalid.
+
+Templates whose match entry and index.md are unchanged since the last run
+(per scripts/dokploy-applied.json) are skipped without being opened; pass
+--force to re-evaluate everything.
+
 Usage:
     python scripts/apply_dokploy_data.py [--dry-run]
                                          [--overwrite-description]
                                          [--overwrite-tags]
+                                         [--jobs N]
+                                         [--changes-json PATH]
+                                         [--force]
+                                         [--no-validate]
+                                         [--watch [--debounce S] [--poll]]
                                          [template]
 
-    template  Optional slug to apply data for only one template.
+    template        Optional slug to apply data for only one template.
+    --jobs          Number of worker processes / writer threads (default: 1).
+    --changes-json  Write the computed change set as JSON to PATH ("-" for stdout).
+    --force         Ignore the fingerprint manifest and re-check every template.
+    --no-validate   Write changes even if the template would fail validation.
+    --watch         Keep running and re-apply / re-validate the templates whose
+                    index.md, compose.yml or match entry changes (inotify, or
+                    --poll). Bursts are debounced (--debounce SECONDS).
+    --report json   Print per-phase timings at exit (see instrumentation.py);
+                    --profile PATH writes a cProfile dump.
 """
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+import instrumentation
+from instrumentation import span
+
+# The process pool, the validator and the file watcher are imported where
+# they are used: build_search_index.py and sync_typesense.py import this
+# module only for read_frontmatter.
+
 # ── Constants ──────────────────────────────────────────────────────────────────
 
 REPO_ROOT = Path(__file__).parent.parent
 TEMPLATES_DIR = REPO_ROOT / "src" / "content" / "templates"
 MATCHES_FILE = Path(__file__).parent / "dokploy-matches.json"
+APPLY_MANIFEST_FILE = Path(__file__).parent / "dokploy-applied.json"
+
+# --watch: files that trigger a re-run, and how long a burst of changes may
+# stay quiet (seconds) before it is processed.
+WATCHED_FILES = ("index.md", "compose.yml")
+DEFAULT_DEBOUNCE = 0.05
 
 # Fields always overwritten from Dokploy data (they don't exist locally yet)
 ALWAYS_OVERWRITE = {"logoUrl", "githubUrl", "docsUrl", "websiteUrl"}
 
 _FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+# A top-level mapping key at column 0 (not a comment or a block sequence item).
+_TOP_LEVEL_KEY_RE = re.compile(r"^([^\s#\-][^:]*):(?:\s|$)")
 
 
 class Colors:
@@ -53,24 +107,157 @@ class Colors:
     ENDC = "\033[0m"
 
 
+class ApplyManifest:
+    """Per-slug fingerprints of the last applied match entry and index.md.
+
+    index.md is fingerprinted by size and mtime so freshness can be checked
+    with a single stat() call, without opening or parsing the file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._dirty = False
+        self._entries: dict[str, dict] = {}
+        if path.exists():
+            try:
+                self._entries = json.loads(path.read_text())
+            except ValueError:
+                self._entries = {}
+
+    @staticmethod
+    def _file_fingerprint(path: Path) -> dict | None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def is_fresh(self, slug: str, match_hash: str, path: Path) -> bool:
+        """True if neither the match entry nor index.md changed since recorded."""
+        entry = self._entries.get(slug)
+        if entry is None or entry["match"] != match_hash:
+            return False
+        return entry["file"] == self._file_fingerprint(path)
+
+    def record(self, slug: str, match_hash: str, path: Path) -> None:
+        entry = {"match": match_hash, "file": self._file_fingerprint(path)}
+        if self._entries.get(slug) != entry:
+            self._entries[slug] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the manifest if anything changed since loading."""
+        if not self._dirty:
+            return
+        self.path.write_text(json.dumps(self._entries, indent=2, sort_keys=True))
+        self._dirty = False
+
+
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
 
 def read_frontmatter(path: Path) -> tuple[dict, str]:
     """Return (parsed_frontmatter_dict, raw_file_text)."""
-    text = path.read_text(encoding="utf-8")
+    with span("io.read", path.parent.name) as s:
+        text = path.read_text(encoding="utf-8")
+        s.bytes_in = len(text)
     m = _FRONTMATTER_RE.match(text)
     if not m:
         raise ValueError(f"No YAML frontmatter found in {path}")
-    data = yaml.safe_load(m.group(1)) or {}
+    with span("yaml.parse", path.parent.name):
+        data = yaml.load(m.group(1), Loader=SafeLoader) or {}
     return data, text
 
 
-def write_frontmatter(path: Path, data: dict, original_text: str) -> None:
-    """Replace the frontmatter block in the file with updated data."""
-    new_fm = yaml.dump(data, allow_unicode=True, sort_keys=False, default_flow_style=False).rstrip()
-    new_text = _FRONTMATTER_RE.sub(f"---\n{new_fm}\n---", original_text, count=1)
-    path.write_text(new_text, encoding="utf-8")
+def dump_yaml(data: dict) -> str:
+    """Serialize a mapping the way frontmatter is written (block style, key order kept)."""
+    with span("yaml.dump"):
+        return yaml.dump(
+            data,
+            Dumper=SafeDumper,
+            allow_unicode=True,
+            sort_keys=False,
+            default_flow_style=False,
+        ).rstrip()
+
+
+def render_frontmatter(data: dict, original_text: str) -> str:
+    """Return the file text with its frontmatter block replaced by data."""
+    new_fm = dump_yaml(data)
+    return _FRONTMATTER_RE.sub(lambda _: f"---\n{new_fm}\n---", original_text, count=1)
+
+
+def patch_frontmatter(original_text: str, data: dict, keys: list[str]) -> str:
+    """Return the file text with only the given top-level keys rewritten.
+
+    Each key's block (its line plus any indented or `- ` continuation lines)
+    is replaced in place, and missing keys are appended, so untouched keys
+    keep their original order and formatting. Falls back to
+    render_frontmatter if the patched block would not parse back to `data`.
+    """
+    m = _FRONTMATTER_RE.match(original_text)
+    if not m:
+        return render_frontmatter(data, original_text)
+    lines = m.group(1).split("\n")
+
+    spans: dict[str, tuple[int, int]] = {}
+    current: tuple[str, int] | None = None
+    for i, line in enumerate(lines + [""]):
+        key_match = _TOP_LEVEL_KEY_RE.match(line)
+        continues = line.startswith((" ", "\t", "- ")) or line == "-"
+        if current is not None and (key_match or not continues):
+            spans[current[0]] = (current[1], i)
+            current = None
+        if key_match:
+            current = (key_match.group(1).strip(), i)
+
+    replacements: dict[int, tuple[int, list[str]]] = {}
+    appended: list[str] = []
+    for key in keys:
+        rendered = dump_yaml({key: data[key]}).split("\n")
+        if key in spans:
+            start, end = spans[key]
+            replacements[start] = (end, rendered)
+        else:
+            appended.extend(rendered)
+
+    new_lines: list[str] = []
+    i = 0
+    while i < len(lines):
+        if i in replacements:
+            end, rendered = replacements[i]
+            new_lines.extend(rendered)
+            i = end
+        else:
+            new_lines.append(lines[i])
+            i += 1
+    new_fm = "\n".join(new_lines + appended)
+
+    if (yaml.load(new_fm, Loader=SafeLoader) or {}) != data:
+        return render_frontmatter(data, original_text)
+    return original_text[: m.start(1)] + new_fm + original_text[m.end(1) :]
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write text to path via a temporary file in the same directory + rename."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def fingerprint_match(
+    match: dict, overwrite_description: bool, overwrite_tags: bool
+) -> str:
+    """Hash a match entry together with the options that affect its outcome."""
+    payload = json.dumps(
+        [match, overwrite_description, overwrite_tags], sort_keys=True
+    ).encode()
+    return hashlib.sha256(payload).hexdigest()
 
 
 def merge_tags(existing: list[str], incoming: list[str]) -> list[str]:
@@ -79,6 +266,237 @@ def merge_tags(existing: list[str], incoming: list[str]) -> list[str]:
     return existing + [t for t in incoming if t not in seen]
 
 
+def compute_changes(
+    slug: str,
+    match: dict,
+    overwrite_description: bool,
+    overwrite_tags: bool,
+) -> dict:
+    """Parse one template and compute the frontmatter changes for it.
+
+    Runs in worker processes, so it only takes and returns plain data. The
+    result dict has "slug", "status" ("changed", "unchanged" or "error") and,
+    depending on status, "changes", "before", "after", "new_text" or "error".
+    """
+    index_path = TEMPLATES_DIR / slug / "index.md"
+    if not index_path.exists():
+        return {"slug": slug, "status": "error", "error": "index.md not found"}
+
+    try:
+        data, raw_text = read_frontmatter(index_path)
+    except ValueError as exc:
+        return {"slug": slug, "status": "error", "error": str(exc)}
+
+    before = dict(data)
+    changes: list[str] = []
+
+    # ── URL / logo fields (always overwrite) ──────────────────────────────────
+    for field in ("logoUrl", "githubUrl", "docsUrl", "websiteUrl"):
+        value = match.get(field)
+        if value:
+            if data.get(field) != value:
+                data[field] = value
+                changes.append(field)
+        else:
+            # Explicitly set to None so the field is absent / null
+            if field in data and data[field]:
+                pass  # keep existing non-null value
+            elif value is None and field not in data:
+                pass  # don't add null fields
+
+    # ── Description ───────────────────────────────────────────────────────────
+    new_desc: str = match.get("description", "").strip()
+    if new_desc:
+        current_desc: str = (data.get("description") or "").strip()
+        if overwrite_description or not current_desc:
+            if data.get("description", "").strip() != new_desc:
+                data["description"] = new_desc
+                changes.append("description")
+
+    # ── Tags ──────────────────────────────────────────────────────────────────
+    new_tags: list[str] = match.get("tags", [])
+    if new_tags:
+        current_tags: list[str] = data.get("tags") or []
+        if overwrite_tags:
+            if current_tags != new_tags:
+                data["tags"] = new_tags
+                changes.append("tags")
+        else:
+            merged = merge_tags(current_tags, new_tags)
+            if merged != current_tags:
+                data["tags"] = merged
+                changes.append("tags(merged)")
+
+    if not changes:
+        return {"slug": slug, "status": "unchanged"}
+
+    fields = [c.split("(")[0] for c in changes]
+    return {
+        "slug": slug,
+        "status": "changed",
+        "path": str(index_path),
+        "changes": changes,
+        "before": {f: before.get(f) for f in fields},
+        "after": {f: data.get(f) for f in fields},
+        "new_text": patch_frontmatter(raw_text, data, fields),
+    }
+
+
+def compute_changes_recorded(*args) -> tuple[dict, list]:
+    """compute_changes in a worker process, plus the spans it recorded."""
+    with instrumentation.recorder.capture() as samples:
+        with span("template", args[0]):
+            result = compute_changes(*args)
+    return result, samples
+
+
+def compute_change_set(
+    matches: dict[str, dict],
+    overwrite_description: bool,
+    overwrite_tags: bool,
+    jobs: int = 1,
+) -> list[dict]:
+    """Compute changes for every matched template, sorted by slug."""
+    slugs = sorted(matches)
+    args = (
+        slugs,
+        [matches[slug] for slug in slugs],
+        [overwrite_description] * len(slugs),
+        [overwrite_tags] * len(slugs),
+    )
+    if jobs <= 1 or len(slugs) <= 1:
+        results = []
+        for slug, *rest in zip(*args):
+            with span("template", slug):
+                results.append(compute_changes(slug, *rest))
+        return results
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(slugs) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        if not instrumentation.recorder.enabled:
+            return list(pool.map(compute_changes, *args, chunksize=chunksize))
+        results = []
+        for result, samples in pool.map(
+            compute_changes_recorded, *args, chunksize=chunksize
+        ):
+            instrumentation.recorder.merge(samples)
+            results.append(result)
+        return results
+
+
+def write_change_set(change_set: list[dict], jobs: int = 1) -> None:
+    """Atomically write every changed file in the change set."""
+    changed = [r for r in change_set if r["status"] == "changed"]
+
+    def write(result: dict) -> None:
+        with span("io.write", result["slug"]) as s:
+            atomic_write_text(Path(result["path"]), result["new_text"])
+            s.bytes_out = len(result["new_text"])
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        list(pool.map(write, changed))
+
+
+def apply_matches(
+    matches: dict[str, dict],
+    manifest: ApplyManifest,
+    overwrite_description: bool,
+    overwrite_tags: bool,
+    dry_run: bool,
+    jobs: int = 1,
+    force: bool = False,
+    validate: bool = True,
+) -> list[dict]:
+    """Compute, validate and (unless dry_run) write the changes for `matches`.
+
+    Returns the change set sorted by slug. Applied templates are recorded in
+    `manifest`; saving it is left to the caller.
+    """
+    fingerprints = {
+        slug: fingerprint_match(match, overwrite_description, overwrite_tags)
+        for slug, match in matches.items()
+    }
+    pending: dict[str, dict] = {}
+    change_set: list[dict] = []
+    for slug, match in matches.items():
+        index_path = TEMPLATES_DIR / slug / "index.md"
+        if not force and manifest.is_fresh(slug, fingerprints[slug], index_path):
+            change_set.append({"slug": slug, "status": "unchanged", "cached": True})
+        else:
+            pending[slug] = match
+
+    change_set += compute_change_set(
+        pending, overwrite_description, overwrite_tags, jobs=jobs
+    )
+    change_set.sort(key=lambda r: r["slug"])
+
+    # Pre-flight: never write frontmatter that leaves a template invalid.
+    if validate:
+        from validate_templates import validate_templates
+
+        new_texts = {
+            r["slug"]: r["new_text"] for r in change_set if r["status"] == "changed"
+        }
+        if new_texts:
+            with span("validate"):
+                problems = validate_templates(
+                    list(new_texts), jobs, index_texts=new_texts
+                )
+            for result in change_set:
+                errors = problems.get(result["slug"])
+                if errors:
+                    result.update(status="error", error="; ".join(errors))
+
+    if not dry_run:
+        write_change_set(change_set, jobs=jobs)
+        for result in change_set:
+            if result["status"] != "error":
+                slug = result["slug"]
+                index_path = TEMPLATES_DIR / slug / "index.md"
+                manifest.record(slug, fingerprints[slug], index_path)
+    return change_set
+
+
+def print_change_set(
+    change_set: list[dict], dry_run: bool, quiet: bool = False
+) -> tuple[int, int, list[str]]:
+    """Print one line per template; returns (updated, skipped, error slugs).
+
+    With quiet, unchanged templates are counted but not printed.
+    """
+    C = Colors
+    updated = 0
+    skipped = 0
+    errors: list[str] = []
+    dry_tag = f"  {C.GREY}(dry-run){C.ENDC}" if dry_run else ""
+
+    for result in change_set:
+        slug = result["slug"]
+        if result["status"] == "error":
+            print(
+                f"  {C.RED}✗{C.ENDC}  {C.RED}{slug:<20}{C.ENDC}"
+                f"  {C.GREY}{result['error']}{C.ENDC}"
+            )
+            errors.append(slug)
+        elif result["status"] == "unchanged":
+            skipped += 1
+            if quiet:
+                continue
+            cached_tag = " (cached)" if result.get("cached") else ""
+            print(
+                f"  {C.GREY}–{C.ENDC}  {slug:<20}"
+                f"  {C.GREY}no changes{cached_tag}{C.ENDC}"
+            )
+        else:
+            updated += 1
+            change_list = f"{C.GREY}[{', '.join(result['changes'])}]{C.ENDC}"
+            print(
+                f"  {C.GREEN}✓{C.ENDC}  {slug:<20}  {change_list}{dry_tag}"
+            )
+    return updated, skipped, errors
+
+
 # ── Main ───────────────────────────────────────────────────────────────────────
 
 
@@ -87,6 +505,10 @@ def main(
     overwrite_description: bool,
     overwrite_tags: bool,
     only_template: str | None = None,
+    jobs: int = 1,
+    changes_json: str | None = None,
+    force: bool = False,
+    validate: bool = True,
 ) -> None:
     C = Colors
 
@@ -98,8 +520,6 @@ def main(
         )
         sys.exit(1)
 
-    import json
-
     all_matches: dict[str, dict] = json.loads(MATCHES_FILE.read_text())
 
     if only_template is not None:
@@ -122,86 +542,34 @@ def main(
             f"{C.BLUE}Applying Dokploy data to{C.ENDC} {len(matches)} matched templates …\n"
         )
 
-    updated = 0
-    skipped = 0
-    errors: list[str] = []
-
-    for slug, match in sorted(matches.items()):
-        index_path = TEMPLATES_DIR / slug / "index.md"
-        if not index_path.exists():
-            print(
-                f"  {C.RED}✗{C.ENDC}  {C.RED}{slug:<20}{C.ENDC}"
-                f"  {C.GREY}index.md not found{C.ENDC}"
-            )
-            errors.append(slug)
-            continue
-
-        try:
-            data, raw_text = read_frontmatter(index_path)
-        except ValueError as exc:
-            print(
-                f"  {C.RED}✗{C.ENDC}  {C.RED}{slug:<20}{C.ENDC}"
-                f"  {C.GREY}{exc}{C.ENDC}"
-            )
-            errors.append(slug)
-            continue
-
-        changes: list[str] = []
-
-        # ── URL / logo fields (always overwrite) ──────────────────────────────
-        for field in ("logoUrl", "githubUrl", "docsUrl", "websiteUrl"):
-            value = match.get(field)
-            if value:
-                if data.get(field) != value:
-                    data[field] = value
-                    changes.append(field)
-            else:
-                # Explicitly set to None so the field is absent / null
-                if field in data and data[field]:
-                    pass  # keep existing non-null value
-                elif value is None and field not in data:
-                    pass  # don't add null fields
-
-        # ── Description ───────────────────────────────────────────────────────
-        new_desc: str = match.get("description", "").strip()
-        if new_desc:
-            current_desc: str = (data.get("description") or "").strip()
-            if overwrite_description or not current_desc:
-                if data.get("description", "").strip() != new_desc:
-                    data["description"] = new_desc
-                    changes.append("description")
-
-        # ── Tags ──────────────────────────────────────────────────────────────
-        new_tags: list[str] = match.get("tags", [])
-        if new_tags:
-            current_tags: list[str] = data.get("tags") or []
-            if overwrite_tags:
-                if current_tags != new_tags:
-                    data["tags"] = new_tags
-                    changes.append("tags")
-            else:
-                merged = merge_tags(current_tags, new_tags)
-                if merged != current_tags:
-                    data["tags"] = merged
-                    changes.append("tags(merged)")
-
-        if not changes:
-            skipped += 1
-            print(
-                f"  {C.GREY}–{C.ENDC}  {slug:<20}"
-                f"  {C.GREY}no changes{C.ENDC}"
-            )
-            continue
-
-        if not dry_run:
-            write_frontmatter(index_path, data, raw_text)
-
-        updated += 1
-        dry_tag = f"  {C.GREY}(dry-run){C.ENDC}" if dry_run else ""
-        change_list = f"{C.GREY}[{', '.join(changes)}]{C.ENDC}"
-        print(
-            f"  {C.GREEN}✓{C.ENDC}  {slug:<20}  {change_list}{dry_tag}"
-        )
+    manifest = ApplyManifest(APPLY_MANIFEST_FILE)
+    change_set = apply_matches(
+        matches,
+        manifest,
+        overwrite_description,
+        overwrite_tags,
+        dry_run,
+        jobs=jobs,
+        force=force,
+        validate=validate,
+    )
+    if not dry_run:
+        manifest.save()
+
+    updated, skipped, errors = print_change_set(change_set, dry_run)
+
+    if changes_json is not None:
+        report = [
+            {k: v for k, v in result.items() if k not in ("new_text", "path")}
+            for result in change_set
+            if result["status"] != "unchanged"
+        ]
+        payload = json.dumps(report, indent=2, ensure_ascii=False)
+        if changes_json == "-":
+            print(payload)
+        else:
+            Path(changes_json).write_text(payload + "\n", encoding="utf-8")
+            print(f"\n{C.GREEN}Saved change set{C.ENDC} {C.GREY}→ {changes_json}{C.ENDC}")
 
     # ── Summary ───────────────────────────────────────────────────────────────
     print(f"\n{C.GREY}{'─' * 50}{C.ENDC}")
@@ -211,10 +579,207 @@ def main(
     print(f"Errors:  {error_color}{len(errors)}{C.ENDC}")
     if errors:
         print(f"  {C.RED}{', '.join(errors)}{C.ENDC}")
+    instrumentation.count("templates.updated", updated)
+    instrumentation.count("templates.skipped", skipped)
+    instrumentation.count("templates.errors", len(errors))
+
+
+# ── Watch ──────────────────────────────────────────────────────────────────────
+
+
+def load_matches() -> dict[str, dict] | None:
+    """dokploy-matches.json, or None while it is missing or half-written."""
+    try:
+        return json.loads(MATCHES_FILE.read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class TemplateWatch:
+    """What a --watch run keeps warm between batches of file changes.
+
+    The matches, the apply manifest and the validation cache stay in memory,
+    and so do the imported YAML/validation modules. A batch only re-applies
+    and re-validates the templates whose files (or match entries) changed.
+    """
+
+    def __init__(
+        self,
+        overwrite_description: bool,
+        overwrite_tags: bool,
+        dry_run: bool,
+        validate: bool,
+        only_template: str | None = None,
+    ) -> None:
+        from validate_templates import ValidationCache
+
+        self.overwrite_description = overwrite_description
+        self.overwrite_tags = overwrite_tags
+        self.dry_run = dry_run
+        self.validate = validate
+        self.only_template = only_template
+        self.matches = load_matches() or {}
+        self.manifest = ApplyManifest(APPLY_MANIFEST_FILE)
+        self.validation = ValidationCache()
+        # index.md files we wrote, so their change events are not re-processed
+        self._written: dict[Path, tuple[int, int] | None] = {}
+
+    def affected(self, paths: set[Path]) -> tuple[set[str], set[str]]:
+        """Map changed paths to (slugs to re-apply, slugs to re-validate)."""
+        to_apply: set[str] = set()
+        to_check: set[str] = set()
+        for path in paths:
+            if path == MATCHES_FILE:
+                matches = load_matches()
+                if matches is None:
+                    continue  # mid-write: its close will be another event
+                for slug in matches.keys() | self.matches.keys():
+                    if matches.get(slug) != self.matches.get(slug):
+                        to_apply.add(slug)
+                        to_check.add(slug)
+                self.matches = matches
+                continue
+            if path in self._written and self._written.pop(path) == _stat_key(path):
+                continue
+            slug = path.parent.name
+            to_check.add(slug)
+            if path.name == "index.md":
+                to_apply.add(slug)
+        if self.only_template is not None:
+            to_apply &= {self.only_template}
+            to_check &= {self.only_template}
+        return to_apply, to_check
+
+    def process(
+        self, to_apply: set[str], to_check: set[str], jobs: int = 1
+    ) -> tuple[list[dict], dict[str, list[str] | None]]:
+        """Apply, then validate; returns (change set, {slug: errors}).
+
+        Errors are None for a template whose directory is gone.
+        """
+        from validate_templates import validate_templates
+
+        existing = sorted(s for s in to_check if (TEMPLATES_DIR / s).is_dir())
+        matches = {
+            slug: self.matches[slug]
+            for slug in to_apply
+            if slug in self.matches and (TEMPLATES_DIR / slug).is_dir()
+        }
+        change_set = apply_matches(
+            matches,
+            self.manifest,
+            self.overwrite_description,
+            self.overwrite_tags,
+            self.dry_run,
+            jobs=jobs,
+            validate=self.validate,
+        )
+        if not self.dry_run:
+            for result in change_set:
+                if result["status"] == "changed":
+                    path = Path(result["path"])
+                    self._written[path] = _stat_key(path)
+            self.manifest.save()
+
+        with span("validate"):
+            problems: dict[str, list[str] | None] = dict(
+                validate_templates(existing, jobs, self.validation)
+            )
+        self.validation.save()
+        problems.update(dict.fromkeys(to_check.difference(existing)))
+        return change_set, problems
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description=__doc__)
+def print_watch_results(
+    change_set: list[dict],
+    problems: dict[str, list[str] | None],
+    quiet: bool = False,
+) -> int:
+    """One line per template touched by a batch. Returns the failing count.
+
+    With quiet, templates that are unchanged and valid are not printed.
+    """
+    C = Colors
+    results = {result["slug"]: result for result in change_set}
+    failing = 0
+    for slug in sorted(results.keys() | problems.keys()):
+        if slug in problems and problems[slug] is None:
+            print(f"  {C.GREY}–  {slug:<20}  removed{C.ENDC}")
+            continue
+        result = results.get(slug, {"status": "unchanged"})
+        errors = list(problems.get(slug) or [])
+        if result["status"] == "error" and result["error"] not in errors:
+            errors.insert(0, result["error"])
+        changed = result["status"] == "changed"
+        if errors:
+            failing += 1
+            print(f"  {C.RED}✗{C.ENDC}  {C.RED}{slug:<20}{C.ENDC}")
+            for message in errors:
+                print(f"       {C.GREY}• {message}{C.ENDC}")
+        elif changed:
+            change_list = f"{C.GREY}[{', '.join(result['changes'])}]{C.ENDC}"
+            print(f"  {C.GREEN}✓{C.ENDC}  {slug:<20}  {change_list}")
+        elif not quiet:
+            print(f"  {C.GREEN}✓{C.ENDC}  {slug:<20}  {C.GREY}valid{C.ENDC}")
+    return failing
+
+
+def watch(
+    state: TemplateWatch,
+    jobs: int = 1,
+    debounce: float = DEFAULT_DEBOUNCE,
+    poll: bool = False,
+) -> None:
+    """Apply and validate everything once, then again on every file change."""
+    from file_watcher import batches, create_watcher
+
+    C = Colors
+    started = time.perf_counter()
+    every = sorted(p.name for p in TEMPLATES_DIR.iterdir() if p.is_dir())
+    if state.only_template is not None:
+        every = [state.only_template]
+    change_set, problems = state.process(set(every), set(every), jobs=jobs)
+    failing = print_watch_results(change_set, problems, quiet=True)
+    elapsed = (time.perf_counter() - started) * 1000
+    print(
+        f"{C.GREY}{len(every)} templates, {failing} failing,"
+        f" in {elapsed:.0f} ms{C.ENDC}"
+    )
+
+    with create_watcher(
+        TEMPLATES_DIR, WATCHED_FILES, [MATCHES_FILE], poll=poll
+    ) as watcher:
+        print(
+            f"\n{C.BLUE}Watching{C.ENDC} {TEMPLATES_DIR.relative_to(REPO_ROOT)}"
+            f" and {MATCHES_FILE.relative_to(REPO_ROOT)}"
+            f" {C.GREY}({watcher.kind}, Ctrl-C to stop){C.ENDC}"
+        )
+        for paths in batches(watcher, debounce):
+            started = time.perf_counter()
+            to_apply, to_check = state.affected(paths)
+            if not to_apply and not to_check:
+                continue
+            change_set, problems = state.process(to_apply, to_check, jobs=jobs)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(
+                f"\n{C.GREY}{time.strftime('%H:%M:%S')}{C.ENDC}"
+                f" {', '.join(sorted(to_apply | to_check))}"
+            )
+            print_watch_results(change_set, problems)
+            print(f"  {C.GREY}{elapsed:.1f} ms{C.ENDC}")
+
+
+def cli(argv: list[str] | None = None, prog: str | None = None) -> None:
+    """Command-line entry point, also run as `zane-templates <command>`."""
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__)
     parser.add_argument(
         "template",
         nargs="?",
@@ -236,15 +801,88 @@ if __name__ == "__main__":
         action="store_true",
         help="Replace existing tags entirely (default: merge / union).",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Parse templates in N worker processes and write with N threads (default: 1).",
+    )
+    parser.add_argument(
+        "--changes-json",
+        metavar="PATH",
+        default=None,
+        help='Write the computed change set as JSON to PATH ("-" for stdout).',
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-check every template, ignoring the fingerprint manifest.",
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip the validate_templates.py pre-flight on changed templates.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Keep running: re-apply and re-validate templates whose index.md,"
+            " compose.yml or match entry changes."
+        ),
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        metavar="SECONDS",
+        help=(
+            "With --watch, wait until files have been quiet this long"
+            f" (default: {DEFAULT_DEBOUNCE})."
+        ),
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll file stats instead of using inotify.",
+    )
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.watch and args.changes_json is not None:
+        parser.error("--changes-json cannot be combined with --watch")
 
     C = Colors
     if args.dry_run:
         print(f"{C.YELLOW}[DRY RUN]{C.ENDC} No files will be written.\n")
 
-    main(
-        dry_run=args.dry_run,
-        overwrite_description=args.overwrite_description,
-        overwrite_tags=args.overwrite_tags,
-        only_template=args.template,
-    )
+    if args.watch:
+        state = TemplateWatch(
+            overwrite_description=args.overwrite_description,
+            overwrite_tags=args.overwrite_tags,
+            dry_run=args.dry_run,
+            validate=not args.no_validate,
+            only_template=args.template,
+        )
+        try:
+            with instrumentation.reporting(args, "apply_dokploy_data"):
+                watch(state, jobs=args.jobs, debounce=args.debounce, poll=args.poll)
+        except KeyboardInterrupt:
+            print(f"\n{C.GREY}Stopped watching.{C.ENDC}")
+        return
+
+    with instrumentation.reporting(args, "apply_dokploy_data"):
+        main(
+            dry_run=args.dry_run,
+            overwrite_description=args.overwrite_description,
+            overwrite_tags=args.overwrite_tags,
+            only_template=args.template,
+            jobs=args.jobs,
+            changes_json=args.changes_json,
+            force=args.force,
+            validate=not args.no_validate,
+        )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark deploy_compose.py end to end against the in-process fake ZaneOps API.
+
+Runs the real CLI as a subprocess, the way scripted loops do, and reports:
+  - single-stack latency: cold (fresh login, forced deploy) and warm (cached
+    session, unchanged stack) invocations
+  - bulk throughput: every src/content/templates/*/compose.yml at several
+    --concurrency levels
+  - cleanup throughput: cleanup_stacks.py archiving as many stacks at the
+    same --concurrency levels
+
+The server latency (--latency) stands in for the network round-trip to a
+real instance; the request counts per run show where that time goes.
+Deployments are recorded in a temporary history file, never the user's.
+
+Usage:
+    python scripts/bench_deploy.py [--rounds N] [--latency S] [--concurrency 1 4 8 16]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from deploy_compose import stack_slug_for
+from fake_zane import Colors, FakeZane
+
+SCRIPTS_DIR = Path(__file__).parent
+DEPLOY_SCRIPT = SCRIPTS_DIR / "deploy_compose.py"
+CLEANUP_SCRIPT = SCRIPTS_DIR / "cleanup_stacks.py"
+TEMPLATES_DIR = SCRIPTS_DIR.parent / "src" / "content" / "templates"
+
+
+def run_cli(base_url: str, *args: str, script: Path = DEPLOY_SCRIPT) -> float:
+    """Run deploy_compose.py (or `script`) once and return its wall time in
+    seconds."""
+    cmd = [sys.executable, str(script), "--base-url", base_url, *args]
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} failed:\n{proc.stdout}{proc.stderr}")
+    return elapsed
+
+
+def summarize(samples: list[float]) -> str:
+    ms = sorted(s * 1000 for s in samples)
+    p95 = statistics.quantiles(ms, n=20)[-1] if len(ms) > 1 else ms[0]
+    return (
+        f"min {ms[0]:7.1f} ms  median {statistics.median(ms):7.1f} ms"
+        f"  p95 {p95:7.1f} ms"
+    )
+
+
+def bench_single(
+    server: FakeZane, compose_file: Path, rounds: int, history: str
+) -> None:
+    C = Colors
+    print(f"{C.BLUE}Single stack{C.ENDC} {C.GREY}({compose_file}){C.ENDC}")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = str(Path(tmp) / "sessions.json")
+        file_args = ["-f", str(compose_file), "-s", "bench", "--history", history]
+
+        server.reset()
+        cold = [
+            run_cli(server.base_url, *file_args, "--no-session-cache", "--force")
+            for _ in range(rounds)
+        ]
+        cold_requests = sum(server.requests.values()) / rounds
+
+        run_cli(server.base_url, *file_args, "--session-cache", cache)  # prime
+        server.requests.clear()
+        warm = [
+            run_cli(server.base_url, *file_args, "--session-cache", cache)
+            for _ in range(rounds)
+        ]
+        warm_requests = sum(server.requests.values()) / rounds
+
+    print(f"  cold  {summarize(cold)}  {C.GREY}{cold_requests:.0f} requests{C.ENDC}")
+    print(f"  warm  {summarize(warm)}  {C.GREY}{warm_requests:.0f} requests{C.ENDC}")
+    speedup = statistics.median(cold) / statistics.median(warm)
+    print(f"  Warm speed-up: {C.GREEN}{speedup:.1f}×{C.ENDC}\n")
+
+
+def bench_bulk(server: FakeZane, concurrency_levels: list[int], history: str) -> None:
+    C = Colors
+    files = sorted(TEMPLATES_DIR.glob("*/compose.yml"))
+    print(f"{C.BLUE}Bulk deploy{C.ENDC} {C.GREY}({len(files)} templates){C.ENDC}")
+    for concurrency in concurrency_levels:
+        server.reset()
+        elapsed = run_cli(
+            server.base_url,
+            "--bulk",
+            str(TEMPLATES_DIR),
+            "--concurrency",
+            str(concurrency),
+            "--no-session-cache",
+            "--history",
+            history,
+        )
+        print(
+            f"  -c {concurrency:<3} {elapsed * 1000:8.1f} ms"
+            f"  {C.GREEN}{len(files) / elapsed:6.1f} stacks/s{C.ENDC}"
+            f"  {C.GREY}{sum(server.requests.values())} requests{C.ENDC}"
+        )
+
+
+def bench_cleanup(server: FakeZane, concurrency_levels: list[int]) -> None:
+    C = Colors
+    slugs = [stack_slug_for(f) for f in sorted(TEMPLATES_DIR.glob("*/compose.yml"))]
+    print(f"\n{C.BLUE}Bulk cleanup{C.ENDC} {C.GREY}({len(slugs)} stacks){C.ENDC}")
+    for concurrency in concurrency_levels:
+        server.reset()
+        for slug in slugs:
+            server.create_stack("bench", "production", {"slug": slug})
+        elapsed = run_cli(
+            server.base_url,
+            "--all",
+            "--project",
+            "bench",
+            "--env",
+            "production",
+            "--concurrency",
+            str(concurrency),
+            "--no-session-cache",
+            script=CLEANUP_SCRIPT,
+        )
+        if server.stacks:
+            raise RuntimeError(f"{len(server.stacks)} stacks left after cleanup")
+        print(
+            f"  -c {concurrency:<3} {elapsed * 1000:8.1f} ms"
+            f"  {C.GREEN}{len(slugs) / elapsed:6.1f} stacks/s{C.ENDC}"
+            f"  {C.GREY}{sum(server.requests.values())} requests{C.ENDC}"
+        )
+
+
+def main(rounds: int, latency: float, concurrency_levels: list[int]) -> None:
+    C = Colors
+    with tempfile.TemporaryDirectory() as tmp:
+        history = str(Path(tmp) / "history.jsonl")
+        with FakeZane(latency=latency, deploy_time=0) as server:
+            print(
+                f"{C.BLUE}Fake ZaneOps{C.ENDC} at {server.base_url}"
+                f" {C.GREY}({latency * 1000:.0f} ms per request){C.ENDC}\n"
+            )
+            compose_file = TEMPLATES_DIR / "n8n" / "compose.yml"
+            bench_single(server, compose_file, rounds, history)
+            bench_bulk(server, concurrency_levels, history)
+            bench_cleanup(server, concurrency_levels)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", "-n", type=int, default=10)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="Seconds the fake server adds to every request",
+    )
+    parser.add_argument(
+        "--concurrency", "-c", type=int, nargs="+", default=[1, 4, 8, 16]
+    )
+    args = parser.parse_args()
+    main(args.rounds, args.latency, args.concurrency)
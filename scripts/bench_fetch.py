@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark fetch_dokploy_data.py --jobs against a local stand-in for GitHub.
+
+meta.json and one logo per local template are served from a temporary
+directory by an in-process HTTP server that adds --latency seconds to every
+request, standing in for the round-trip to raw.githubusercontent.com. Each
+round is a fresh interpreter that runs a full fetch with an empty cache and
+output directory, so every logo is downloaded. It reports the wall-clock
+time per --jobs level (median of --rounds) and the speed-up over the first
+level. Per-host requests are still capped at MAX_REQUESTS_PER_HOST.
+
+Usage:
+    python scripts/bench_fetch.py [--rounds N] [--latency S] [--jobs 1 4 16]
+"""
+
+import argparse
+import functools
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from bench_index import synthetic_index
+from fetch_dokploy_data import MAX_REQUESTS_PER_HOST, get_local_slugs
+
+SCRIPTS_DIR = Path(__file__).parent
+LOGO_BYTES = 4 * 1024
+
+CHILD = """
+import contextlib, io, json, sys, time
+from pathlib import Path
+import fetch_dokploy_data as fetch
+
+base_url, out, jobs = sys.argv[1], Path(sys.argv[2]), sys.argv[3]
+fetch.META_URL = f"{base_url}/meta.json"
+fetch.LOGO_BASE_URL = f"{base_url}/blueprints"
+fetch.REPO_ROOT = out
+fetch.LOGOS_DIR = out / "logos"
+fetch.INDEX_FILE = out / "dokploy-index.json"
+fetch.MATCHES_FILE = out / "dokploy-matches.json"
+fetch.LOGO_MANIFEST_FILE = out / "dokploy-logos.json"
+fetch.CACHE_DIR = out / ".dokploy-cache"
+fetch.COMPACT_INDEX_FILE = fetch.CACHE_DIR / "dokploy-index.bin"
+fetch.LOGOS_DIR.mkdir(parents=True)
+
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    fetch.cli(["--jobs", jobs])
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, len(list(fetch.LOGOS_DIR.iterdir()))]))
+"""
+
+
+class Colors:
+    GREEN = "\033[92m"
+    BLUE = "\033[94m"
+    YELLOW = "\033[33m"
+    RED = "\033[91m"
+    GREY = "\033[90m"
+    ENDC = "\033[0m"
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.0
+    requests = 0
+    _lock = threading.Lock()
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        pass
+
+    def do_GET(self) -> None:
+        with self._lock:
+            type(self).requests += 1
+        time.sleep(self.latency)
+        super().do_GET()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def build_site(root: Path, entries: int) -> int:
+    """Write meta.json and a logo for every local template; return the count."""
+    index = synthetic_index(entries)
+    (root / "meta.json").write_text(json.dumps(index))
+    local = set(get_local_slugs())
+    logos = 0
+    for entry in index:
+        if entry["id"] in local:
+            logo = root / "blueprints" / entry["id"] / entry["logo"]
+            logo.parent.mkdir(parents=True)
+            logo.write_bytes(b"<svg>" + b" " * LOGO_BYTES + b"</svg>")
+            logos += 1
+    return logos
+
+
+def run_child(base_url: str, jobs: int, rounds: int, expected: int) -> list[float]:
+    samples = []
+    for _ in range(rounds):
+        with tempfile.TemporaryDirectory() as out:
+            proc = subprocess.run(
+                [sys.executable, "-c", CHILD, base_url, out, str(jobs)],
+                capture_output=True,
+                text=True,
+                cwd=SCRIPTS_DIR,
+            )
+        if proc.returncode != 0:
+            raise RuntimeError(f"fetch --jobs {jobs} failed:\n{proc.stderr}")
+        elapsed, logos = json.loads(proc.stdout)
+        if logos != expected:
+            raise RuntimeError(f"--jobs {jobs}: {logos} logos, expected {expected}")
+        samples.append(elapsed)
+    return samples
+
+
+def main(rounds: int, latency: float, jobs_levels: list[int], entries: int) -> None:
+    C = Colors
+    with tempfile.TemporaryDirectory() as site:
+        logos = build_site(Path(site), entries)
+        handler = type(
+            "Handler",
+            (_Handler,),
+            {"latency": latency, "requests": 0, "_lock": threading.Lock()},
+        )
+        server = _Server(
+            ("127.0.0.1", 0), functools.partial(handler, directory=site)
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address[:2]
+        base_url = f"http://{host}:{port}"
+        print(
+            f"{C.BLUE}Full fetch{C.ENDC} {C.GREY}({logos} templates, {entries}"
+            f" index entries, {latency * 1000:.0f} ms per request, at most"
+            f" {MAX_REQUESTS_PER_HOST} per host; median of {rounds}){C.ENDC}\n"
+        )
+        try:
+            baseline = None
+            for jobs in jobs_levels:
+                handler.requests = 0
+                elapsed = statistics.median(run_child(base_url, jobs, rounds, logos))
+                baseline = baseline or elapsed
+                print(
+                    f"  -j {jobs:<3} {elapsed * 1000:8.1f} ms"
+                    f"  {C.GREEN}{baseline / elapsed:5.1f}×{C.ENDC}"
+                    f"  {C.GREY}{handler.requests // rounds} requests{C.ENDC}"
+                )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", "-n", type=int, default=3)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="Seconds the server adds to every request",
+    )
+    parser.add_argument("--jobs", "-j", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument(
+        "--entries", type=int, default=400, help="Entries in the served meta.json"
+    )
+    args = parser.parse_args()
+    main(max(1, args.rounds), args.latency, args.jobs, args.entries)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark the frontmatter read/write paths used by apply_dokploy_data.py.
+
+Compares, over every src/content/templates/*/index.md:
+  - old: pure-Python yaml.safe_load + full yaml.dump of the frontmatter block
+  - new: libyaml CSafeLoader (when available) + patch_frontmatter, which only
+         rewrites the changed keys
+
+Each template gets the same synthetic update (websiteUrl changed) so both
+paths do comparable work. Nothing is written to disk.
+
+Usage:
+    python scripts/bench_frontmatter.py [--rounds N]
+"""
+
+import argparse
+import time
+
+import yaml
+
+from apply_dokploy_data import (
+    _FRONTMATTER_RE,
+    TEMPLATES_DIR,
+    Colors,
+    SafeLoader,
+    patch_frontmatter,
+)
+
+
+def old_path(text: str) -> str:
+    fm = _FRONTMATTER_RE.match(text).group(1)  # type: ignore[union-attr]
+    data = yaml.safe_load(fm) or {}
+    data["websiteUrl"] = f"{data.get('websiteUrl') or ''}#bench"
+    new_fm = yaml.dump(
+        data, allow_unicode=True, sort_keys=False, default_flow_style=False
+    ).rstrip()
+    return _FRONTMATTER_RE.sub(lambda _: f"---\n{new_fm}\n---", text, count=1)
+
+
+def new_path(text: str) -> str:
+    fm = _FRONTMATTER_RE.match(text).group(1)  # type: ignore[union-attr]
+    data = yaml.load(fm, Loader=SafeLoader) or {}
+    data["websiteUrl"] = f"{data.get('websiteUrl') or ''}#bench"
+    return patch_frontmatter(text, data, ["websiteUrl"])
+
+
+def changed_lines(before: str, after: str) -> int:
+    """Number of lines in `before` that do not survive unchanged in `after`."""
+    remaining = after.splitlines()
+    count = 0
+    for line in before.splitlines():
+        if line in remaining:
+            remaining.remove(line)
+        else:
+            count += 1
+    return count
+
+
+def bench(fn, texts: list[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            fn(text)
+    return time.perf_counter() - start
+
+
+def main(rounds: int) -> None:
+    C = Colors
+    texts = [
+        p.read_text(encoding="utf-8") for p in sorted(TEMPLATES_DIR.glob("*/index.md"))
+    ]
+    print(
+        f"{C.BLUE}Benchmarking{C.ENDC} {len(texts)} templates × {rounds} rounds"
+        f" {C.GREY}(libyaml: {SafeLoader is not yaml.SafeLoader}){C.ENDC}\n"
+    )
+
+    results = {
+        "old": bench(old_path, texts, rounds),
+        "new": bench(new_path, texts, rounds),
+    }
+    calls = len(texts) * rounds
+    for name, elapsed in results.items():
+        print(
+            f"  {name:<4} {elapsed * 1000:8.1f} ms total"
+            f"  {C.GREY}{elapsed / calls * 1e6:8.1f} µs/template{C.ENDC}"
+        )
+    print(f"\nSpeed-up: {C.GREEN}{results['old'] / results['new']:.1f}×{C.ENDC}")
+
+    # Lines touched besides the one key that actually changed (1 line each).
+    old_churn = sum(changed_lines(t, old_path(t)) - 1 for t in texts)
+    new_churn = sum(changed_lines(t, new_path(t)) - 1 for t in texts)
+    print(
+        f"Untouched lines rewritten: old {C.YELLOW}{old_churn}{C.ENDC},"
+        f" new {C.GREEN}{new_churn}{C.ENDC}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", "-n", type=int, default=20)
+    args = parser.parse_args()
+    main(args.rounds)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark a cold single-template lookup in the Dokploy index.
+
+Compares the two ways fetch_dokploy_data.py <slug> can find its entry:
+  json     parse the whole meta.json, build MatchIndex, find_match
+  compact  map .dokploy-cache/dokploy-index.bin (CompactIndex), find_match
+
+Every round is a fresh interpreter. Only the lookup itself is timed (in the
+child, after imports), so the numbers compare the two paths and leave out
+interpreter startup. The index is synthetic and shaped like upstream
+meta.json: --entries sets its size to track the catalog's growth.
+
+Usage:
+    python scripts/bench_index.py [--rounds N] [--entries 400 4000 40000] [--slug n8n]
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from fetch_dokploy_data import build_compact_index, get_local_slugs
+
+SCRIPTS_DIR = Path(__file__).parent
+
+CHILD = """
+import json, sys, time
+from pathlib import Path
+from fetch_dokploy_data import CompactIndex, MatchIndex, find_match
+
+mode, path, sha, slug = sys.argv[1:]
+start = time.perf_counter()
+if mode == "json":
+    lookup = MatchIndex(json.loads(Path(path).read_bytes()))
+else:
+    lookup = CompactIndex.open(Path(path), sha)
+entry = find_match(slug, lookup)
+elapsed = time.perf_counter() - start
+assert entry is not None, (mode, slug)
+print(elapsed)
+"""
+
+
+class Colors:
+    GREEN = "\033[92m"
+    BLUE = "\033[94m"
+    YELLOW = "\033[33m"
+    RED = "\033[91m"
+    GREY = "\033[90m"
+    ENDC = "\033[0m"
+
+
+def synthetic_index(entries: int, seed: int = 0) -> list[dict]:
+    """An upstream-shaped index: every local template plus random entries."""
+    rng = random.Random(seed)
+    index = [
+        {
+            "id": slug,
+            "name": slug.replace("-", " ").title(),
+            "version": "latest",
+            "description": f"{slug} packaged for Dokploy.",
+            "logo": f"{slug}.svg",
+            "links": {
+                "github": f"https://github.com/{slug}/{slug}",
+                "website": f"https://{slug}.example.com",
+                "docs": f"https://docs.{slug}.example.com",
+            },
+            "tags": ["self-hosted"],
+        }
+        for slug in get_local_slugs()
+    ]
+    while len(index) < entries:
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+        item_id = f"{word}-{len(index)}"
+        index.append(
+            {
+                "id": item_id,
+                "name": word.title(),
+                "version": f"{rng.randint(0, 9)}.{rng.randint(0, 30)}",
+                "description": " ".join(
+                    "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+                    for _ in range(rng.randint(8, 30))
+                ),
+                "logo": f"{word}.png",
+                "links": {
+                    "github": f"https://github.com/{word}/{word}",
+                    "website": f"https://{word}.example.com",
+                    "docs": f"https://docs.{word}.example.com",
+                },
+                "tags": rng.sample(["database", "monitoring", "ai", "cms", "dev"], 2),
+            }
+        )
+    rng.shuffle(index)
+    return index
+
+
+def time_child(mode: str, path: Path, sha: str, slug: str, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        proc = subprocess.run(
+            [sys.executable, "-c", CHILD, mode, str(path), sha, slug],
+            capture_output=True,
+            text=True,
+            cwd=SCRIPTS_DIR,
+            check=True,
+        )
+        samples.append(float(proc.stdout))
+    return statistics.median(samples)
+
+
+def main(rounds: int, sizes: list[int], slug: str) -> None:
+    C = Colors
+    print(
+        f"{C.BLUE}Cold lookup of {slug!r}{C.ENDC}"
+        f" {C.GREY}(median of {rounds} fresh interpreters){C.ENDC}\n"
+    )
+    print(
+        f"{'Entries':>8}  {'meta.json':>10}  {'indent=2':>10}  {'compact':>10}"
+        f"  {'json path':>10}  {'compact path':>12}  Speed-up"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            body = json.dumps(synthetic_index(size)).encode()
+            sha = hashlib.sha256(body).hexdigest()
+            meta = Path(tmp) / f"meta-{size}.json"
+            compact = Path(tmp) / f"index-{size}.bin"
+            meta.write_bytes(body)
+            compact.write_bytes(build_compact_index(json.loads(body), sha))
+
+            json_time = time_child("json", meta, sha, slug, rounds)
+            compact_time = time_child("compact", compact, sha, slug, rounds)
+            print(
+                f"{size:>8}  {len(body) / 1024:>6.0f} KiB"
+                f"  {len(json.dumps(json.loads(body), indent=2)) / 1024:>6.0f} KiB"
+                f"  {compact.stat().st_size / 1024:>6.0f} KiB"
+                f"  {json_time * 1000:>7.2f} ms  {compact_time * 1000:>9.3f} ms"
+                f"  {C.GREEN}{json_time / compact_time:6.0f}×{C.ENDC}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", "-n", type=int, default=10)
+    parser.add_argument(
+        "--entries", type=int, nargs="+", default=[400, 4000, 40000]
+    )
+    parser.add_argument("--slug", default="n8n")
+    args = parser.parse_args()
+    main(max(1, args.rounds), args.entries, args.slug)
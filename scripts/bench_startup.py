@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark how fast the scripts start, the way shell loops call them.
+
+Each case runs as a fresh subprocess, --rounds times. It runs once through
+its script and once through zane_templates.py. With --baseline REF the same
+script is also timed from that git revision (extracted with `git archive`,
+with src/ and public/ linked in). This shows what the lazy imports saved.
+
+Cases are every command's --help plus runs that do no network I/O:
+deploy --preview, preview and validate of one template.
+
+Usage:
+    python scripts/bench_startup.py [--rounds N] [--baseline REF]
+"""
+
+import argparse
+import io
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+from zane_templates import COMMANDS
+
+SCRIPTS_DIR = Path(__file__).parent
+REPO_ROOT = SCRIPTS_DIR.parent
+ENTRYPOINT = SCRIPTS_DIR / "zane_templates.py"
+TEMPLATE = "n8n"
+COMPOSE_FILE = REPO_ROOT / "src" / "content" / "templates" / TEMPLATE / "compose.yml"
+
+CASES: list[tuple[str, list[str]]] = [
+    *((command, ["--help"]) for command in COMMANDS),
+    ("deploy", ["-f", str(COMPOSE_FILE), "--preview"]),
+    ("preview", [str(COMPOSE_FILE), "--seed", "1"]),
+    ("validate", [TEMPLATE, "--no-cache"]),
+]
+
+
+class Colors:
+    GREEN = "\033[92m"
+    BLUE = "\033[94m"
+    YELLOW = "\033[33m"
+    RED = "\033[91m"
+    GREY = "\033[90m"
+    ENDC = "\033[0m"
+
+
+def time_run(cmd: list[str], rounds: int) -> list[float]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        proc = subprocess.run(cmd, capture_output=True, cwd=REPO_ROOT)
+        samples.append(time.perf_counter() - start)
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"{' '.join(cmd)} failed:\n{proc.stdout.decode()}{proc.stderr.decode()}"
+            )
+    return samples
+
+
+def extract_baseline(ref: str, dest: Path) -> Path:
+    """Check out scripts/ at `ref` into dest, next to links to src/ and public/."""
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", ref, "scripts"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        check=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(dest, filter="data")
+    for name in ("src", "public"):
+        (dest / name).symlink_to(REPO_ROOT / name)
+    return dest / "scripts"
+
+
+def main(rounds: int, baseline: str | None) -> None:
+    C = Colors
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_dir = extract_baseline(baseline, Path(tmp)) if baseline else None
+
+        python = [sys.executable]
+        bare = statistics.median(time_run([*python, "-c", "pass"], rounds))
+        print(
+            f"{C.BLUE}Startup{C.ENDC} {C.GREY}(median of {rounds} runs,"
+            f" bare interpreter {bare * 1000:.1f} ms){C.ENDC}\n"
+        )
+        columns = ["script", "zane-templates"]
+        if baseline_dir is not None:
+            columns.insert(0, f"{baseline} script")
+        labels = [
+            f"{command} {' '.join(a if len(a) < 24 else '…' for a in args)}"
+            for command, args in CASES
+        ]
+        width = max(len(label) for label in labels)
+        print(f"{'Case':<{width}}  " + "  ".join(f"{c:>16}" for c in columns))
+
+        for label, (command, args) in zip(labels, CASES):
+            script = f"{COMMANDS[command][0]}.py"
+            runs = [
+                [*python, str(SCRIPTS_DIR / script), *args],
+                [*python, str(ENTRYPOINT), command, *args],
+            ]
+            if baseline_dir is not None:
+                if not (baseline_dir / script).exists():
+                    runs.insert(0, None)
+                else:
+                    runs.insert(0, [*python, str(baseline_dir / script), *args])
+
+            medians = [
+                statistics.median(time_run(cmd, rounds)) if cmd else None
+                for cmd in runs
+            ]
+            cells = [
+                f"{m * 1000:13.1f} ms" if m is not None else f"{'–':>16}"
+                for m in medians
+            ]
+            line = f"{label:<{width}}  " + "  ".join(cells)
+            if baseline_dir is not None and medians[0] is not None:
+                saved = medians[0] - medians[-1]
+                color = C.GREEN if saved > 0 else C.GREY
+                line += f"  {color}{saved * 1000:+7.1f} ms saved{C.ENDC}"
+            print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", "-n", type=int, default=10)
+    parser.add_argument(
+        "--baseline",
+        metavar="REF",
+        help="Also time the scripts as of this git revision (e.g. HEAD~1)",
+    )
+    args = parser.parse_args()
+    main(max(1, args.rounds), args.baseline)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark matching every local template against the Dokploy index, parsed
+whole or streamed.
+
+Compares the two ways fetch_dokploy_data.py builds its lookup for a full run:
+  json    json.loads of meta.json, MatchIndex over every entry
+  stream  iter_json_array + RelevantEntries, MatchIndex over the kept entries
+
+Every round is a fresh interpreter that matches all local templates with
+find_match. It reports the time from reading meta.json to the last match and
+the process's peak RSS (and how far that is above the RSS after imports). Both
+modes must produce the same matches. The index is synthetic and shaped like
+upstream meta.json (see bench_index.py).
+
+Usage:
+    python scripts/bench_stream.py [--rounds N] [--entries 400 4000 40000]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from bench_index import synthetic_index
+
+SCRIPTS_DIR = Path(__file__).parent
+
+CHILD = """
+import hashlib, json, sys, time
+from pathlib import Path
+from fetch_dokploy_data import (
+    MatchIndex, RelevantEntries, find_match, get_local_slugs, scan_index,
+)
+from instrumentation import peak_rss
+
+
+def peak() -> int:
+    # ru_maxrss survives exec, so under a large parent it reports the
+    # parent's peak. Linux's VmHWM is this process's own.
+    try:
+        status = Path("/proc/self/status").read_text()
+    except OSError:
+        return peak_rss()
+    line = next(l for l in status.splitlines() if l.startswith("VmHWM:"))
+    return int(line.split()[1]) * 1024
+
+
+mode, path = sys.argv[1:]
+slugs = get_local_slugs()
+baseline = peak()
+start = time.perf_counter()
+if mode == "json":
+    lookup = MatchIndex(json.loads(Path(path).read_bytes()))
+else:
+    relevant = RelevantEntries(slugs)
+    scan_index(Path(path), relevant)
+    lookup = MatchIndex(relevant.entries())
+matches = [find_match(slug, lookup) for slug in slugs]
+elapsed = time.perf_counter() - start
+digest = hashlib.sha256(json.dumps(matches, sort_keys=True).encode()).hexdigest()
+print(json.dumps([elapsed, peak(), baseline, digest]))
+"""
+
+
+class Colors:
+    GREEN = "\033[92m"
+    BLUE = "\033[94m"
+    YELLOW = "\033[33m"
+    RED = "\033[91m"
+    GREY = "\033[90m"
+    ENDC = "\033[0m"
+
+
+def run_child(mode: str, path: Path, rounds: int) -> tuple[float, int, int, str]:
+    samples = []
+    for _ in range(rounds):
+        proc = subprocess.run(
+            [sys.executable, "-c", CHILD, mode, str(path)],
+            capture_output=True,
+            text=True,
+            cwd=SCRIPTS_DIR,
+            check=True,
+        )
+        samples.append(json.loads(proc.stdout))
+    digests = {s[3] for s in samples}
+    assert len(digests) == 1, f"{mode}: matches differ between rounds"
+    return (
+        statistics.median(s[0] for s in samples),
+        int(statistics.median(s[1] for s in samples)),
+        int(statistics.median(s[2] for s in samples)),
+        digests.pop(),
+    )
+
+
+def main(rounds: int, sizes: list[int]) -> None:
+    C = Colors
+    print(
+        f"{C.BLUE}Match all local templates{C.ENDC}"
+        f" {C.GREY}(median of {rounds} fresh interpreters;"
+        f" peak RSS, +growth over imports){C.ENDC}\n"
+    )
+    print(
+        f"{'Entries':>8}  {'meta.json':>10}  {'json':>10}  {'stream':>10}"
+        f"  {'json peak':>17}  {'stream peak':>17}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            meta = Path(tmp) / f"meta-{size}.json"
+            meta.write_text(json.dumps(synthetic_index(size)))
+
+            json_time, json_peak, json_base, json_digest = run_child(
+                "json", meta, rounds
+            )
+            stream_time, stream_peak, stream_base, stream_digest = run_child(
+                "stream", meta, rounds
+            )
+            if json_digest != stream_digest:
+                raise SystemExit(f"{size} entries: stream matches differ from json")
+
+            def mib(peak: int, base: int) -> str:
+                return f"{peak / 2**20:6.1f} MiB (+{(peak - base) / 2**20:5.1f})"
+
+            print(
+                f"{size:>8}  {meta.stat().st_size / 1024:>6.0f} KiB"
+                f"  {json_time * 1000:>7.1f} ms  {stream_time * 1000:>7.1f} ms"
+                f"  {mib(json_peak, json_base)}"
+                f"  {C.GREEN}{mib(stream_peak, stream_base)}{C.ENDC}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", "-n", type=int, default=5)
+    parser.add_argument(
+        "--entries", type=int, nargs="+", default=[400, 4000, 40000]
+    )
+    args = parser.parse_args()
+    main(max(1, args.rounds), args.entries)
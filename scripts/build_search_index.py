@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Build the Typesense seeding artifacts without building the Astro site.
+
+Walks src/content/templates/*/index.md once and writes the same documents
+the site serves at /api/search-index.json and /api/tags.json:
+
+  search-index.json  [{id, name, description, tags, url, logoUrl}, ...]
+  tags.json          sorted list of every tag used by a template
+
+Documents are streamed to a temporary file as each template is read (no
+full list is held in memory). An output is only replaced when its content
+changed, so mtimes stay stable for CI caches and for the delta sync.
+
+Usage:
+    python scripts/build_search_index.py [--out DIR] [--check]
+
+    --out    Output directory (default: scripts/search-index/).
+    --check  Exit 1 if an output is out of date instead of writing it.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import IO, Iterator
+
+from apply_dokploy_data import TEMPLATES_DIR, Colors, read_frontmatter
+
+OUTPUT_DIR = Path(__file__).parent / "search-index"
+SEARCH_INDEX_FILE = "search-index.json"
+TAGS_FILE = "tags.json"
+
+# Fields the templates content collection requires (src/content.config.ts).
+REQUIRED_FIELDS = ("name", "slug", "description", "tags")
+
+
+class HashingWriter:
+    """Text sink that writes to a file and hashes what it writes."""
+
+    def __init__(self, f: IO[bytes]) -> None:
+        self.f = f
+        self.sha256 = hashlib.sha256()
+
+    def write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.f.write(data)
+        self.sha256.update(data)
+
+
+def _to_json(value) -> str:
+    # Same bytes as JSON.stringify / Response.json on the site.
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def file_sha256(path: Path) -> str | None:
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def iter_documents(errors: list[str]) -> Iterator[dict]:
+    """Yield one search document per template, in slug order.
+
+    Templates with unreadable or incomplete frontmatter are skipped and
+    reported in `errors`.
+    """
+    for index_path in sorted(TEMPLATES_DIR.glob("*/index.md")):
+        try:
+            data, _ = read_frontmatter(index_path)
+        except (ValueError, OSError) as e:
+            errors.append(f"{index_path.parent.name}: {e}")
+            continue
+        missing = [field for field in REQUIRED_FIELDS if data.get(field) is None]
+        if missing:
+            errors.append(f"{index_path.parent.name}: missing {', '.join(missing)}")
+            continue
+        slug = data["slug"]
+        yield {
+            "id": slug,
+            "name": data["name"],
+            "description": data["description"],
+            "tags": list(data["tags"] or []),
+            "url": f"/api/templates/{slug}.json",
+            "logoUrl": data.get("logoUrl") or None,
+        }
+
+
+class Output:
+    """A temp file next to `path` that replaces it only if the content differs."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self.tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        self.writer = HashingWriter(self._file)
+
+    def commit(self, check: bool) -> bool:
+        """Close the temp file; returns True if `path` was (or would be) changed."""
+        self._file.close()
+        changed = self.writer.sha256.hexdigest() != file_sha256(self.path)
+        if changed and not check:
+            os.replace(self.tmp, self.path)
+        else:
+            os.unlink(self.tmp)
+        return changed
+
+    def discard(self) -> None:
+        self._file.close()
+        os.unlink(self.tmp)
+
+
+def build(
+    out_dir: Path, check: bool = False
+) -> tuple[dict[str, bool], int, list[str]]:
+    """Write search-index.json and tags.json into out_dir.
+
+    Returns ({filename: changed}, document count, errors).
+    """
+    errors: list[str] = []
+    tags: set[str] = set()
+    count = 0
+
+    index = Output(out_dir / SEARCH_INDEX_FILE)
+    try:
+        index.writer.write("[")
+        for doc in iter_documents(errors):
+            index.writer.write(("," if count else "") + _to_json(doc))
+            tags.update(doc["tags"])
+            count += 1
+        index.writer.write("]")
+    except BaseException:
+        index.discard()
+        raise
+
+    tags_out = Output(out_dir / TAGS_FILE)
+    tags_out.writer.write(_to_json(sorted(tags)))
+
+    changed = {
+        SEARCH_INDEX_FILE: index.commit(check),
+        TAGS_FILE: tags_out.commit(check),
+    }
+    return changed, count, errors
+
+
+def main(out_dir: Path, check: bool) -> None:
+    C = Colors
+    changed, count, errors = build(out_dir, check)
+
+    for message in errors:
+        print(f"  {C.RED}✗{C.ENDC}  {message}", file=sys.stderr)
+    for name, was_changed in changed.items():
+        path = out_dir / name
+        if not was_changed:
+            print(f"  {C.GREY}–  {path}  (unchanged){C.ENDC}")
+        elif check:
+            print(f"  {C.YELLOW}!{C.ENDC}  {path}  {C.YELLOW}out of date{C.ENDC}")
+        else:
+            print(f"  {C.GREEN}✓{C.ENDC}  {path}")
+    print(f"\n{count} templates indexed")
+
+    if errors or (check and any(changed.values())):
+        sys.exit(1)
+
+
+def cli(argv: list[str] | None = None, prog: str | None = None) -> None:
+    """Command-line entry point, also run as `zane-templates <command>`."""
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__)
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=OUTPUT_DIR,
+        help="Output directory (default: scripts/search-index/).",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit 1 if an output is out of date instead of writing it.",
+    )
+    args = parser.parse_args(argv)
+    main(args.out, args.check)
+
+
+if __name__ == "__main__":
+    cli()
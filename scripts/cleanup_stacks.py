@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Archive compose stacks left behind in a ZaneOps environment.
+
+Lists every stack in a project/environment, keeps those whose slug matches
+one of the --match globs and/or that are older than --older-than, and
+archives them concurrently. Archive requests that fail with a 5xx or a
+network error are retried with exponential backoff (like every idempotent
+call of deploy_compose.py); a stack that is already gone counts as archived.
+
+Usage:
+    python cleanup_stacks.py --match <glob> [--older-than <age>] --project <project_slug> --env <env_slug>
+    python cleanup_stacks.py --all --project <project_slug> --env <env_slug> [--concurrency N] [--dry-run]
+
+Example:
+    python cleanup_stacks.py --match "smoke-*" --dry-run
+    python cleanup_stacks.py --older-than 2d -p staging -e production -c 16
+    python cleanup_stacks.py --match "*-test" --match "n8n*" --older-than 6h --report json
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import os
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import instrumentation
+from deploy_compose import (
+    CONNECT_TIMEOUT,
+    ENV_DEFAULTS,
+    MAX_RETRIES,
+    READ_TIMEOUT,
+    SESSION_CACHE_FILE,
+    SessionCache,
+    archive_stack,
+    authenticate,
+    create_session,
+    list_stacks,
+    print_bulk_results,
+    run_bulk,
+)
+from instrumentation import span
+
+if TYPE_CHECKING:
+    import requests
+
+DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$")
+DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_duration(value: str) -> float:
+    """Parse an age such as 90, 30m, 6h, 2d or 1w into seconds."""
+    match = DURATION_RE.match(value)
+    if match is None:
+        raise argparse.ArgumentTypeError(
+            f"invalid age {value!r} (expected e.g. 30m, 6h, 2d or 1w)"
+        )
+    return float(match[1]) * DURATION_UNITS[match[2]]
+
+
+def format_age(seconds: float | None) -> str:
+    if seconds is None:
+        return "?"
+    for unit in ("w", "d", "h", "m"):
+        if seconds >= DURATION_UNITS[unit]:
+            return f"{int(seconds // DURATION_UNITS[unit])}{unit}"
+    return f"{int(seconds)}s"
+
+
+def stack_age(stack: dict, now: datetime) -> float | None:
+    """Seconds since the stack was created, or None if the API does not say."""
+    created_at = stack.get("created_at")
+    if not created_at:
+        return None
+    try:
+        created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return (now - created).total_seconds()
+
+
+def select_stacks(
+    stacks: list[dict], patterns: list[str], older_than: float | None
+) -> list[dict]:
+    """The stacks matching any of `patterns` (all if none) and older than
+    `older_than` seconds (any age if None), each with its "age" filled in."""
+    now = datetime.now(timezone.utc)
+    selected = []
+    for stack in stacks:
+        slug = stack.get("slug", "")
+        if patterns and not any(fnmatch.fnmatchcase(slug, p) for p in patterns):
+            continue
+        age = stack_age(stack, now)
+        if older_than is not None and (age is None or age < older_than):
+            continue
+        selected.append({**stack, "age": age})
+    return sorted(selected, key=lambda stack: stack["slug"])
+
+
+def archive_bulk(
+    session: requests.Session, args: argparse.Namespace, stacks: list[dict]
+) -> int:
+    """Archive stacks concurrently. Returns the number of failures."""
+    ages = {stack["slug"]: stack["age"] for stack in stacks}
+
+    def archive(slug: str, result: dict) -> None:
+        with span("archive", slug):
+            existed = archive_stack(
+                session, args.base_url, args.project, args.env, slug
+            )
+        action = "archived" if existed else "gone"
+        result.update(ok=True, action=action)
+        instrumentation.count(f"stacks.{action}")
+
+    def row(result: dict) -> tuple[str, str]:
+        age = format_age(ages[result["slug"]])
+        if not result["ok"]:
+            return age, f"✗ {result['error']}"
+        if result["action"] == "gone":
+            return age, "✓ already gone"
+        return age, "✓ archived"
+
+    print(f"Archiving {len(stacks)} stacks with concurrency {args.concurrency}...")
+    results, total = run_bulk(list(ages), str, archive, args.concurrency)
+    failures = print_bulk_results(results, ("Age", 5), row)
+
+    succeeded = len(results) - failures
+    print(
+        f"\n{succeeded}/{len(results)} stacks archived"
+        f" in {total:.2f}s ({len(results) / total:.2f} stacks/s)"
+    )
+    return failures
+
+
+def print_selection(stacks: list[dict]) -> None:
+    width = max([len("Stack"), *(len(stack["slug"]) for stack in stacks)])
+    print(f"\n{'Stack':<{width}}  {'Age':>5}  Created")
+    print(f"{'-' * width}  {'-' * 5}  {'-' * 25}")
+    for stack in stacks:
+        print(
+            f"{stack['slug']:<{width}}  {format_age(stack['age']):>5}"
+            f"  {stack.get('created_at') or '-'}"
+        )
+
+
+def cli(argv: list[str] | None = None, prog: str | None = None) -> None:
+    """Command-line entry point, also run as `zane-templates cleanup`."""
+    parser = argparse.ArgumentParser(
+        prog=prog, description="Archive compose stacks left behind in ZaneOps"
+    )
+    parser.add_argument(
+        "--match",
+        "-m",
+        metavar="GLOB",
+        action="append",
+        default=[],
+        help="Archive stacks whose slug matches this glob (repeatable)",
+    )
+    parser.add_argument(
+        "--older-than",
+        metavar="AGE",
+        type=parse_duration,
+        help="Archive stacks created more than AGE ago (e.g. 30m, 6h, 2d)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Archive every stack in the environment (no --match/--older-than)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        "-n",
+        action="store_true",
+        help="List the stacks that would be archived without archiving them",
+    )
+    parser.add_argument("--project", "-p", help="Project slug ($PROJECT_SLUG)")
+    parser.add_argument("--env", "-e", help="Environment slug ($ENV_SLUG)")
+    parser.add_argument(
+        "--base-url", "-u", help="ZaneOps API base URL ($BASE_URL)"
+    )
+    parser.add_argument("--username", help="Username for login ($USERNAME)")
+    parser.add_argument("--password", help="Password for login ($PASSWORD)")
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=8,
+        help="Number of stacks archived in parallel",
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=CONNECT_TIMEOUT,
+        help="Seconds to wait for a connection to the API",
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=READ_TIMEOUT,
+        help="Seconds to wait for an API response",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=MAX_RETRIES,
+        help="Retries for connection errors and 5xx responses",
+    )
+    parser.add_argument(
+        "--session-cache",
+        type=Path,
+        default=SESSION_CACHE_FILE,
+        help="File the authenticated session is cached in between runs",
+    )
+    parser.add_argument(
+        "--no-session-cache",
+        action="store_true",
+        help="Always log in and do not cache the session",
+    )
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Log every API call with its latency"
+    )
+    instrumentation.add_arguments(parser)
+
+    args = parser.parse_args(argv)
+    if args.all and (args.match or args.older_than is not None):
+        parser.error("--all cannot be used with --match or --older-than")
+    if not (args.all or args.match or args.older_than is not None):
+        parser.error("one of --match, --older-than or --all is required")
+    args.concurrency = max(1, args.concurrency)
+
+    import dotenv
+
+    dotenv.load_dotenv()
+    for option, variable, default in ENV_DEFAULTS:
+        if getattr(args, option) is None:
+            setattr(args, option, os.environ.get(variable, default))
+
+    with instrumentation.reporting(args, "cleanup_stacks"):
+        run(args)
+
+
+def run(args: argparse.Namespace) -> None:
+    """List, filter and archive the stacks the parsed command line asks for."""
+    import requests
+
+    session = create_session(
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        retries=args.retries,
+        pool_size=max(10, args.concurrency),
+        verbose=args.verbose,
+    )
+
+    try:
+        cache = None if args.no_session_cache else SessionCache(args.session_cache)
+        with span("auth"):
+            authenticate(session, args.base_url, args.username, args.password, cache)
+
+        with span("list"):
+            stacks = list_stacks(session, args.base_url, args.project, args.env)
+        selected = select_stacks(stacks, args.match, args.older_than)
+        instrumentation.count("stacks.listed", len(stacks))
+        instrumentation.count("stacks.selected", len(selected))
+        print(
+            f"{len(selected)} of {len(stacks)} stacks in"
+            f" {args.project}/{args.env} selected"
+        )
+        if not selected:
+            return
+        if args.dry_run:
+            print_selection(selected)
+            print(f"\nDry run: would archive {len(selected)} stacks")
+            return
+
+        failures = archive_bulk(session, args, selected)
+        sys.exit(1 if failures else 0)
+
+    except requests.HTTPError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        if e.response is not None:
+            print(f"Response: {e.response.text}", file=sys.stderr)
+        sys.exit(1)
+    except requests.RequestException as e:
+        print(f"Network error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
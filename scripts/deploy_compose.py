@@ -4,29 +4,218 @@ Deploy a compose stack to ZaneOps from a YAML file.
 
 Usage:
     python deploy_compose.py <compose_file> --project <project_slug> --env <env_slug> [--slug <stack_slug>] [--base-url <url>]
+    python deploy_compose.py --bulk <dir_or_glob> [--concurrency N] --project <project_slug> --env <env_slug>
 
 Example:
     python deploy_compose.py n8n.yml --project my-project --env production --slug n8n-stack
+    python deploy_compose.py --bulk "src/content/templates/*/compose.yml" --concurrency 8
+    python deploy_compose.py -f n8n.yml --wait --wait-timeout 300
+    python deploy_compose.py --bulk src/content/templates --report json --report-file deploy.json
+
+Every deployment is recorded in a local history file; see deploy_history.py.
 """
 
+from __future__ import annotations
+
 import argparse
+import glob
+import hashlib
+import json
+import os
+import stat
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, Callable, TypeVar, cast
 
-import requests
 import yaml
-import dotenv
 
-dotenv.load_dotenv()
-
-import os
-
-BASE_URL = os.environ.get("BASE_URL", "http://localhost:8000")
-PROJECT_SLUG = os.environ.get("PROJECT_SLUG", "compose")
-ENV_SLUG = os.environ.get("ENV_SLUG", "production")
-USERNAME = os.environ.get("USERNAME", "admin")
-PASSWORD = os.environ.get("PASSWORD", "password")
+import instrumentation
+from deploy_history import HISTORY_FILE, DeployHistory, spec_fingerprint
+from instrumentation import span
+from validate_templates import print_errors, validate_compose_files
+from render_compose import (
+    RenderContext,
+    TemplateError,
+    print_preview,
+    print_stack_snapshot,
+    render_compose,
+)
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# requests (and urllib3, dotenv) are imported when a deployment starts, not
+# at import time, so --help and --preview start without them.
+if TYPE_CHECKING:
+    import requests
+
+    from zane_session import ZaneSession
+
+T = TypeVar("T")
+
+# Defaults for options left unset, read from the environment / .env after
+# parsing: (option, variable, default).
+ENV_DEFAULTS = (
+    ("base_url", "BASE_URL", "http://localhost:8000"),
+    ("project", "PROJECT_SLUG", "compose"),
+    ("env", "ENV_SLUG", "production"),
+    ("username", "USERNAME", "admin"),
+    ("password", "PASSWORD", "password"),
+)
+
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 60.0
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled after each attempt
+RETRY_STATUSES = (500, 502, 503, 504)
+# Only these are retried after the request reached the server; connection
+# errors (request never sent) are retried for every method. DELETE (archive)
+# is safe to repeat: a stack that is already gone answers 404.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+
+# --wait polling: start fast, back off while nothing changes, reset on change.
+WAIT_TIMEOUT = 600.0
+POLL_MIN_INTERVAL = 0.5
+POLL_MAX_INTERVAL = 10.0
+POLL_BACKOFF = 1.5
+DEPLOYMENT_QUEUED_STATUSES = frozenset({"QUEUED"})
+DEPLOYMENT_SUCCESS_STATUSES = frozenset({"FINISHED", "HEALTHY"})
+DEPLOYMENT_FAILURE_STATUSES = frozenset(
+    {"FAILED", "UNHEALTHY", "CANCELLED", "REMOVED"}
+)
+SERVICE_HEALTHY_STATUSES = frozenset({"HEALTHY", "RUNNING", "SLEEPING"})
+
+# Authenticated cookie jars are reused across invocations until they expire.
+SESSION_CACHE_FILE = Path(
+    os.environ.get(
+        "ZANE_SESSION_CACHE",
+        Path.home() / ".cache" / "zane-templates" / "sessions.json",
+    )
+)
+SESSION_MAX_AGE = 12 * 3600.0  # when the server sends no cookie expiry
+SESSION_EXPIRY_MARGIN = 60.0  # treat sessions about to expire as expired
+
+
+def create_session(
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_timeout: float = READ_TIMEOUT,
+    retries: int = MAX_RETRIES,
+    pool_size: int = 10,
+    verbose: bool = False,
+) -> ZaneSession:
+    """Return a keep-alive session with timeouts and exponential-backoff retries."""
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    from zane_session import ZaneSession
+
+    session = ZaneSession(timeout=(connect_timeout, read_timeout), verbose=verbose)
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=IDEMPOTENT_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    instrumentation.instrument_session(session)
+    return session
+
+
+class SessionCache:
+    """Authenticated cookie jars, keyed by API base URL and username.
+
+    The cache file holds live session cookies, so it is created with 0600
+    permissions inside a 0700 directory and ignored if anyone else can read it.
+    """
+
+    def __init__(self, path: Path = SESSION_CACHE_FILE) -> None:
+        self.path = path
+
+    @staticmethod
+    def _key(base_url: str, username: str) -> str:
+        return f"{username}@{base_url.rstrip('/')}"
+
+    def _read(self) -> dict:
+        try:
+            mode = self.path.stat().st_mode
+        except FileNotFoundError:
+            return {}
+        if mode & (stat.S_IRWXG | stat.S_IRWXO):
+            print(
+                f"Warning: ignoring {self.path}, it is readable by other users",
+                file=sys.stderr,
+            )
+            return {}
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: dict) -> None:
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")  # 0600
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load(self, session: requests.Session, base_url: str, username: str) -> bool:
+        """Restore a cached, unexpired login into `session`. Returns True on a hit."""
+        entry = self._read().get(self._key(base_url, username))
+        if not entry:
+            return False
+        if entry.get("expires_at", 0) - SESSION_EXPIRY_MARGIN <= time.time():
+            return False
+        for cookie in entry.get("cookies", []):
+            session.cookies.set(**cookie)
+        return session.cookies.get("csrftoken") is not None
+
+    def store(self, session: requests.Session, base_url: str, username: str) -> None:
+        """Save the cookies of a freshly logged-in `session`."""
+        now = time.time()
+        cookies = []
+        expires_at = now + SESSION_MAX_AGE
+        for cookie in session.cookies:
+            cookies.append(
+                {
+                    "name": cookie.name,
+                    "value": cookie.value,
+                    "domain": cookie.domain,
+                    "path": cookie.path,
+                    "expires": cookie.expires,
+                    "secure": cookie.secure,
+                }
+            )
+            if cookie.expires is not None:
+                expires_at = min(expires_at, cookie.expires)
+
+        entries = {
+            key: entry
+            for key, entry in self._read().items()
+            if entry.get("expires_at", 0) > now
+        }
+        entries[self._key(base_url, username)] = {
+            "cookies": cookies,
+            "saved_at": now,
+            "expires_at": expires_at,
+        }
+        self._write(entries)
 
 
 def get_csrf_token(session: requests.Session, base_url: str) -> str:
@@ -50,6 +239,32 @@ def login(
     print(f"Logged in as {username}")
 
 
+def authenticate(
+    session: ZaneSession,
+    base_url: str,
+    username: str,
+    password: str,
+    cache: SessionCache | None = None,
+) -> None:
+    """Reuse a cached login if there is one, otherwise log in (and cache it).
+
+    Also installs the login as the session's re-authentication hook, so an
+    expired or revoked cached session is refreshed on the first 401/403.
+    """
+
+    def relogin() -> None:
+        session.cookies.clear()
+        login(session, base_url, username, password)
+        if cache is not None:
+            cache.store(session, base_url, username)
+
+    session.reauthenticate = relogin
+    if cache is not None and cache.load(session, base_url, username):
+        print(f"Reusing cached session for {username}")
+        return
+    relogin()
+
+
 def get_stack(
     session: requests.Session,
     base_url: str,
@@ -67,6 +282,26 @@ def get_stack(
     return resp.json()
 
 
+def list_stacks(
+    session: requests.Session,
+    base_url: str,
+    project_slug: str,
+    env_slug: str,
+) -> list[dict]:
+    """List every compose stack in an environment, following pagination."""
+    stacks: list[dict] = []
+    url: str | None = f"{base_url}/api/compose/stacks/{project_slug}/{env_slug}/"
+    while url is not None:
+        resp = session.get(url)
+        resp.raise_for_status()
+        page = resp.json()
+        if isinstance(page, list):  # unpaginated
+            return stacks + page
+        stacks.extend(page.get("results", []))
+        url = page.get("next")
+    return stacks
+
+
 def create_stack(
     session: requests.Session,
     base_url: str,
@@ -132,130 +367,636 @@ def deploy_stack(
     return resp.json()
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Deploy a compose stack to ZaneOps")
-    parser.add_argument(
-        "--file", "-f", type=Path, required=True, help="Path to the compose YAML file"
+def archive_stack(
+    session: requests.Session,
+    base_url: str,
+    project_slug: str,
+    env_slug: str,
+    stack_slug: str,
+) -> bool:
+    """Archive a compose stack: its services are removed, its config kept.
+
+    Returns False if the stack does not exist (e.g. already archived).
+    """
+    csrf_token = session.cookies.get("csrftoken")
+    resp = session.delete(
+        f"{base_url}/api/compose/stacks/{project_slug}/{env_slug}/{stack_slug}/archive/",
+        headers={"X-CSRFToken": csrf_token},
+    )
+    if resp.status_code == 404:
+        return False
+    resp.raise_for_status()
+    return True
+
+
+def get_deployment(
+    session: requests.Session,
+    base_url: str,
+    project_slug: str,
+    env_slug: str,
+    stack_slug: str,
+    deployment_hash: str,
+) -> dict:
+    """Get the current state of a stack deployment."""
+    resp = session.get(
+        f"{base_url}/api/compose/stacks/{project_slug}/{env_slug}/{stack_slug}/deployments/{deployment_hash}/",
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _service_statuses(deployment: dict) -> dict[str, str]:
+    """Extract {service: status} from a deployment payload, if it has any."""
+    raw = deployment.get("service_statuses") or deployment.get("services") or {}
+    if isinstance(raw, list):
+        raw = {item.get("name", str(i)): item for i, item in enumerate(raw)}
+    statuses: dict[str, str] = {}
+    for name, info in raw.items():
+        status = info.get("status") if isinstance(info, dict) else info
+        if isinstance(status, str):
+            statuses[name] = status.upper()
+    return statuses
+
+
+def wait_for_deployment(
+    session: requests.Session,
+    base_url: str,
+    project_slug: str,
+    env_slug: str,
+    stack_slug: str,
+    deployment_hash: str,
+    timeout: float = WAIT_TIMEOUT,
+    log: Callable[[str], None] = print,
+) -> dict:
+    """Poll a deployment until it succeeds, fails or `timeout` expires.
+
+    Returns a report with the final status, whether it succeeded, and the
+    client-observed timings (seconds since polling started): time spent
+    queued, time spent deploying, total, and time-to-healthy per service.
+    """
+    start = time.monotonic()
+    delay = POLL_MIN_INTERVAL
+    last_status: str | None = None
+    last_services: dict[str, str] = {}
+    left_queue_at: float | None = None
+    healthy_at: dict[str, float] = {}
+
+    while True:
+        deployment = get_deployment(
+            session, base_url, project_slug, env_slug, stack_slug, deployment_hash
+        )
+        now = time.monotonic() - start
+        status = str(deployment.get("status", "")).upper()
+        services = _service_statuses(deployment)
+
+        if status not in DEPLOYMENT_QUEUED_STATUSES and left_queue_at is None:
+            left_queue_at = now
+        for name, service_status in services.items():
+            if service_status in SERVICE_HEALTHY_STATUSES:
+                healthy_at.setdefault(name, now)
+
+        if status != last_status or services != last_services:
+            log(f"  [{now:6.1f}s] {status}")
+            for name in sorted(services):
+                if services[name] != last_services.get(name):
+                    log(f"  [{now:6.1f}s]   {name}: {services[name]}")
+            last_status, last_services = status, services
+            delay = POLL_MIN_INTERVAL
+
+        done = status in DEPLOYMENT_SUCCESS_STATUSES | DEPLOYMENT_FAILURE_STATUSES
+        remaining = timeout - now
+        timed_out = not done and remaining <= 0
+        if done or timed_out:
+            queued = left_queue_at if left_queue_at is not None else now
+            return {
+                "status": "TIMEOUT" if timed_out else status,
+                "ok": status in DEPLOYMENT_SUCCESS_STATUSES,
+                "queue_time": queued,
+                "deploy_time": now - queued,
+                "total_time": now,
+                "time_to_healthy": healthy_at,
+            }
+
+        time.sleep(min(delay, remaining))
+        delay = min(delay * POLL_BACKOFF, POLL_MAX_INTERVAL)
+
+
+def print_wait_report(report: dict) -> None:
+    """Print the timings collected by wait_for_deployment."""
+    print("\n--- Deployment Timings ---")
+    print(f"  Status:       {report['status']}")
+    print(f"  Queued:       {report['queue_time']:.1f}s")
+    print(f"  Deploying:    {report['deploy_time']:.1f}s")
+    print(f"  Total:        {report['total_time']:.1f}s")
+    for name, seconds in sorted(report["time_to_healthy"].items()):
+        print(f"  {name + ':':<13} healthy after {seconds:.1f}s")
+
+
+def compose_fingerprint(content: str) -> str:
+    """Hash compose content so formatting, comments and key order don't matter.
+
+    Falls back to hashing the whitespace-trimmed text if it isn't valid YAML.
+    """
+    try:
+        with span("yaml.parse"):
+            spec = yaml.load(content, Loader=SafeLoader)
+    except yaml.YAMLError:
+        canonical = "\n".join(line.rstrip() for line in content.strip().splitlines())
+        return hashlib.sha256(canonical.encode()).hexdigest()
+    return spec_fingerprint(spec)
+
+
+def stack_is_up_to_date(stack: dict, user_content: str) -> bool:
+    """True if the stack's stored compose content matches user_content, no
+    other change is pending on it and its latest deployment did not fail.
+
+    A stack that reports no latest deployment (created, never deployed) is
+    not up to date either.
+    """
+    stored = stack.get("user_content")
+    if not isinstance(stored, str) or stack.get("unapplied_changes"):
+        return False
+    if "latest_deployment" in stack:
+        latest = stack["latest_deployment"] or {}
+        status = str(latest.get("status", "")).upper()
+        if not latest or status in DEPLOYMENT_FAILURE_STATUSES:
+            return False
+    return compose_fingerprint(stored) == compose_fingerprint(user_content)
+
+
+def deploy_one(
+    session: requests.Session,
+    base_url: str,
+    project_slug: str,
+    env_slug: str,
+    slug: str,
+    user_content: str,
+    commit_message: str,
+    log: Callable[[str], None] = print,
+    force: bool = False,
+) -> tuple[dict | None, str]:
+    """Create or update a stack, then deploy it.
+
+    Returns (deployment, action) where action is "created", "updated" or
+    "unchanged". An existing stack whose compose content is identical and
+    whose latest deployment did not fail is not updated nor redeployed
+    (deployment is None) unless `force` is set.
+    """
+    # Check if stack exists
+    existing_stack = get_stack(session, base_url, project_slug, env_slug, slug)
+
+    up_to_date = existing_stack and stack_is_up_to_date(existing_stack, user_content)
+    if up_to_date and not force:
+        log(f"Stack '{slug}' is up to date, skipping update and deployment.")
+        return None, "unchanged"
+
+    if existing_stack:
+        log(f"Stack '{slug}' already exists, updating...")
+        update_stack(session, base_url, project_slug, env_slug, slug, user_content)
+        stack_slug = existing_stack["slug"]
+        stack_id = existing_stack["id"]
+        action = "updated"
+        log(f"Stack updated: {stack_slug} (id: {stack_id})")
+    else:
+        log(f"Creating stack in {project_slug}/{env_slug}...")
+        stack = create_stack(
+            session, base_url, project_slug, env_slug, user_content, slug
+        )
+        stack_slug = stack["slug"]
+        stack_id = stack["id"]
+        action = "created"
+        log(f"Stack created: {stack_slug} (id: {stack_id})")
+
+    # Deploy
+    log("Deploying stack...")
+    deployment = deploy_stack(
+        session, base_url, project_slug, env_slug, stack_slug, commit_message
+    )
+    return deployment, action
+
+
+def print_deployment(deployment: dict) -> None:
+    """Print the deployment status and the resources it created."""
+    print(f"Deployment queued: {deployment['hash']}")
+    print(f"Status: {deployment['status']}")
+
+    print_stack_snapshot(deployment.get("stack_snapshot", {}))
+
+
+def collect_compose_files(target: str) -> list[Path]:
+    """Resolve a directory or glob pattern to a sorted list of compose files.
+
+    A directory is searched for */compose.yml (the templates layout), falling
+    back to the *.yml / *.yaml files directly inside it.
+    """
+    path = Path(target)
+    if path.is_dir():
+        files = sorted(path.glob("*/compose.yml"))
+        if not files:
+            files = sorted([*path.glob("*.yml"), *path.glob("*.yaml")])
+        return files
+    return sorted(Path(p) for p in glob.glob(target, recursive=True))
+
+
+def stack_slug_for(file: Path) -> str:
+    """Stack slug for a compose file: the template directory for compose.yml."""
+    if file.stem in ("compose", "docker-compose"):
+        return file.parent.name
+    return file.stem
+
+
+def run_bulk(
+    items: list[T],
+    slug_for: Callable[[T], str],
+    work: Callable[[T, dict], None],
+    concurrency: int,
+) -> tuple[dict[str, dict], float]:
+    """Run `work(item, result)` for every item on a bounded thread pool.
+
+    `work` fills in the item's result dict, at least `ok`. A requests or OS
+    error it raises marks the result failed, with the error. A progress line
+    is printed as each item finishes. Returns ({slug: result}, seconds).
+    """
+    import requests
+
+    def run(item: T) -> dict:
+        start = time.perf_counter()
+        result: dict = {"slug": slug_for(item)}
+        try:
+            work(item, result)
+        except requests.HTTPError as e:
+            detail = e.response.text[:200] if e.response is not None else ""
+            result.update(ok=False, error=f"{e} {detail}".strip())
+        except (requests.RequestException, OSError) as e:
+            result.update(ok=False, error=str(e))
+        result["elapsed"] = time.perf_counter() - start
+        return result
+
+    results: dict[str, dict] = {}
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(run, item) for item in items]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result["slug"]] = result
+            mark = "✓" if result["ok"] else "✗"
+            print(f"  {mark} {result['slug']} ({result['elapsed']:.2f}s)")
+    return results, time.perf_counter() - started
+
+
+def print_bulk_results(
+    results: dict[str, dict],
+    column: tuple[str, int],
+    row: Callable[[dict], tuple[str, str]],
+) -> int:
+    """Print a bulk run's table, one stack per line: slug, `column` (name,
+    width), time and outcome. `row(result)` returns the column's value and
+    the outcome. Returns the number of failed results."""
+    name, column_width = column
+    width = max([len("Stack"), *(len(slug) for slug in results)])
+    print(f"\n{'Stack':<{width}}  {name:<{column_width}}  {'Time':>7}  Result")
+    print(f"{'-' * width}  {'-' * column_width}  {'-' * 7}  {'-' * 30}")
+    failures = 0
+    for slug in sorted(results):
+        result = results[slug]
+        value, outcome = row(result)
+        if not result["ok"]:
+            failures += 1
+        print(
+            f"{slug:<{width}}  {value:<{column_width}}"
+            f"  {result['elapsed']:>6.2f}s  {outcome}"
+        )
+    return failures
+
+
+def deploy_bulk(
+    session: requests.Session,
+    args: argparse.Namespace,
+    files: list[Path],
+    history: DeployHistory | None = None,
+) -> int:
+    """Deploy many compose files concurrently. Returns the number of failures.
+
+    Each deployment is recorded in `history`, if given.
+    """
+
+    def deploy(file: Path, result: dict) -> None:
+        slug = result["slug"]
+        result["file"] = str(file)
+        start = time.perf_counter()
+        user_content = file.read_text()
+        with span("stack", slug):
+            deployment, action = deploy_one(
+                session,
+                args.base_url,
+                args.project,
+                args.env,
+                slug,
+                user_content,
+                args.message,
+                log=lambda _: None,
+                force=args.force,
+            )
+        request_time = time.perf_counter() - start
+        result.update(ok=True, action=action, deployment=deployment)
+        instrumentation.count(f"stacks.{action}")
+        if args.wait and deployment is not None:
+            with span("wait", slug):
+                report = wait_for_deployment(
+                    session,
+                    args.base_url,
+                    args.project,
+                    args.env,
+                    slug,
+                    deployment["hash"],
+                    timeout=args.wait_timeout,
+                    log=lambda _: None,
+                )
+            result.update(ok=report["ok"], wait=report)
+        if history is not None and deployment is not None:
+            history.record(
+                slug,
+                action,
+                deployment,
+                compose_fingerprint(user_content),
+                request_time,
+                result.get("wait"),
+            )
+
+    def row(result: dict) -> tuple[str, str]:
+        action = result.get("action", "-")
+        if "wait" in result:
+            report = result["wait"]
+            mark = "✓" if result["ok"] else "✗"
+            return action, (
+                f"{mark} {result['deployment']['hash']} ({report['status']},"
+                f" queued {report['queue_time']:.1f}s,"
+                f" deploying {report['deploy_time']:.1f}s)"
+            )
+        if result["ok"] and result["deployment"] is None:
+            return action, "✓ up to date"
+        if result["ok"]:
+            deployment = result["deployment"]
+            return action, f"✓ {deployment['hash']} ({deployment['status']})"
+        return action, f"✗ {result['error']}"
+
+    print(f"Deploying {len(files)} stacks with concurrency {args.concurrency}...")
+    results, total = run_bulk(files, stack_slug_for, deploy, args.concurrency)
+    failures = print_bulk_results(results, ("Action", 8), row)
+
+    succeeded = len(results) - failures
+    unchanged = sum(1 for r in results.values() if r.get("action") == "unchanged")
+    print(
+        f"\n{succeeded}/{len(results)} stacks succeeded ({unchanged} up to date)"
+        f" in {total:.2f}s ({len(results) / total:.2f} stacks/s)"
     )
-    parser.add_argument("--project", "-p", default=PROJECT_SLUG, help="Project slug")
-    parser.add_argument("--env", "-e", default=ENV_SLUG, help="Environment slug")
+    return failures
+
+
+def cli(argv: list[str] | None = None, prog: str | None = None) -> None:
+    """Command-line entry point, also run as `zane-templates deploy`."""
+    parser = argparse.ArgumentParser(
+        prog=prog, description="Deploy a compose stack to ZaneOps"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--file", "-f", type=Path, help="Path to the compose YAML file"
+    )
+    source.add_argument(
+        "--bulk",
+        metavar="DIR_OR_GLOB",
+        help=(
+            "Deploy every compose file in a directory"
+            " (e.g. src/content/templates) or matching a glob"
+        ),
+    )
+    parser.add_argument("--project", "-p", help="Project slug ($PROJECT_SLUG)")
+    parser.add_argument("--env", "-e", help="Environment slug ($ENV_SLUG)")
     parser.add_argument(
         "--slug", "-s", help="Stack slug (auto-generated if not provided)"
     )
     parser.add_argument(
-        "--base-url", "-u", default=BASE_URL, help="ZaneOps API base URL"
+        "--base-url", "-u", help="ZaneOps API base URL ($BASE_URL)"
     )
-    parser.add_argument("--username", default=USERNAME, help="Username for login")
-    parser.add_argument("--password", default=PASSWORD, help="Password for login")
+    parser.add_argument("--username", help="Username for login ($USERNAME)")
+    parser.add_argument("--password", help="Password for login ($PASSWORD)")
     parser.add_argument(
         "--message", "-m", default="Deploy from CLI", help="Deployment commit message"
     )
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=4,
+        help="Number of stacks deployed in parallel with --bulk",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Update and redeploy even if the stack's compose content is unchanged",
+    )
+    parser.add_argument(
+        "--preview",
+        action="store_true",
+        help=(
+            "Render x-zane-env expressions and ${VAR}s locally and print the"
+            " resulting URLs, configs and volumes without deploying"
+        ),
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Deploy even if the compose file fails validate_templates.py checks",
+    )
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="Wait for the deployment to finish and report its timings",
+    )
+    parser.add_argument(
+        "--wait-timeout",
+        type=float,
+        default=WAIT_TIMEOUT,
+        help="Seconds to wait for the deployment with --wait",
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=CONNECT_TIMEOUT,
+        help="Seconds to wait for a connection to the API",
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=READ_TIMEOUT,
+        help="Seconds to wait for an API response",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=MAX_RETRIES,
+        help="Retries for connection errors and 5xx responses on idempotent calls",
+    )
+    parser.add_argument(
+        "--session-cache",
+        type=Path,
+        default=SESSION_CACHE_FILE,
+        help="File the authenticated session is cached in between runs",
+    )
+    parser.add_argument(
+        "--no-session-cache",
+        action="store_true",
+        help="Always log in and do not cache the session",
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=HISTORY_FILE,
+        help="File each deployment is recorded in ($ZANE_DEPLOY_HISTORY)",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record deployments in the history file",
+    )
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Log every API call with its latency"
+    )
+    instrumentation.add_arguments(parser)
+
+    args = parser.parse_args(argv)
+    args.concurrency = max(1, args.concurrency)
+
+    import dotenv
+
+    dotenv.load_dotenv()
+    for option, variable, default in ENV_DEFAULTS:
+        if getattr(args, option) is None:
+            setattr(args, option, os.environ.get(variable, default))
+
+    with instrumentation.reporting(args, "deploy_compose"):
+        run(parser, args)
+
+
+def run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Deploy (or preview) what the parsed command line asks for."""
+    if args.bulk is not None:
+        if args.slug:
+            parser.error("--slug cannot be used with --bulk")
+        if args.preview:
+            parser.error("--preview cannot be used with --bulk")
+        files = collect_compose_files(args.bulk)
+        if not files:
+            print(f"Error: No compose files found for {args.bulk}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        file = cast(Path, args.file)
+        if not file.exists():
+            print(f"Error: File not found: {args.file}", file=sys.stderr)
+            sys.exit(1)
+
+        user_content = file.read_text()
+        slug = args.slug or file.with_suffix("").name
+        print(f"{slug=}")
+
+        if args.preview:
+            ctx = RenderContext(args.project, args.env, slug)
+            try:
+                snapshot = render_compose(user_content, ctx)
+            except (TemplateError, yaml.YAMLError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            print_preview(slug, snapshot)
+            return
+
+    if not args.no_validate:
+        targets = files if args.bulk is not None else [file]
+        with span("validate"):
+            errors = validate_compose_files(targets, args.concurrency)
+        if print_errors(errors):
+            print(
+                "Error: refusing to deploy invalid compose files"
+                " (pass --no-validate to deploy anyway)",
+                file=sys.stderr,
+            )
+            sys.exit(1)
 
-    args = parser.parse_args()
-
-    file = cast(Path, args.file)
-    if not file.exists():
-        print(f"Error: File not found: {args.file}", file=sys.stderr)
-        sys.exit(1)
-
-    user_content = file.read_text()
-    slug = args.slug or file.with_suffix("").name
-    print(f"{slug=}")
+    import requests
 
-    session = requests.Session()
+    session = create_session(
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        retries=args.retries,
+        pool_size=max(10, args.concurrency),
+        verbose=args.verbose,
+    )
 
     try:
-        login(session, args.base_url, args.username, args.password)
+        cache = None if args.no_session_cache else SessionCache(args.session_cache)
+        with span("auth"):
+            authenticate(session, args.base_url, args.username, args.password, cache)
+        history = None
+        if not args.no_history:
+            history = DeployHistory(
+                args.history, args.base_url, args.project, args.env
+            )
 
-        # Check if stack exists
-        existing_stack = get_stack(session, args.base_url, args.project, args.env, slug)
+        if args.bulk is not None:
+            failures = deploy_bulk(session, args, files, history)
+            sys.exit(1 if failures else 0)
 
-        if existing_stack:
-            print(f"Stack '{slug}' already exists, updating...")
-            update_stack(
+        start = time.perf_counter()
+        with span("stack", slug):
+            deployment, action = deploy_one(
                 session,
                 args.base_url,
                 args.project,
                 args.env,
                 slug,
                 user_content,
+                args.message,
+                force=args.force,
             )
-            stack_slug = existing_stack["slug"]
-            stack_id = existing_stack["id"]
-            print(f"Stack updated: {stack_slug} (id: {stack_id})")
-        else:
-            print(f"Creating stack in {args.project}/{args.env}...")
-            stack = create_stack(
-                session,
-                args.base_url,
-                args.project,
-                args.env,
-                user_content,
+        if deployment is None:
+            return
+        request_time = time.perf_counter() - start
+        print_deployment(deployment)
+
+        report = None
+        if args.wait:
+            print(f"\nWaiting for deployment {deployment['hash']}...")
+            with span("wait", slug):
+                report = wait_for_deployment(
+                    session,
+                    args.base_url,
+                    args.project,
+                    args.env,
+                    slug,
+                    deployment["hash"],
+                    timeout=args.wait_timeout,
+                )
+            print_wait_report(report)
+        if history is not None:
+            history.record(
                 slug,
+                action,
+                deployment,
+                compose_fingerprint(user_content),
+                request_time,
+                report,
             )
-            stack_slug = stack["slug"]
-            stack_id = stack["id"]
-            print(f"Stack created: {stack_slug} (id: {stack_id})")
-
-        # Deploy
-        print("Deploying stack...")
-        deployment = deploy_stack(
-            session,
-            args.base_url,
-            args.project,
-            args.env,
-            stack_slug,
-            args.message,
-        )
-        print(f"Deployment queued: {deployment['hash']}")
-        print(f"Status: {deployment['status']}")
-
-        # Print created resources
-        snapshot = deployment.get("stack_snapshot", {})
-
-        urls = snapshot.get("urls", {})
-        if urls:
-            print("\n--- URLs ---")
-            for service_name, routes in urls.items():
-                for route in routes:
-                    domain = route.get("domain", "")
-                    base_path = route.get("base_path", "/")
-                    port = route.get("port", "")
-                    print(
-                        f"  {service_name}: http://{domain}{base_path} -> port {port}"
-                    )
-
-        configs = snapshot.get("configs", {})
-        if configs:
-            print("\n--- Configs ---")
-            for config_name in configs.keys():
-                print(f"  {config_name}")
-
-        # Extract volumes from computed_content if available
-        computed_content = snapshot.get("computed_content")
-        if computed_content:
-            try:
-                computed_spec = yaml.safe_load(computed_content)
-                volumes = computed_spec.get("volumes", {})
-                if volumes:
-                    print("\n--- Volumes ---")
-                    for volume_name in volumes.keys():
-                        print(f"  {volume_name}")
-            except yaml.YAMLError:
-                pass
-
-        env_overrides = snapshot.get("env_overrides", [])
-        if env_overrides:
-            print("\n--- Environment Overrides ---")
-            for override in env_overrides:
-                print(f"    {override['key']}={override['value']}")
+        if report is not None and not report["ok"]:
+            sys.exit(1)
 
     except requests.HTTPError as e:
         print(f"Error: {e}", file=sys.stderr)
         if e.response is not None:
             print(f"Response: {e.response.text}", file=sys.stderr)
         sys.exit(1)
+    except requests.RequestException as e:
+        print(f"Network error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    cli()
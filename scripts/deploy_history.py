@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Local history of the deployments made by deploy_compose.py.
+
+Every deployment deploy_compose.py triggers is appended to a JSONL file
+(one record per line). A record holds the stack, the deployment hash and
+status, the client-side timings, and a summary of the server's stack
+snapshot: services, URLs, configs, volumes, env override keys, sizes and
+the hash of the computed compose file. Env override values are stored as
+hashes only.
+
+Usage:
+    python deploy_history.py list [<stack_slug> ...] [--limit N] [--json]
+    python deploy_history.py compare <stack_slug> [<run_a> [<run_b>]]
+
+A run is a deployment hash (or a prefix of one) or an index among the
+stack's runs, oldest first: -1 is the latest, -2 the one before it. With a
+single run, compare compares it against the latest.
+
+Example:
+    python deploy_history.py list n8n --limit 10
+    python deploy_history.py compare n8n                # the last two runs
+    python deploy_history.py compare n8n dpl_cmp_0003 -1
+    python deploy_history.py list --json | jq '.snapshot.computed_bytes'
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import secrets
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+HISTORY_FILE = Path(
+    os.environ.get(
+        "ZANE_DEPLOY_HISTORY",
+        Path.home() / ".cache" / "zane-templates" / "deploy-history.jsonl",
+    )
+)
+RECORD_VERSION = 1
+SHORT_HASH = 12  # hex digits shown (and kept for env override values)
+
+
+# ── Records ─────────────────────────────────────────────────────
+
+
+def spec_fingerprint(spec: object) -> str:
+    """Hash a parsed compose spec independently of key order and formatting."""
+    canonical = json.dumps(spec, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _short_hash(value: object) -> str:
+    return hashlib.sha256(str(value).encode()).hexdigest()[:SHORT_HASH]
+
+
+def summarize_snapshot(snapshot: dict) -> dict:
+    """What a record keeps of a stack snapshot, parsing computed_content once."""
+    computed = snapshot.get("computed_content") or ""
+    try:
+        spec = yaml.load(computed, Loader=SafeLoader) if computed else None
+    except yaml.YAMLError:
+        spec = None
+    if not isinstance(spec, dict):
+        spec = {}
+    services = spec.get("services")
+    volumes = spec.get("volumes")
+
+    urls = {
+        service: sorted(
+            f"{route.get('domain', '')}{route.get('base_path', '/')}"
+            f" -> {route.get('port', '')}"
+            for route in routes
+        )
+        for service, routes in (snapshot.get("urls") or {}).items()
+    }
+    return {
+        "computed_hash": spec_fingerprint(spec) if spec else _short_hash(computed),
+        "computed_bytes": len(computed.encode()),
+        "snapshot_bytes": len(json.dumps(snapshot, default=str).encode()),
+        "services": sorted(services) if isinstance(services, dict) else [],
+        "urls": urls,
+        "configs": sorted(snapshot.get("configs") or {}),
+        "volumes": sorted(volumes) if isinstance(volumes, dict) else [],
+        "env_overrides": {
+            override["key"]: _short_hash(override.get("value"))
+            for override in snapshot.get("env_overrides") or []
+            if "key" in override
+        },
+    }
+
+
+class DeployHistory:
+    """Append-only JSONL store of deployment records.
+
+    One instance per deploy_compose.py run: its records share a run id, the
+    API base URL, project and env. `record` may be called from several
+    threads; each record is written as one line with a single write.
+    """
+
+    def __init__(
+        self,
+        path: Path = HISTORY_FILE,
+        base_url: str = "",
+        project: str = "",
+        env: str = "",
+    ) -> None:
+        self.path = path
+        self.run = {
+            "run_id": secrets.token_hex(6),
+            "base_url": base_url,
+            "project": project,
+            "env": env,
+        }
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        slug: str,
+        action: str,
+        deployment: dict,
+        content_hash: str,
+        request_time: float,
+        wait_report: dict | None = None,
+    ) -> dict:
+        """Append the record of one deployment and return it."""
+        snapshot = deployment.get("stack_snapshot")
+        timings: dict = {"request": round(request_time, 3)}
+        if wait_report is not None:
+            timings.update(
+                queue=round(wait_report["queue_time"], 3),
+                deploy=round(wait_report["deploy_time"], 3),
+                total=round(wait_report["total_time"], 3),
+                time_to_healthy={
+                    name: round(seconds, 3)
+                    for name, seconds in wait_report["time_to_healthy"].items()
+                },
+            )
+        record = {
+            "version": RECORD_VERSION,
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            **self.run,
+            "slug": slug,
+            "action": action,
+            "deployment": deployment.get("hash"),
+            "status": (wait_report or deployment).get("status"),
+            "ok": wait_report["ok"] if wait_report is not None else None,
+            "content_hash": content_hash,
+            "timings": timings,
+            "snapshot": summarize_snapshot(snapshot) if snapshot else None,
+        }
+        line = json.dumps(record, sort_keys=True) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a") as fh:
+                fh.write(line)
+        return record
+
+
+def read_records(path: Path = HISTORY_FILE) -> Iterator[dict]:
+    """Yield the records in `path`, oldest first, skipping unreadable lines
+    (e.g. a line cut short by an interrupted run)."""
+    try:
+        fh = path.open()
+    except FileNotFoundError:
+        return
+    with fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and record.get("slug"):
+                yield record
+
+
+def filter_records(
+    records: Iterable[dict],
+    slugs: list[str] | None = None,
+    project: str | None = None,
+    env: str | None = None,
+) -> list[dict]:
+    return [
+        record
+        for record in records
+        if (not slugs or record["slug"] in slugs)
+        and (project is None or record.get("project") == project)
+        and (env is None or record.get("env") == env)
+    ]
+
+
+def find_run(records: list[dict], ref: str) -> dict:
+    """A stack's run by index (-1 = latest) or deployment hash (prefix)."""
+    try:
+        index = int(ref)
+    except ValueError:
+        matches = [r for r in records if (r.get("deployment") or "").startswith(ref)]
+        if len(matches) != 1:
+            found = "no run" if not matches else f"{len(matches)} runs"
+            raise LookupError(f"{found} matching {ref!r}")
+        return matches[0]
+    try:
+        return records[index]
+    except IndexError:
+        raise LookupError(f"no run {index} ({len(records)} recorded)") from None
+
+
+# ── Comparing ───────────────────────────────────────────────────
+
+
+def _set_changes(before: Iterable[str], after: Iterable[str]) -> list[str]:
+    before, after = set(before), set(after)
+    return [f"+ {name}" for name in sorted(after - before)] + [
+        f"- {name}" for name in sorted(before - after)
+    ]
+
+
+def _dict_changes(before: dict, after: dict) -> list[str]:
+    changes = _set_changes(before, after)
+    changes += [
+        f"~ {name}"
+        for name in sorted(before.keys() & after.keys())
+        if before[name] != after[name]
+    ]
+    return changes
+
+
+def _hash_change(before: str | None, after: str | None) -> str:
+    if before == after:
+        return "same"
+    short = [(h or "-")[:SHORT_HASH] for h in (before, after)]
+    return f"{short[0]} → {short[1]}"
+
+
+def _size_change(before: int | None, after: int | None) -> str:
+    if before is None or after is None:
+        fmt = [f"{n} B" if n is not None else "-" for n in (before, after)]
+        return f"{fmt[0]} → {fmt[1]}"
+    return f"{before} → {after} B ({after - before:+d})"
+
+
+def _time_change(before: float | None, after: float | None) -> str:
+    if before is None or after is None:
+        fmt = [f"{t:.2f}s" if t is not None else "-" for t in (before, after)]
+        return f"{fmt[0]} → {fmt[1]}"
+    return f"{before:.2f}s → {after:.2f}s ({after - before:+.2f}s)"
+
+
+def compare_records(a: dict, b: dict) -> list[tuple[str, str]]:
+    """(label, change) rows describing how run `b` differs from run `a`."""
+    rows = [
+        ("status", f"{a.get('status')} → {b.get('status')}"),
+        ("content hash", _hash_change(a.get("content_hash"), b.get("content_hash"))),
+    ]
+    snap_a, snap_b = a.get("snapshot") or {}, b.get("snapshot") or {}
+    rows += [
+        (
+            "computed hash",
+            _hash_change(snap_a.get("computed_hash"), snap_b.get("computed_hash")),
+        ),
+        (
+            "computed size",
+            _size_change(snap_a.get("computed_bytes"), snap_b.get("computed_bytes")),
+        ),
+        (
+            "snapshot size",
+            _size_change(snap_a.get("snapshot_bytes"), snap_b.get("snapshot_bytes")),
+        ),
+    ]
+    for label, key in (
+        ("services", "services"),
+        ("configs", "configs"),
+        ("volumes", "volumes"),
+    ):
+        changes = _set_changes(snap_a.get(key, []), snap_b.get(key, []))
+        rows.append((label, ", ".join(changes) or "same"))
+    for label, key in (("urls", "urls"), ("env overrides", "env_overrides")):
+        changes = _dict_changes(snap_a.get(key, {}), snap_b.get(key, {}))
+        rows.append((label, ", ".join(changes) or "same"))
+
+    times_a, times_b = a.get("timings", {}), b.get("timings", {})
+    for label, key in (
+        ("request", "request"),
+        ("queued", "queue"),
+        ("deploying", "deploy"),
+        ("total", "total"),
+    ):
+        if key in times_a or key in times_b:
+            rows.append((label, _time_change(times_a.get(key), times_b.get(key))))
+    healthy_a = times_a.get("time_to_healthy", {})
+    healthy_b = times_b.get("time_to_healthy", {})
+    for service in sorted(healthy_a.keys() | healthy_b.keys()):
+        change = _time_change(healthy_a.get(service), healthy_b.get(service))
+        rows.append((f"{service} healthy", change))
+    return rows
+
+
+# ── Output ──────────────────────────────────────────────────────
+
+
+def _run_label(record: dict) -> str:
+    return f"{record.get('deployment') or '-'} ({record.get('recorded_at', '?')})"
+
+
+def print_records(records: list[dict]) -> None:
+    """One line per run: when, stack, status, timings and snapshot size."""
+    width = max([len("Stack"), *(len(r["slug"]) for r in records)])
+    print(
+        f"{'Recorded':<25}  {'Stack':<{width}}  {'Action':<8}  {'Status':<9}"
+        f"  {'Request':>7}  {'Total':>7}  {'Snapshot':>8}  Computed"
+    )
+    print(
+        f"{'-' * 25}  {'-' * width}  {'-' * 8}  {'-' * 9}"
+        f"  {'-' * 7}  {'-' * 7}  {'-' * 8}  {'-' * SHORT_HASH}"
+    )
+    for record in records:
+        timings = record.get("timings", {})
+        snapshot = record.get("snapshot") or {}
+        total = timings.get("total")
+        size = snapshot.get("snapshot_bytes")
+        print(
+            f"{record.get('recorded_at', '?'):<25}  {record['slug']:<{width}}"
+            f"  {record.get('action', '-'):<8}  {record.get('status') or '-':<9}"
+            f"  {timings.get('request', 0):>6.2f}s"
+            f"  {f'{total:.2f}s' if total is not None else '-':>7}"
+            f"  {size if size is not None else '-':>8}"
+            f"  {(snapshot.get('computed_hash') or '-')[:SHORT_HASH]}"
+        )
+
+
+def print_comparison(slug: str, a: dict, b: dict) -> None:
+    print(f"{slug}: {_run_label(a)} → {_run_label(b)}\n")
+    rows = compare_records(a, b)
+    width = max(len(label) for label, _ in rows)
+    for label, change in rows:
+        print(f"  {label:<{width}}  {change}")
+
+
+def cli(argv: list[str] | None = None, prog: str | None = None) -> None:
+    """Command-line entry point, also run as `zane-templates history`."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=HISTORY_FILE,
+        help="The deployment history file ($ZANE_DEPLOY_HISTORY)",
+    )
+    parser.add_argument("--project", "-p", help="Only runs in this project")
+    parser.add_argument("--env", "-e", help="Only runs in this environment")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="List recorded runs, oldest first")
+    list_parser.add_argument("slugs", nargs="*", help="Only runs of these stacks")
+    list_parser.add_argument(
+        "--limit",
+        "-n",
+        type=int,
+        default=20,
+        help="Show the N most recent runs (0: all)",
+    )
+    list_parser.add_argument(
+        "--json", action="store_true", help="Print the matching records as JSONL"
+    )
+
+    compare_parser = commands.add_parser(
+        "compare", help="Diff two runs of the same stack"
+    )
+    compare_parser.add_argument("slug", help="Stack slug")
+    compare_parser.add_argument(
+        "runs",
+        nargs="*",
+        default=[],
+        help="Runs (index or deployment hash); default: the last two",
+    )
+
+    args = parser.parse_args(argv)
+    records = read_records(args.history)
+
+    if args.command == "list":
+        selected = filter_records(records, args.slugs, args.project, args.env)
+        if args.limit > 0:
+            selected = selected[-args.limit :]
+        if args.json:
+            for record in selected:
+                print(json.dumps(record, sort_keys=True))
+        elif selected:
+            print_records(selected)
+        else:
+            print(f"No runs recorded in {args.history}")
+        return
+
+    if len(args.runs) > 2:
+        compare_parser.error("at most two runs can be compared")
+    # No run: the last two. One run: that run against the latest.
+    refs = {0: ["-2", "-1"], 1: [*args.runs, "-1"]}.get(len(args.runs), args.runs)
+    runs = filter_records(records, [args.slug], args.project, args.env)
+    try:
+        a, b = (find_run(runs, ref) for ref in refs)
+    except LookupError as e:
+        print(f"Error: {args.slug}: {e}", file=sys.stderr)
+        sys.exit(1)
+    print_comparison(args.slug, a, b)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Typesense endpoints that sync_typesense.py uses.
+
+Collections are kept in memory. The server implements collection
+get/create/delete, JSONL document import (create/upsert/update), JSONL
+export with include_fields, and delete-by-filter on `id:[...]`. Imported
+documents are checked against the collection schema, so bad documents fail
+per line as they would on the real server.
+
+Usage:
+    python scripts/fake_typesense.py [--port 8108] [--api-key typesense]
+                                     [--latency 0.01]
+
+    python scripts/sync_typesense.py --url http://127.0.0.1:8108
+
+Or in-process:
+    with FakeTypesense() as server:
+        ... server.base_url, server.collections, server.requests ...
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+COLLECTION_PATH_RE = re.compile(r"^/collections/(?P<name>[^/]+)$")
+DOCUMENTS_PATH_RE = re.compile(
+    r"^/collections/(?P<name>[^/]+)/documents(?:/(?P<action>import|export))?$"
+)
+ID_FILTER_RE = re.compile(r"^id:\s*\[(?P<ids>.*)\]$")
+FIELD_TYPES = {
+    "string": str,
+    "string[]": list,
+    "int32": int,
+    "int64": int,
+    "float": (int, float),
+    "bool": bool,
+}
+
+
+class Colors:
+    GREEN = "\033[92m"
+    BLUE = "\033[94m"
+    YELLOW = "\033[33m"
+    RED = "\033[91m"
+    GREY = "\033[90m"
+    ENDC = "\033[0m"
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class FakeTypesense:
+    """In-memory Typesense API served from a background thread."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        api_key: str = "typesense",
+        latency: float = 0.0,
+    ) -> None:
+        self.api_key = api_key
+        self.latency = latency
+        # name -> {"schema": {...}, "documents": {id: doc}}
+        self.collections: dict[str, dict] = {}
+        self.requests: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+        handler = type("Handler", (_Handler,), {"api": self})
+        self.server = _Server((host, port), handler)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeTypesense":
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeTypesense":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def documents(self, name: str) -> dict[str, dict]:
+        return self.collections[name]["documents"]
+
+    # ── Operations ──────────────────────────────────────────────
+
+    def create_collection(self, schema: dict) -> tuple[int, dict]:
+        name = schema.get("name")
+        with self._lock:
+            if not name:
+                return 400, {"message": "Parameter `name` is required."}
+            if name in self.collections:
+                message = f"A collection with name `{name}` already exists."
+                return 409, {"message": message}
+            self.collections[name] = {"schema": schema, "documents": {}}
+        return 201, {**schema, "num_documents": 0}
+
+    def get_collection(self, name: str) -> tuple[int, dict]:
+        with self._lock:
+            collection = self.collections.get(name)
+            if collection is None:
+                return 404, {"message": "Not Found"}
+            return 200, {
+                **collection["schema"],
+                "num_documents": len(collection["documents"]),
+            }
+
+    def delete_collection(self, name: str) -> tuple[int, dict]:
+        with self._lock:
+            collection = self.collections.pop(name, None)
+        if collection is None:
+            return 404, {"message": "Not Found"}
+        return 200, collection["schema"]
+
+    def _check_document(self, schema: dict, doc: dict) -> str | None:
+        if not isinstance(doc.get("id"), str):
+            return "Document's `id` field should be a string."
+        for field in schema.get("fields", []):
+            name = field["name"]
+            if name == "id":
+                continue
+            if name not in doc or doc[name] is None:
+                if not field.get("optional"):
+                    return (
+                        f"Field `{name}` has been declared in the schema,"
+                        " but is not found in the document."
+                    )
+                continue
+            expected = FIELD_TYPES.get(field["type"])
+            if expected is not None and not isinstance(doc[name], expected):
+                return f"Field `{name}` must be of type {field['type']}."
+        return None
+
+    def import_documents(
+        self, name: str, action: str, body: str
+    ) -> tuple[int, list]:
+        results = []
+        with self._lock:
+            collection = self.collections.get(name)
+            if collection is None:
+                return 404, [{"message": "Not Found"}]
+            documents = collection["documents"]
+            for line in body.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    doc = json.loads(line)
+                except ValueError:
+                    results.append(
+                        {"success": False, "error": "Bad JSON.", "document": line}
+                    )
+                    continue
+                merged = {**documents.get(doc.get("id"), {}), **doc}
+                if action == "create" and doc.get("id") in documents:
+                    error = "A document with id already exists."
+                elif action == "update" and doc.get("id") not in documents:
+                    error = "Could not find a document with id."
+                else:
+                    error = self._check_document(collection["schema"], merged)
+                if error:
+                    results.append({"success": False, "error": error, "document": line})
+                    continue
+                documents[doc["id"]] = merged if action == "update" else doc
+                results.append({"success": True})
+        return 200, results
+
+    def export_documents(
+        self, name: str, include_fields: list[str] | None
+    ) -> tuple[int, list]:
+        with self._lock:
+            collection = self.collections.get(name)
+            if collection is None:
+                return 404, [{"message": "Not Found"}]
+            docs = list(collection["documents"].values())
+        if include_fields:
+            docs = [
+                {k: v for k, v in doc.items() if k in include_fields} for doc in docs
+            ]
+        return 200, docs
+
+    def delete_documents(self, name: str, filter_by: str) -> tuple[int, dict]:
+        match = ID_FILTER_RE.match(filter_by.strip())
+        if match is None:
+            return 400, {"message": "Only `id:[...]` filters are supported here."}
+        ids = {p.strip().strip("`") for p in match["ids"].split(",") if p.strip()}
+        with self._lock:
+            collection = self.collections.get(name)
+            if collection is None:
+                return 404, {"message": "Not Found"}
+            documents = collection["documents"]
+            deleted = [doc_id for doc_id in ids if documents.pop(doc_id, None)]
+        return 200, {"num_deleted": len(deleted)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    api: FakeTypesense
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        pass
+
+    def _body(self) -> str:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length).decode("utf-8") if length else ""
+
+    def _send(self, status: int, payload, jsonl: bool = False) -> None:
+        if jsonl:
+            body = "\n".join(json.dumps(item) for item in payload).encode()
+        else:
+            body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header(
+            "Content-Type", "text/plain" if jsonl else "application/json"
+        )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str) -> None:
+        api = self.api
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        body = self._body()
+        if api.latency:
+            time.sleep(api.latency)
+
+        if self.headers.get("X-TYPESENSE-API-KEY") != api.api_key:
+            return self._send(
+                401,
+                {
+                    "message": "Forbidden - a valid `x-typesense-api-key`"
+                    " header must be sent."
+                },
+            )
+
+        if url.path == "/collections" and method == "POST":
+            api.requests["create collection"] += 1
+            try:
+                schema = json.loads(body or "{}")
+            except ValueError:
+                return self._send(400, {"message": "Bad JSON."})
+            return self._send(*api.create_collection(schema))
+
+        if match := COLLECTION_PATH_RE.match(url.path):
+            api.requests[f"{method} collection"] += 1
+            if method == "GET":
+                return self._send(*api.get_collection(match["name"]))
+            if method == "DELETE":
+                return self._send(*api.delete_collection(match["name"]))
+
+        if match := DOCUMENTS_PATH_RE.match(url.path):
+            name, action = match["name"], match["action"]
+            if action == "import" and method == "POST":
+                api.requests["import"] += 1
+                api.requests["imported documents"] += body.count("\n") + bool(body)
+                status, results = api.import_documents(
+                    name, query.get("action", "create"), body
+                )
+                return self._send(status, results, jsonl=status == 200)
+            if action == "export" and method == "GET":
+                api.requests["export"] += 1
+                fields = query.get("include_fields")
+                status, docs = api.export_documents(
+                    name, fields.split(",") if fields else None
+                )
+                return self._send(status, docs, jsonl=status == 200)
+            if action is None and method == "DELETE":
+                api.requests["delete by filter"] += 1
+                return self._send(
+                    *api.delete_documents(name, query.get("filter_by", ""))
+                )
+
+        return self._send(404, {"message": "Not Found"})
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_DELETE(self) -> None:
+        self._handle("DELETE")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve a fake Typesense API for sync_typesense.py"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8108)
+    parser.add_argument("--api-key", default="typesense")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every request"
+    )
+    args = parser.parse_args()
+
+    server = FakeTypesense(args.host, args.port, args.api_key, args.latency)
+    C = Colors
+    print(
+        f"{C.BLUE}Fake Typesense API{C.ENDC} listening on"
+        f" {C.GREEN}{server.base_url}{C.ENDC}"
+    )
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+        print(f"\n{C.GREY}Requests served:{C.ENDC}")
+        for endpoint, count in sorted(server.requests.items()):
+            print(f"  {endpoint:<28} {count}")
@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the parts of the ZaneOps API that deploy_compose.py and
+cleanup_stacks.py use.
+
+It implements CSRF, login, and compose stacks (list, get, create,
+request-changes, deploy, deployment status, archive) in memory. Latency and
+failures can be injected, so the deploy and cleanup clients can be exercised
+and benchmarked without a real instance.
+
+Deployments go QUEUED → DEPLOYING → FINISHED over --deploy-time seconds.
+They end FAILED for stacks whose slug contains one of --fail-slugs.
+
+Usage:
+    python scripts/fake_zane.py [--port 8000] [--latency 0.05] [--jitter 0.02]
+                                [--fail-rate 0.1] [--deploy-time 2]
+
+    python scripts/deploy_compose.py -f n8n.yml -u http://127.0.0.1:8000
+
+Or in-process:
+    with FakeZane(latency=0.01) as server:
+        ... server.base_url ...
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import secrets
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+STACKS_PREFIX = "/api/compose/stacks/"
+STACK_PATH_RE = re.compile(
+    r"^/api/compose/stacks/(?P<project>[^/]+)/(?P<env>[^/]+)/"
+    r"(?P<slug>[^/]+)/(?:(?P<action>request-changes|deploy|archive)/"
+    r"|deployments/(?P<hash>[^/]+)/)?$"
+)
+CREATE_PATH_RE = re.compile(
+    r"^/api/compose/stacks/(?P<project>[^/]+)/(?P<env>[^/]+)/create/$"
+)
+LIST_PATH_RE = re.compile(
+    r"^/api/compose/stacks/(?P<project>[^/]+)/(?P<env>[^/]+)/$"
+)
+QUEUED_FRACTION = 0.3  # share of deploy_time a deployment spends QUEUED
+PAGE_SIZE = 50  # stacks per page of the list endpoint
+# deployment status -> status reported for each of its services
+SERVICE_STATUSES = {
+    "QUEUED": None,
+    "DEPLOYING": "STARTING",
+    "FAILED": "UNHEALTHY",
+    "FINISHED": "HEALTHY",
+}
+
+
+class Colors:
+    GREEN = "\033[92m"
+    BLUE = "\033[94m"
+    YELLOW = "\033[33m"
+    RED = "\033[91m"
+    GREY = "\033[90m"
+    ENDC = "\033[0m"
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # deploy_compose.py --bulk opens many connections at once.
+    request_queue_size = 128
+
+
+class FakeZane:
+    """In-memory ZaneOps API served from a background thread.
+
+    latency/jitter: seconds added to every request (uniform jitter on top).
+    fail_rate: probability that a stack request fails with `fail_status`.
+        Auth endpoints never fail, so runs stay comparable.
+    deploy_time: seconds a deployment takes to reach a final status.
+    fail_slugs: deployments of stacks whose slug contains one of these end FAILED.
+    session_ttl: seconds before a login session expires (None = never).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        fail_rate: float = 0.0,
+        fail_status: int = 503,
+        deploy_time: float = 2.0,
+        fail_slugs: tuple[str, ...] = (),
+        username: str = "admin",
+        password: str = "password",
+        session_ttl: float | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.fail_status = fail_status
+        self.deploy_time = deploy_time
+        self.fail_slugs = fail_slugs
+        self.username = username
+        self.password = password
+        self.session_ttl = session_ttl
+
+        self.stacks: dict[tuple[str, str, str], dict] = {}
+        self.deployments: dict[str, dict] = {}
+        self.latest: dict[tuple[str, str, str], str] = {}  # stack -> deployment
+        self.sessions: dict[str, float] = {}  # session id -> expiry timestamp
+        self.requests: Counter[str] = Counter()  # "METHOD endpoint" -> count
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._ids = itertools.count(1)
+
+        handler = type("Handler", (_Handler,), {"api": self})
+        self.server = _Server((host, port), handler)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeZane":
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeZane":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def reset(self) -> None:
+        """Forget every stack, deployment, session and request count."""
+        with self._lock:
+            self.stacks.clear()
+            self.deployments.clear()
+            self.latest.clear()
+            self.sessions.clear()
+            self.requests.clear()
+
+    def revoke_sessions(self) -> None:
+        """Log every client out, as a server restart or expiry would."""
+        with self._lock:
+            self.sessions.clear()
+
+    def hit(self, endpoint: str) -> None:
+        """Count a request; handler threads call this concurrently."""
+        with self._lock:
+            self.requests[endpoint] += 1
+
+    # ── Behaviour knobs ─────────────────────────────────────────
+
+    def delay(self) -> None:
+        with self._lock:
+            extra = self._random.uniform(0, self.jitter) if self.jitter else 0.0
+        if self.latency or extra:
+            time.sleep(self.latency + extra)
+
+    def should_fail(self) -> bool:
+        if not self.fail_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.fail_rate
+
+    # ── Auth ────────────────────────────────────────────────────
+
+    def new_session(self) -> str:
+        sid = secrets.token_hex(16)
+        ttl = self.session_ttl
+        expires = time.time() + ttl if ttl is not None else float("inf")
+        with self._lock:
+            self.sessions[sid] = expires
+        return sid
+
+    def session_valid(self, sid: str | None) -> bool:
+        with self._lock:
+            return sid is not None and self.sessions.get(sid, 0) > time.time()
+
+    # ── Stacks ──────────────────────────────────────────────────
+
+    def create_stack(self, project: str, env: str, body: dict) -> tuple[int, dict]:
+        with self._lock:
+            n = next(self._ids)
+            slug = body.get("slug") or f"stack-{n}"
+            key = (project, env, slug)
+            if key in self.stacks:
+                detail = f"A stack with the slug `{slug}` already exists"
+                return 409, {"detail": detail}
+            stack = {
+                "id": f"compose_stk_{n:06d}",
+                "slug": slug,
+                "user_content": body.get("user_content", ""),
+                "unapplied_changes": [],
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }
+            self.stacks[key] = stack
+            return 201, stack
+
+    def list_stacks(
+        self, project: str, env: str, page: int, base_url: str
+    ) -> tuple[int, dict]:
+        """A page of the environment's stacks, paginated like DRF does."""
+        with self._lock:
+            stacks = [
+                {k: v for k, v in stack.items() if k != "user_content"}
+                for (p, e, _), stack in self.stacks.items()
+                if (p, e) == (project, env)
+            ]
+        start = (page - 1) * PAGE_SIZE
+        if page < 1 or (start >= len(stacks) and page > 1):
+            return 404, {"detail": "Invalid page."}
+        url = f"{base_url}/api/compose/stacks/{project}/{env}/"
+        more = start + PAGE_SIZE < len(stacks)
+        return 200, {
+            "count": len(stacks),
+            "next": f"{url}?page={page + 1}" if more else None,
+            "previous": f"{url}?page={page - 1}" if page > 1 else None,
+            "results": stacks[start : start + PAGE_SIZE],
+        }
+
+    def archive(self, key: tuple[str, str, str]) -> tuple[int, dict]:
+        with self._lock:
+            if self.stacks.pop(key, None) is None:
+                return 404, {"detail": "Not found."}
+            self.latest.pop(key, None)
+            for deployment_hash, deployment in list(self.deployments.items()):
+                if deployment["key"] == key:
+                    del self.deployments[deployment_hash]
+        return 204, {}
+
+    def get_stack(self, key: tuple[str, str, str]) -> tuple[int, dict]:
+        with self._lock:
+            stack = self.stacks.get(key)
+            deployment_hash = self.latest.get(key)
+            deployment = self.deployments.get(deployment_hash or "")
+        if stack is None:
+            return 404, {"detail": "Not found."}
+        latest = None
+        if deployment is not None:
+            latest = {"hash": deployment_hash, "status": self._status(deployment)}
+        return 200, {**stack, "latest_deployment": latest}
+
+    def request_changes(
+        self, key: tuple[str, str, str], body: dict
+    ) -> tuple[int, dict]:
+        with self._lock:
+            stack = self.stacks.get(key)
+            if stack is None:
+                return 404, {"detail": "Not found."}
+            change = {"id": f"chg_{next(self._ids):06d}", **body}
+            stack["unapplied_changes"].append(change)
+            return 200, change
+
+    def deploy(self, key: tuple[str, str, str], body: dict) -> tuple[int, dict]:
+        with self._lock:
+            stack = self.stacks.get(key)
+            if stack is None:
+                return 404, {"detail": "Not found."}
+            for change in stack["unapplied_changes"]:
+                if change.get("field") == "compose_content":
+                    stack["user_content"] = change.get("new_value", "")
+            stack["unapplied_changes"] = []
+            deployment_hash = f"dpl_cmp_{next(self._ids):06d}"
+            self.deployments[deployment_hash] = {
+                "key": key,
+                "started": time.monotonic(),
+                "fails": any(part in key[2] for part in self.fail_slugs),
+            }
+            self.latest[key] = deployment_hash
+            user_content = stack["user_content"]
+        return 200, {
+            "hash": deployment_hash,
+            "status": "QUEUED",
+            "commit_message": body.get("commit_message", ""),
+            "stack_snapshot": _snapshot(key[2], user_content),
+        }
+
+    def deployment_status(
+        self, key: tuple[str, str, str], deployment_hash: str
+    ) -> tuple[int, dict]:
+        with self._lock:
+            deployment = self.deployments.get(deployment_hash)
+            stack = self.stacks.get(key)
+        if deployment is None or deployment["key"] != key or stack is None:
+            return 404, {"detail": "Not found."}
+
+        services = sorted(_services(stack["user_content"]))
+        status = self._status(deployment)
+        service_status = SERVICE_STATUSES[status]
+        statuses = {}
+        if service_status is not None:
+            statuses = {name: {"status": service_status} for name in services}
+        return 200, {
+            "hash": deployment_hash,
+            "status": status,
+            "service_statuses": statuses,
+        }
+
+
+    def _status(self, deployment: dict) -> str:
+        elapsed = time.monotonic() - deployment["started"]
+        if elapsed < self.deploy_time * QUEUED_FRACTION:
+            return "QUEUED"
+        if elapsed < self.deploy_time:
+            return "DEPLOYING"
+        return "FAILED" if deployment["fails"] else "FINISHED"
+
+
+def _services(user_content: str) -> dict:
+    try:
+        spec = yaml.load(user_content, Loader=SafeLoader)
+    except yaml.YAMLError:
+        return {}
+    services = spec.get("services") if isinstance(spec, dict) else None
+    return services if isinstance(services, dict) else {}
+
+
+def _snapshot(slug: str, user_content: str) -> dict:
+    """A plausible stack_snapshot: one URL per service that publishes a port."""
+    urls = {}
+    for name, service in _services(user_content).items():
+        ports = service.get("ports") if isinstance(service, dict) else None
+        if ports:
+            port = str(ports[0]).rsplit(":", 1)[-1].split("/")[0]
+            domain = f"{slug}-{name}.127-0-0-1.sslip.io"
+            urls[name] = [{"domain": domain, "base_path": "/", "port": port}]
+    return {
+        "urls": urls,
+        "configs": {},
+        "computed_content": user_content,
+        "env_overrides": [],
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    api: FakeZane
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        pass
+
+    def _cookies(self) -> dict[str, str]:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return {name: morsel.value for name, morsel in cookie.items()}
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(raw) if raw else {}
+        except ValueError:
+            return {}
+
+    def _send(
+        self, status: int, payload: dict, cookies: dict[str, str] | None = None
+    ) -> None:
+        body = json.dumps(payload).encode() if status != 204 else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (cookies or {}).items():
+            self.send_header("Set-Cookie", f"{name}={value}; Path=/; SameSite=Lax")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str) -> None:
+        api = self.api
+        path, _, query = self.path.partition("?")
+        body = self._body() if method in ("POST", "PUT") else {}
+        api.delay()
+
+        if path == "/api/csrf/" and method == "GET":
+            api.hit("GET csrf")
+            token = self._cookies().get("csrftoken") or secrets.token_hex(16)
+            return self._send(200, {"details": "CSRF cookie set"}, {"csrftoken": token})
+
+        cookies = self._cookies()
+        if method != "GET" and (
+            not cookies.get("csrftoken")
+            or self.headers.get("X-CSRFToken") != cookies["csrftoken"]
+        ):
+            api.hit(f"{method} csrf-rejected")
+            return self._send(403, {"detail": "CSRF Failed: CSRF token missing."})
+
+        if path == "/api/auth/login/" and method == "POST":
+            api.hit("POST login")
+            if (body.get("username"), body.get("password")) != (
+                api.username,
+                api.password,
+            ):
+                return self._send(401, {"detail": "Invalid username or password"})
+            return self._send(201, {"success": True}, {"sessionid": api.new_session()})
+
+        if not path.startswith(STACKS_PREFIX):
+            return self._send(404, {"detail": "Not found."})
+        if not api.session_valid(cookies.get("sessionid")):
+            api.hit(f"{method} unauthenticated")
+            detail = "Authentication credentials were not provided."
+            return self._send(401, {"detail": detail})
+        if api.should_fail():
+            api.hit(f"{method} injected-failure")
+            return self._send(api.fail_status, {"detail": "Injected failure"})
+
+        if match := CREATE_PATH_RE.match(path):
+            if method != "POST":
+                return self._send(405, {"detail": "Method not allowed."})
+            api.hit("POST create")
+            return self._send(*api.create_stack(match["project"], match["env"], body))
+
+        if match := LIST_PATH_RE.match(path):
+            if method != "GET":
+                return self._send(405, {"detail": "Method not allowed."})
+            api.hit("GET list")
+            params = dict(parse_qsl(query))
+            try:
+                page = int(params.get("page", 1))
+            except ValueError:
+                return self._send(404, {"detail": "Invalid page."})
+            base_url = f"http://{self.headers.get('Host', '')}"
+            return self._send(
+                *api.list_stacks(match["project"], match["env"], page, base_url)
+            )
+
+        match = STACK_PATH_RE.match(path)
+        if match is None:
+            return self._send(404, {"detail": "Not found."})
+        key = (match["project"], match["env"], match["slug"])
+        action = match["action"]
+        if match["hash"] and method == "GET":
+            api.hit("GET deployment")
+            return self._send(*api.deployment_status(key, match["hash"]))
+        if action == "request-changes" and method == "PUT":
+            api.hit("PUT request-changes")
+            return self._send(*api.request_changes(key, body))
+        if action == "deploy" and method == "PUT":
+            api.hit("PUT deploy")
+            return self._send(*api.deploy(key, body))
+        if action == "archive" and method == "DELETE":
+            api.hit("DELETE archive")
+            return self._send(*api.archive(key))
+        if action is None and not match["hash"] and method == "GET":
+            api.hit("GET stack")
+            return self._send(*api.get_stack(key))
+        return self._send(405, {"detail": "Method not allowed."})
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_PUT(self) -> None:
+        self._handle("PUT")
+
+    def do_DELETE(self) -> None:
+        self._handle("DELETE")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve a fake ZaneOps API for deploy_compose.py"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every request"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Extra random delay, up to N seconds"
+    )
+    parser.add_argument(
+        "--fail-rate",
+        type=float,
+        default=0.0,
+        help="Probability (0-1) that a stack request fails with --fail-status",
+    )
+    parser.add_argument("--fail-status", type=int, default=503)
+    parser.add_argument(
+        "--deploy-time",
+        type=float,
+        default=2.0,
+        help="Seconds a deployment takes to finish",
+    )
+    parser.add_argument(
+        "--fail-slugs",
+        nargs="*",
+        default=[],
+        help="Deployments of stacks whose slug contains one of these fail",
+    )
+    parser.add_argument(
+        "--session-ttl", type=float, help="Seconds before a login session expires"
+    )
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="password")
+    args = parser.parse_args()
+
+    server = FakeZane(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        fail_rate=args.fail_rate,
+        fail_status=args.fail_status,
+        deploy_time=args.deploy_time,
+        fail_slugs=tuple(args.fail_slugs),
+        username=args.username,
+        password=args.password,
+        session_ttl=args.session_ttl,
+    )
+    C = Colors
+    print(
+        f"{C.BLUE}Fake ZaneOps API{C.ENDC} listening on"
+        f" {C.GREEN}{server.base_url}{C.ENDC}"
+    )
+    print(
+        f"{C.GREY}latency {args.latency}s (+{args.jitter}s jitter),"
+        f" fail rate {args.fail_rate:.0%}, deploy time {args.deploy_time}s{C.ENDC}"
+    )
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+        print(f"\n{C.GREY}Requests served:{C.ENDC}")
+        for endpoint, count in sorted(server.requests.items()):
+            print(f"  {endpoint:<28} {count}")
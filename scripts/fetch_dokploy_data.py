@@ -6,23 +6,66 @@ For each local template that has a matching entry in Dokploy's index, this scrip
   - Downloads the logo to public/logos/{slug}.{ext}
   - Records github_url, docs_url, website_url, and logo_url in a local match file
 
-The Dokploy index (meta.json) is saved to scripts/dokploy-index.json.
+The Dokploy index (meta.json) is saved to scripts/dokploy-index.json, and a
+memory-mapped lookup table of it to scripts/.dokploy-cache/dokploy-index.bin:
+single-template runs find their entry there without parsing the whole index.
+Upstream responses are cached in scripts/.dokploy-cache/ and revalidated with
+If-None-Match / If-Modified-Since, so unchanged files cost a 304 and no writes.
+Logo hashes are tracked in scripts/dokploy-logos.json so a logo is only
+rewritten when its bytes actually change. Downloads are streamed to a
+temporary file, capped in size and atomically renamed into place.
 The match results are saved to scripts/dokploy-matches.json for use by
 apply_dokploy_data.py which updates the template frontmatter.
 
 Usage:
-    python scripts/fetch_dokploy_data.py [--dry-run] [template]
+    python scripts/fetch_dokploy_data.py [--dry-run] [--jobs N] [--offline] [--suggest [K]]
+                                         [--normalize-logos [--logo-size PX]] [--stream]
+                                         [template]
 
     template  Optional slug to process only one template (upserts into existing
               matches file rather than replacing it).
+    --jobs    Number of templates to process concurrently (default: 1). Logo
+              downloads share one pooled session and are capped per host.
+    --offline Serve meta.json and logos from the local cache only.
+    --suggest Print the top K fuzzy candidates for each unmatched template.
+    --normalize-logos
+              Minify SVG logos and downsize raster logos to at most --logo-size
+              pixels (default: 256). Raster resizing requires Pillow.
+    --stream  Parse meta.json entry by entry and keep only the entries that can
+              match a local template, so memory stays flat as the catalog grows.
+    --report json / --profile PATH
+              Print per-phase timings at exit / write a cProfile dump
+              (see instrumentation.py).
 """
 
 import argparse
+import codecs
+import functools
+import hashlib
+import heapq
+import io
 import json
+import mmap
+import os
+import re
+import shutil
+import struct
 import sys
+import tempfile
+import textwrap
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, nullcontext
 from pathlib import Path
+from typing import BinaryIO, Iterator
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+
+import instrumentation
+from instrumentation import span
 
 # ── Constants ──────────────────────────────────────────────────────────────────
 
@@ -34,6 +77,44 @@ TEMPLATES_DIR = REPO_ROOT / "src" / "content" / "templates"
 LOGOS_DIR = REPO_ROOT / "public" / "logos"
 INDEX_FILE = Path(__file__).parent / "dokploy-index.json"
 MATCHES_FILE = Path(__file__).parent / "dokploy-matches.json"
+CACHE_DIR = Path(__file__).parent / ".dokploy-cache"
+COMPACT_INDEX_FILE = CACHE_DIR / "dokploy-index.bin"
+LOGO_MANIFEST_FILE = Path(__file__).parent / "dokploy-logos.json"
+
+# Maximum number of in-flight requests to a single host when running with --jobs.
+MAX_REQUESTS_PER_HOST = 8
+
+# Downloads larger than this are aborted instead of being written to disk.
+MAX_INDEX_BYTES = 64 * 1024 * 1024
+MAX_LOGO_BYTES = 5 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# What may follow an element of a JSON array (iter_json_array)
+_JSON_AFTER_ELEMENT = (" ", "\t", "\r", "\n", ",", "]")
+
+# Default bounding box (in pixels) for raster logos with --normalize-logos.
+DEFAULT_LOGO_SIZE = 256
+RASTER_FORMATS = {".png": "PNG", ".jpg": "JPEG", ".jpeg": "JPEG", ".webp": "WEBP"}
+
+_SVG_STRIP_RE = re.compile(
+    rb"<!--.*?-->|<\?xml.*?\?>|<!DOCTYPE[^>]*>|<metadata\b.*?</metadata>",
+    re.DOTALL | re.IGNORECASE,
+)
+_SVG_BETWEEN_TAGS_RE = re.compile(rb">\s+<")
+
+# Fuzzy (trigram) candidates are never matched automatically: --suggest lists
+# them so a human can add the right one to SLUG_OVERRIDES.
+DEFAULT_SUGGESTIONS = 5
+
+# Compact index: header, sorted key table, record offsets, then the key and
+# record bytes. Keys are b"i" + id and b"n" + normalized id/name, mirroring
+# MatchIndex.by_id / by_norm; records are compact JSON of COMPACT_FIELDS.
+COMPACT_MAGIC = b"ZDKI"
+COMPACT_VERSION = 1
+COMPACT_HEADER = struct.Struct("<4sHH32sII")  # magic, version, -, sha256, keys, records
+COMPACT_KEY = struct.Struct("<III")  # key offset, key length, record number
+COMPACT_OFFSET = struct.Struct("<I")
+COMPACT_FIELDS = ("id", "name", "description", "tags", "logo", "links")
 
 # Explicit overrides for slugs that don't match Dokploy IDs directly.
 # Maps our slug → Dokploy id.
@@ -57,6 +138,415 @@ class Colors:
     ENDC = "\033[0m"  # Reset to default color
 
 
+class HostLimiter:
+    """Cap the number of concurrent requests sent to any single host."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(1, limit)
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    @contextmanager
+    def acquire(self, url: str):
+        host = urlsplit(url).netloc
+        with self._lock:
+            sem = self._semaphores.setdefault(
+                host, threading.BoundedSemaphore(self.limit)
+            )
+        with sem:
+            yield
+
+
+class CacheMissError(requests.RequestException):
+    """Raised in offline mode when a URL has no cached response."""
+
+
+class DownloadTooLargeError(requests.RequestException):
+    """Raised when a response body exceeds the allowed size."""
+
+
+def stream_to_temp(
+    resp: requests.Response, directory: Path, max_bytes: int
+) -> tuple[Path, str, int]:
+    """Stream a response body into a temporary file inside `directory`.
+
+    Returns (temp_path, sha256, size). The caller is responsible for renaming
+    the file into place; it is removed if the download fails or is too large.
+    """
+    length = resp.headers.get("Content-Length", "")
+    if length.isdigit() and int(length) > max_bytes:
+        raise DownloadTooLargeError(
+            f"{resp.url} is {int(length)} bytes (limit: {max_bytes})"
+        )
+
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".", suffix=".part")
+    tmp_path = Path(tmp_name)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise DownloadTooLargeError(
+                        f"{resp.url} exceeds the {max_bytes} byte limit"
+                    )
+                digest.update(chunk)
+                fh.write(chunk)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path, digest.hexdigest(), size
+
+
+@contextmanager
+def atomic_open(dest: Path) -> Iterator[BinaryIO]:
+    """Open a temp file next to `dest` for writing; rename it into place on
+    success, remove it on error."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=".", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            yield fh
+        os.replace(tmp_name, dest)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write(dest: Path, source: Path | bytes) -> None:
+    """Write bytes (or copy a file) to `dest` via a temp file and rename."""
+    with atomic_open(dest) as fh:
+        if isinstance(source, Path):
+            with source.open("rb") as src:
+                shutil.copyfileobj(src, fh)
+        else:
+            fh.write(source)
+
+
+def iter_json_array(fh: BinaryIO, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> Iterator:
+    """Yield the elements of the top-level JSON array in `fh` one at a time.
+
+    Only the element being decoded (and the rest of the current chunk) is held
+    in memory, so the caller decides what to keep. Raises ValueError on
+    malformed or truncated input.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf, pos, eof = "", 0, False
+
+    def fill(size: int) -> None:
+        nonlocal buf, pos, eof
+        chunk = fh.read(size)
+        eof = not chunk
+        buf = buf[pos:] + utf8.decode(chunk, final=eof)
+        pos = 0
+
+    def next_char() -> str:
+        """Skip whitespace and return the next character ("" at the end)."""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or eof:
+                return buf[pos : pos + 1]
+            fill(chunk_size)
+
+    if next_char() != "[":
+        raise ValueError("expected a JSON array")
+    pos += 1
+    if next_char() == "]":
+        return
+    while True:
+        next_char()  # raw_decode does not skip leading whitespace
+        size = chunk_size
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                item, end = None, None
+            # A number cut off by the chunk boundary ("-2" of "-2.5") decodes
+            # fine: only trust an element once its separator is in the buffer.
+            if end is not None and (eof or buf[end : end + 1] in _JSON_AFTER_ELEMENT):
+                break
+            fill(size)
+            size *= 2  # a large element: avoid re-decoding it once per chunk
+        pos = end
+        yield item
+        separator = next_char()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"expected ',' or ']' in JSON array, got {separator!r}")
+        pos += 1
+
+
+class HttpCache:
+    """On-disk HTTP cache keyed by URL, revalidated with ETag / Last-Modified.
+
+    Bodies are stored content-addressed under `bodies/<sha256>` and the
+    validators live in `index.json`. A read-only cache (--dry-run) still
+    serves and revalidates what is cached, but keeps new bodies in a
+    temporary directory and never saves its index.
+    """
+
+    def __init__(
+        self, directory: Path, offline: bool = False, read_only: bool = False
+    ) -> None:
+        self.directory = directory
+        self.offline = offline
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._index_file = directory / "index.json"
+        self._entries: dict[str, dict] = {}
+        self._scratch: tempfile.TemporaryDirectory | None = None
+        self._scratch_bodies: dict[str, Path] = {}
+        if self._index_file.exists():
+            try:
+                self._entries = json.loads(self._index_file.read_text())
+            except ValueError:
+                self._entries = {}
+
+    def body_path(self, sha256: str) -> Path:
+        return self._scratch_bodies.get(sha256) or self.directory / "bodies" / sha256
+
+    def _bodies_dir(self) -> Path:
+        """Where new bodies are downloaded to."""
+        if not self.read_only:
+            return self.directory / "bodies"
+        with self._lock:
+            if self._scratch is None:
+                self._scratch = tempfile.TemporaryDirectory(prefix="dokploy-cache-")
+        return Path(self._scratch.name)
+
+    def _hit(self, entry: dict) -> tuple[Path, str, bool]:
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += entry["size"]
+        return self.body_path(entry["sha256"]), entry["sha256"], True
+
+    def get(
+        self,
+        session: requests.Session,
+        url: str,
+        timeout: float,
+        max_bytes: int,
+    ) -> tuple[Path, str, bool]:
+        """Return (body_path, sha256, not_modified) for `url`.
+
+        not_modified is True when the cached body is still current: after a
+        304, when a 200 carried identical bytes, or when the cache is offline.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is not None and not self.body_path(entry["sha256"]).exists():
+            entry = None
+
+        if self.offline:
+            if entry is None:
+                raise CacheMissError(f"{url} is not in the offline cache")
+            return self._hit(entry)
+
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        with session.get(url, timeout=timeout, headers=headers, stream=True) as resp:
+            if resp.status_code == 304 and entry is not None:
+                return self._hit(entry)
+            resp.raise_for_status()
+            with span("download", urlsplit(url).path) as s:
+                tmp_path, sha256, size = stream_to_temp(
+                    resp, self._bodies_dir(), max_bytes
+                )
+                s.bytes_in = size
+            new_entry = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "sha256": sha256,
+                "size": size,
+            }
+
+        body_path = tmp_path.parent / sha256
+        os.replace(tmp_path, body_path)
+        with self._lock:
+            if self.read_only:
+                self._scratch_bodies[sha256] = body_path
+            self.misses += 1
+            if self._entries.get(url) != new_entry:
+                self._entries[url] = new_entry
+                self._dirty = True
+        # Same bytes under a new validator: callers may still skip their writes.
+        return body_path, sha256, entry is not None and entry["sha256"] == sha256
+
+    def save(self) -> None:
+        """Persist validators if anything changed since loading."""
+        if not self._dirty or self.read_only:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index_file.write_text(json.dumps(self._entries, indent=2, sort_keys=True))
+        self._dirty = False
+
+
+class LogoNormalizer:
+    """Shrink logos before they are written to LOGOS_DIR.
+
+    SVGs are minified; PNG / JPEG / WebP logos are downsized to fit within
+    `max_px` and recompressed (only when Pillow is installed). Results are
+    cached by source hash, so an unchanged upstream logo is processed once.
+    Logos passed through untouched (no Pillow, unknown format, a body Pillow
+    cannot decode) are not cached, so installing Pillow later resizes them.
+    """
+
+    def __init__(self, directory: Path, max_px: int = DEFAULT_LOGO_SIZE) -> None:
+        self.directory = directory
+        self.max_px = max_px
+        self.bytes_before = 0
+        self.bytes_after = 0
+        self._lock = threading.Lock()
+
+    def normalize(self, source: Path, sha256: str, suffix: str) -> tuple[Path, str]:
+        """Return (normalized_path, sha256) for a downloaded logo body."""
+        suffix = suffix.lower()
+        before = source.stat().st_size
+        resizable = suffix in RASTER_FORMATS and pil_image() is not None
+        if suffix != ".svg" and not resizable:
+            return self._passthrough(source, sha256, before)
+
+        out = self.directory / f"{sha256}-{self.max_px}{suffix}"
+        if not out.exists():
+            data = source.read_bytes()
+            if suffix == ".svg":
+                new_data = minify_svg(data)
+            else:
+                try:
+                    new_data = resize_raster(data, RASTER_FORMATS[suffix], self.max_px)
+                except (OSError, ValueError, pil_image().DecompressionBombError):
+                    # Corrupt or not really an image: keep the body as is.
+                    return self._passthrough(source, sha256, before)
+            atomic_write(out, new_data if len(new_data) < len(data) else data)
+
+        after = out.stat().st_size
+        with self._lock:
+            self.bytes_before += before
+            self.bytes_after += after
+        if after == before:
+            return source, sha256
+        return out, hashlib.sha256(out.read_bytes()).hexdigest()
+
+    def _passthrough(self, source: Path, sha256: str, size: int) -> tuple[Path, str]:
+        with self._lock:
+            self.bytes_before += size
+            self.bytes_after += size
+        return source, sha256
+
+
+@functools.cache
+def pil_image():
+    """PIL.Image, or None without Pillow. Imported on first use: Pillow is
+    optional, only needed for --normalize-logos, and slow to import."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+def minify_svg(data: bytes) -> bytes:
+    """Drop comments, prolog and metadata, and whitespace between tags."""
+    data = _SVG_STRIP_RE.sub(b"", data)
+    return _SVG_BETWEEN_TAGS_RE.sub(b"><", data).strip()
+
+
+def resize_raster(data: bytes, fmt: str, max_px: int) -> bytes:
+    """Downsize an image to fit in max_px × max_px and re-encode it."""
+    Image = pil_image()
+    assert Image is not None
+    with Image.open(io.BytesIO(data)) as img:
+        img.load()
+        if max(img.size) > max_px:
+            img.thumbnail((max_px, max_px))
+        out = io.BytesIO()
+        if fmt == "JPEG":
+            img.convert("RGB").save(out, format=fmt, quality=85, optimize=True)
+        else:
+            img.save(out, format=fmt, optimize=True)
+    return out.getvalue()
+
+
+class LogoManifest:
+    """Persisted sha256 of each logo in LOGOS_DIR, keyed by file name.
+
+    The size and mtime of the file are stored alongside the hash so an
+    untouched file can be checked with a single stat() instead of a read.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.written = 0
+        self.unchanged = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: dict[str, dict] = {}
+        if path.exists():
+            try:
+                self._entries = json.loads(path.read_text())
+            except ValueError:
+                self._entries = {}
+
+    def _current_hash(self, dest: Path) -> str | None:
+        try:
+            stat = dest.stat()
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            entry = self._entries.get(dest.name)
+        if (
+            entry is not None
+            and entry["size"] == stat.st_size
+            and entry["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return entry["sha256"]
+        return hashlib.sha256(dest.read_bytes()).hexdigest()
+
+    def install(self, dest: Path, source: Path, sha256: str) -> bool:
+        """Copy `source` to `dest` unless it already holds the same bytes.
+
+        Returns True if the file was written.
+        """
+        written = self._current_hash(dest) != sha256
+        if written:
+            atomic_write(dest, source)
+        stat = dest.stat()
+        entry = {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        with self._lock:
+            if written:
+                self.written += 1
+            else:
+                self.unchanged += 1
+            if self._entries.get(dest.name) != entry:
+                self._entries[dest.name] = entry
+                self._dirty = True
+        return written
+
+    def save(self) -> None:
+        """Persist the manifest if anything changed since loading."""
+        if not self._dirty:
+            return
+        self.path.write_text(json.dumps(self._entries, indent=2, sort_keys=True))
+        self._dirty = False
+
+
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
 
@@ -74,77 +564,611 @@ def get_local_slugs() -> list[str]:
     )
 
 
-def build_lookup(index: list[dict]) -> tuple[dict[str, dict], dict[str, dict]]:
-    """Build id → entry and normalized-name → entry lookup maps."""
-    by_id: dict[str, dict] = {}
-    by_norm: dict[str, dict] = {}
-    for item in index:
-        by_id[item["id"]] = item
-        by_norm[normalize(item["id"])] = item
-        by_norm[normalize(item["name"])] = item
-    return by_id, by_norm
+def trigrams(s: str) -> set[str]:
+    """Return the padded character trigrams of normalize(s)."""
+    return normalized_trigrams(normalize(s))
 
 
-def find_match(
-    slug: str,
-    by_id: dict[str, dict],
-    by_norm: dict[str, dict],
-) -> dict | None:
-    """Find a Dokploy entry for our slug, using overrides then fuzzy matching."""
+def normalized_trigrams(text: str) -> set[str]:
+    """trigrams() of a string that is already normalized."""
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class MatchIndex:
+    """Lookup structure over the Dokploy index, built once per run.
+
+    Exact id and normalized-name lookups are plain dicts. Fuzzy lookups use a
+    trigram inverted index, so a query only scores the keys that share at
+    least one trigram with it instead of scanning every entry.
+    """
+
+    def __init__(self, index: list[dict]) -> None:
+        self.by_id: dict[str, dict] = {}
+        self.by_norm: dict[str, dict] = {}
+        self._keys: list[tuple[int, int]] = []  # (entry position, trigram count)
+        self._entries: list[dict] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+
+        for item in index:
+            self.by_id[item["id"]] = item
+            self.by_norm[normalize(item["id"])] = item
+            self.by_norm[normalize(item["name"])] = item
+
+            position = len(self._entries)
+            self._entries.append(item)
+            for text in {normalize(item["id"]), normalize(item["name"])}:
+                if not text:
+                    continue
+                grams = trigrams(text)
+                key = len(self._keys)
+                self._keys.append((position, len(grams)))
+                for gram in grams:
+                    self._postings[gram].append(key)
+
+    def exact(self, candidate: str) -> dict | None:
+        """Return the entry whose id or normalized id/name equals `candidate`."""
+        if candidate in self.by_id:
+            return self.by_id[candidate]
+        return self.by_norm.get(normalize(candidate))
+
+    def search(
+        self, query: str, limit: int = DEFAULT_SUGGESTIONS
+    ) -> list[tuple[dict, float]]:
+        """Return up to `limit` (entry, score) pairs ranked by trigram similarity."""
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        overlap: Counter[int] = Counter()
+        for gram in query_grams:
+            overlap.update(self._postings.get(gram, ()))
+
+        best: dict[int, float] = {}
+        for key, shared in overlap.items():
+            position, size = self._keys[key]
+            score = 2 * shared / (len(query_grams) + size)
+            if score > best.get(position, 0.0):
+                best[position] = score
+
+        top = heapq.nlargest(limit, best.items(), key=lambda kv: (kv[1], -kv[0]))
+        return [(self._entries[position], score) for position, score in top]
+
+
+class RelevantEntries:
+    """Keeps only the Dokploy entries that find_match can pick for our slugs.
+
+    Fed the index one entry at a time, it keeps every entry an exact lookup of
+    a slug (or its override) would hit, and, for --suggest, the `limit` best
+    trigram matches of each slug. Everything else is dropped as it streams
+    past. A MatchIndex over `entries()` answers find_match, and search() up to
+    `limit`, exactly like one over the whole index.
+    """
+
+    def __init__(self, slugs: list[str], limit: int = 0) -> None:
+        self.limit = max(0, limit)
+        self.seen = 0
+        self._ids: set[str] = set()
+        self._norms: set[str] = set()
+        for slug in slugs:
+            for candidate in (SLUG_OVERRIDES.get(slug, slug), slug):
+                self._ids.add(candidate)
+                self._norms.add(normalize(candidate))
+        self._sizes = [len(trigrams(slug)) for slug in slugs]
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for i, slug in enumerate(slugs):
+            for gram in trigrams(slug):
+                self._postings[gram].append(i)
+        # Per slug, a min-heap of its best (score, -position) so far.
+        self._best: list[list[tuple[float, int]]] = [[] for _ in slugs]
+        self._exact: set[int] = set()
+        self._refs: Counter[int] = Counter()
+        self._kept: dict[int, dict] = {}
+
+    def add(self, item: dict) -> None:
+        position = self.seen
+        self.seen += 1
+        id_norm, name_norm = normalize(item["id"]), normalize(item["name"])
+        if (
+            item["id"] in self._ids
+            or id_norm in self._norms
+            or name_norm in self._norms
+        ):
+            self._exact.add(position)
+            self._kept[position] = item
+        if not self.limit:
+            return
+
+        # Same scores as MatchIndex.search: the best key of this entry, per slug.
+        scores: dict[int, float] = {}
+        for text in {id_norm, name_norm}:
+            if not text:
+                continue
+            grams = normalized_trigrams(text)
+            # Most grams belong to no local slug; a plain dict beats
+            # Counter.update on this per-entry hot path.
+            overlap: dict[int, int] = {}
+            for gram in grams:
+                for slug in self._postings.get(gram, ()):
+                    overlap[slug] = overlap.get(slug, 0) + 1
+            for slug, shared in overlap.items():
+                score = 2 * shared / (self._sizes[slug] + len(grams))
+                if score > scores.get(slug, 0.0):
+                    scores[slug] = score
+
+        for slug, score in scores.items():
+            best = self._best[slug]
+            rank = (score, -position)
+            if len(best) < self.limit:
+                heapq.heappush(best, rank)
+            elif rank > best[0]:
+                _, evicted = heapq.heapreplace(best, rank)
+                self._release(-evicted)
+            else:
+                continue
+            self._refs[position] += 1
+            self._kept[position] = item
+
+    def _release(self, position: int) -> None:
+        self._refs[position] -= 1
+        if self._refs[position] == 0:
+            del self._refs[position]
+            if position not in self._exact:
+                del self._kept[position]
+
+    def entries(self) -> list[dict]:
+        """The kept entries, in index order."""
+        return [self._kept[position] for position in sorted(self._kept)]
+
+
+class CompactIndexWriter:
+    """Builds a CompactIndex file one Dokploy entry at a time.
+
+    Records are spooled to a temporary file as they are added; only the keys
+    and record offsets stay in memory until `write_to` lays out the file.
+    """
+
+    def __init__(self, sha256: str) -> None:
+        self.sha256 = sha256
+        self._keys: dict[bytes, int] = {}
+        self._offsets = bytearray()
+        self._records = tempfile.TemporaryFile()
+        self._size = 0
+        self._count = 0
+
+    def add(self, item: dict) -> None:
+        position = self._count
+        self._keys[b"i" + item["id"].encode()] = position
+        self._keys[b"n" + normalize(item["id"]).encode()] = position
+        self._keys[b"n" + normalize(item["name"]).encode()] = position
+        record = {field: item[field] for field in COMPACT_FIELDS if field in item}
+        data = json.dumps(record, separators=(",", ":")).encode()
+        self._offsets += COMPACT_OFFSET.pack(self._size)
+        self._records.write(data)
+        self._size += len(data)
+        self._count += 1
+
+    def write_to(self, fh: BinaryIO) -> None:
+        sorted_keys = sorted(self._keys)
+        key_blob = b"".join(sorted_keys)
+        key_table = bytearray()
+        offset = 0
+        for key in sorted_keys:
+            key_table += COMPACT_KEY.pack(offset, len(key), self._keys[key])
+            offset += len(key)
+        # Record offsets are relative to the key blob, which precedes them.
+        record_offsets = bytearray()
+        for (start,) in COMPACT_OFFSET.iter_unpack(self._offsets):
+            record_offsets += COMPACT_OFFSET.pack(len(key_blob) + start)
+        record_offsets += COMPACT_OFFSET.pack(len(key_blob) + self._size)
+
+        fh.write(
+            COMPACT_HEADER.pack(
+                COMPACT_MAGIC,
+                COMPACT_VERSION,
+                0,
+                bytes.fromhex(self.sha256),
+                len(sorted_keys),
+                self._count,
+            )
+        )
+        fh.write(key_table)
+        fh.write(record_offsets)
+        fh.write(key_blob)
+        self._records.seek(0)
+        shutil.copyfileobj(self._records, fh)
+
+    def close(self) -> None:
+        self._records.close()
+
+
+def build_compact_index(index: list[dict], sha256: str) -> bytes:
+    """Serialize the fields of `index` that matching uses, for CompactIndex.
+
+    `sha256` identifies the meta.json the index was built from, so a stale
+    file is never used.
+    """
+    writer = CompactIndexWriter(sha256)
+    try:
+        for item in index:
+            writer.add(item)
+        buffer = io.BytesIO()
+        writer.write_to(buffer)
+    finally:
+        writer.close()
+    return buffer.getvalue()
+
+
+def scan_index(
+    body: Path,
+    relevant: RelevantEntries,
+    index_out: BinaryIO | None = None,
+    compact: CompactIndexWriter | None = None,
+) -> int:
+    """Stream meta.json through `relevant` without loading it whole.
+
+    On the way, entries are copied to `index_out` in the same layout as
+    json.dumps(index, indent=2) and added to `compact`. Returns the number of
+    entries.
+    """
+    count = 0
+    with body.open("rb") as fh:
+        for item in iter_json_array(fh):
+            relevant.add(item)
+            if index_out is not None:
+                index_out.write(b"[\n" if count == 0 else b",\n")
+                text = textwrap.indent(json.dumps(item, indent=2), "  ")
+                index_out.write(text.encode())
+            if compact is not None:
+                compact.add(item)
+            count += 1
+    if index_out is not None:
+        index_out.write(b"\n]" if count else b"[]")
+    return count
+
+
+class CompactIndex:
+    """Read-only, memory-mapped view of a build_compact_index file.
+
+    exact() binary-searches the key table and decodes just the one record it
+    finds, so a single-template run never parses the whole Dokploy index.
+    Fuzzy search needs every key: it builds a MatchIndex from `fallback`
+    (called once) and delegates to it.
+    """
+
+    def __init__(self, data: mmap.mmap, fallback) -> None:
+        self._data = data
+        self._fallback = fallback
+        self._full: MatchIndex | None = None
+        _, _, _, _, self._key_count, self._record_count = (
+            COMPACT_HEADER.unpack_from(data)
+        )
+        self._keys_at = COMPACT_HEADER.size
+        self._offsets_at = self._keys_at + self._key_count * COMPACT_KEY.size
+        self._blob_at = (
+            self._offsets_at + (self._record_count + 1) * COMPACT_OFFSET.size
+        )
+
+    @staticmethod
+    def source_sha256(path: Path) -> str | None:
+        """sha256 of the meta.json a compact index file was built from."""
+        try:
+            with path.open("rb") as f:
+                header = f.read(COMPACT_HEADER.size)
+        except OSError:
+            return None
+        if len(header) < COMPACT_HEADER.size:
+            return None
+        magic, version, _, source, _, _ = COMPACT_HEADER.unpack(header)
+        if (magic, version) != (COMPACT_MAGIC, COMPACT_VERSION):
+            return None
+        return source.hex()
+
+    @classmethod
+    def open(
+        cls, path: Path, sha256: str, fallback=None
+    ) -> "CompactIndex | None":
+        """Map `path` if it was built from meta.json with this sha256."""
+        try:
+            with path.open("rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # missing or empty
+            return None
+        if len(data) < COMPACT_HEADER.size:
+            data.close()
+            return None
+        magic, version, _, source, _, _ = COMPACT_HEADER.unpack_from(data)
+        if (magic, version, source.hex()) != (COMPACT_MAGIC, COMPACT_VERSION, sha256):
+            data.close()
+            return None
+        return cls(data, fallback)
+
+    def __len__(self) -> int:
+        return self._record_count
+
+    def _key(self, i: int) -> tuple[bytes, int]:
+        offset, length, record = COMPACT_KEY.unpack_from(
+            self._data, self._keys_at + i * COMPACT_KEY.size
+        )
+        start = self._blob_at + offset
+        return self._data[start : start + length], record
+
+    def _record(self, n: int) -> dict:
+        start, end = struct.unpack_from(
+            "<II", self._data, self._offsets_at + n * COMPACT_OFFSET.size
+        )
+        return json.loads(self._data[self._blob_at + start : self._blob_at + end])
+
+    def get(self, key: bytes) -> dict | None:
+        lo, hi = 0, self._key_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found, record = self._key(mid)
+            if found == key:
+                return self._record(record)
+            if found < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def exact(self, candidate: str) -> dict | None:
+        """Same lookup as MatchIndex.exact."""
+        entry = self.get(b"i" + candidate.encode())
+        if entry is not None:
+            return entry
+        return self.get(b"n" + normalize(candidate).encode())
+
+    def search(
+        self, query: str, limit: int = DEFAULT_SUGGESTIONS
+    ) -> list[tuple[dict, float]]:
+        if self._full is None:
+            if self._fallback is None:
+                return []
+            self._full = self._fallback()
+        return self._full.search(query, limit)
+
+    def close(self) -> None:
+        self._data.close()
+
+
+def find_match(slug: str, lookup: MatchIndex | CompactIndex) -> dict | None:
+    """Find a Dokploy entry for our slug: its override, then the slug itself,
+    by id or normalized id/name. Fuzzy candidates are left to --suggest."""
     candidates = [SLUG_OVERRIDES.get(slug, slug), slug]
     for candidate in candidates:
-        if candidate in by_id:
-            return by_id[candidate]
-        norm = normalize(candidate)
-        if norm in by_norm:
-            return by_norm[norm]
+        entry = lookup.exact(candidate)
+        if entry is not None:
+            return entry
     return None
 
 
+def create_session(jobs: int = 1) -> requests.Session:
+    """Return a session whose connection pool can serve `jobs` worker threads."""
+    session = requests.Session()
+    session.headers["User-Agent"] = "zaneops-template-fetcher/1.0"
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(jobs, 10))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    instrumentation.instrument_session(session)
+    return session
+
+
 def download_logo(
     dokploy_id: str,
     logo_filename: str,
     dest: Path,
     session: requests.Session,
-) -> bool:
-    """Download a logo from Dokploy's blueprints directory."""
-    C = Colors
+    cache: HttpCache,
+    limiter: HostLimiter | None = None,
+    manifest: LogoManifest | None = None,
+    normalizer: LogoNormalizer | None = None,
+) -> None:
+    """Download a logo from Dokploy's blueprints directory.
+
+    With a manifest, `dest` is only rewritten when its content hash differs.
+    Without one, a cached (304) logo is not rewritten if `dest` exists.
+    Raises requests.RequestException or OSError on failure.
+    """
     url = f"{LOGO_BASE_URL}/{dokploy_id}/{logo_filename}"
-    try:
-        resp = session.get(url, timeout=15)
-        resp.raise_for_status()
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_bytes(resp.content)
-        return True
-    except requests.RequestException as exc:
-        print(f"    {C.RED}✗ Failed to download logo:{C.ENDC} {exc}")
-        return False
+    with limiter.acquire(url) if limiter is not None else nullcontext():
+        body, sha256, not_modified = cache.get(
+            session, url, timeout=15, max_bytes=MAX_LOGO_BYTES
+        )
+    if normalizer is not None:
+        with span("logo.normalize", dest.name):
+            body, sha256 = normalizer.normalize(body, sha256, dest.suffix)
+    with span("io.write", dest.name):
+        if manifest is not None:
+            manifest.install(dest, body, sha256)
+        elif not (not_modified and dest.exists()):
+            atomic_write(dest, body)
+
+
+def process_template(
+    slug: str,
+    lookup: MatchIndex,
+    session: requests.Session,
+    dry_run: bool,
+    cache: HttpCache,
+    limiter: HostLimiter | None = None,
+    manifest: LogoManifest | None = None,
+    normalizer: LogoNormalizer | None = None,
+) -> tuple[dict | None, str | None]:
+    """Match one local template and download its logo.
+
+    Returns (match_record, logo_error). match_record is None when the slug
+    has no entry in the Dokploy index. Safe to call from worker threads: it
+    does not print, so callers can report results in a deterministic order.
+    """
+    entry = find_match(slug, lookup)
+    if entry is None:
+        return None, None
+
+    dokploy_id = entry["id"]
+    logo_filename: str = entry.get("logo", "")
+    links: dict = entry.get("links", {})
+
+    # Determine logo destination
+    logo_ext = Path(logo_filename).suffix if logo_filename else ""
+    logo_dest = LOGOS_DIR / f"{slug}{logo_ext}"
+    logo_public_path = f"/logos/{slug}{logo_ext}" if logo_ext else None
+
+    # Download logo
+    logo_ok = False
+    logo_error: str | None = None
+    if logo_filename and not dry_run:
+        try:
+            download_logo(
+                dokploy_id,
+                logo_filename,
+                logo_dest,
+                session,
+                cache,
+                limiter=limiter,
+                manifest=manifest,
+                normalizer=normalizer,
+            )
+            logo_ok = True
+        except (requests.RequestException, OSError) as exc:
+            logo_error = str(exc)
+    elif logo_filename and dry_run:
+        logo_ok = True  # pretend it succeeded in dry-run
+
+    record = {
+        "dokploy_id": dokploy_id,
+        "name": entry["name"],
+        "description": entry.get("description", ""),
+        "tags": entry.get("tags", []),
+        "logoUrl": logo_public_path if logo_ok else None,
+        "githubUrl": links.get("github") or None,
+        "docsUrl": links.get("docs") or None,
+        "websiteUrl": links.get("website") or None,
+    }
+    return record, logo_error
 
 
 # ── Main ───────────────────────────────────────────────────────────────────────
 
 
-def main(dry_run: bool, only_template: str | None = None) -> None:
+def main(
+    dry_run: bool,
+    only_template: str | None = None,
+    jobs: int = 1,
+    offline: bool = False,
+    logo_size: int | None = None,
+    suggest: int = 0,
+    stream: bool = False,
+) -> None:
     C = Colors
-    session = requests.Session()
-    session.headers["User-Agent"] = "zaneops-template-fetcher/1.0"
+    jobs = max(1, jobs)
+    session = create_session(jobs)
+    limiter = HostLimiter(MAX_REQUESTS_PER_HOST)
+    cache = HttpCache(CACHE_DIR, offline=offline, read_only=dry_run)
+    manifest = LogoManifest(LOGO_MANIFEST_FILE)
+    normalizer = None
+    if logo_size is not None:
+        normalizer = LogoNormalizer(CACHE_DIR / "normalized", logo_size)
+        if pil_image() is None:
+            print(
+                f"{C.YELLOW}Warning:{C.ENDC} Pillow is not installed,"
+                " raster logos will not be resized (pip install Pillow).\n"
+            )
 
     # 1. Fetch and save the Dokploy index
-    print(f"{C.BLUE}Fetching Dokploy meta.json …{C.ENDC}")
-    resp = session.get(META_URL, timeout=30)
-    resp.raise_for_status()
-    index: list[dict] = resp.json()
-    print(f"  {C.GREY}{len(index)} entries found{C.ENDC}")
+    source = "cache" if offline else "Dokploy"
+    print(f"{C.BLUE}Fetching {source} meta.json …{C.ENDC}")
+    index_body, index_sha, index_unchanged = cache.get(
+        session, META_URL, timeout=30, max_bytes=MAX_INDEX_BYTES
+    )
 
-    if not dry_run:
-        INDEX_FILE.write_text(json.dumps(index, indent=2))
+    def load_index() -> list[dict]:
+        with span("json.parse", "meta.json"):
+            return json.loads(index_body.read_bytes())
+
+    all_local_slugs = get_local_slugs()
+    run_slugs = [only_template] if only_template is not None else all_local_slugs
+    index_kept = index_unchanged and INDEX_FILE.exists()
+    write_index = not dry_run and not index_kept
+    write_compact = (
+        not dry_run and CompactIndex.source_sha256(COMPACT_INDEX_FILE) != index_sha
+    )
+
+    def relevant_entries() -> tuple[list[dict], int]:
+        """Stream meta.json, keeping what find_match can return for this run;
+        the index files are written entry by entry along the way."""
+        relevant = RelevantEntries(run_slugs, limit=suggest)
+        writer = CompactIndexWriter(index_sha) if write_compact else None
+        with ExitStack() as stack:
+            index_out = (
+                stack.enter_context(atomic_open(INDEX_FILE)) if write_index else None
+            )
+            with span("json.stream", "meta.json"):
+                total = scan_index(index_body, relevant, index_out, writer)
+        if writer is not None:
+            with span("io.write", COMPACT_INDEX_FILE.name):
+                with atomic_open(COMPACT_INDEX_FILE) as fh:
+                    writer.write_to(fh)
+            writer.close()
+        return relevant.entries(), total
+
+    def full_lookup() -> MatchIndex:
+        if stream:
+            return MatchIndex(relevant_entries()[0])
+        return MatchIndex(load_index())
+
+    # A single template only needs its own entry: look it up in the compact
+    # index when that was built from this exact meta.json.
+    compact = None
+    if only_template is not None and index_kept:
+        compact = CompactIndex.open(COMPACT_INDEX_FILE, index_sha, fallback=full_lookup)
+
+    lookup: MatchIndex | CompactIndex
+    if compact is not None:
+        lookup = compact
+        print(f"  {C.GREY}{len(compact)} entries found (compact index){C.ENDC}")
+    elif stream:
+        entries, total = relevant_entries()
+        instrumentation.count("index.entries", total)
+        instrumentation.count("index.kept", len(entries))
         print(
-            f"  {C.GREEN}Saved{C.ENDC}"
-            f" {C.GREY}→ {INDEX_FILE.relative_to(REPO_ROOT)}{C.ENDC}"
+            f"  {C.GREY}{total} entries found,"
+            f" {len(entries)} kept for local templates (streamed){C.ENDC}"
         )
+        if index_kept:
+            print(
+                f"  {C.GREY}Unchanged, keeping"
+                f" {INDEX_FILE.relative_to(REPO_ROOT)}{C.ENDC}"
+            )
+        elif write_index:
+            print(
+                f"  {C.GREEN}Saved{C.ENDC}"
+                f" {C.GREY}→ {INDEX_FILE.relative_to(REPO_ROOT)}{C.ENDC}"
+            )
+        with span("match.index"):
+            lookup = MatchIndex(entries)
+    else:
+        index = load_index()
+        print(f"  {C.GREY}{len(index)} entries found{C.ENDC}")
 
-    by_id, by_norm = build_lookup(index)
-    all_local_slugs = get_local_slugs()
+        if index_kept:
+            print(
+                f"  {C.GREY}Unchanged, keeping"
+                f" {INDEX_FILE.relative_to(REPO_ROOT)}{C.ENDC}"
+            )
+        elif write_index:
+            with span("io.write", INDEX_FILE.name):
+                INDEX_FILE.write_text(json.dumps(index, indent=2))
+            print(
+                f"  {C.GREEN}Saved{C.ENDC}"
+                f" {C.GREY}→ {INDEX_FILE.relative_to(REPO_ROOT)}{C.ENDC}"
+            )
+        if write_compact:
+            with span("io.write", COMPACT_INDEX_FILE.name):
+                atomic_write(COMPACT_INDEX_FILE, build_compact_index(index, index_sha))
+
+        with span("match.index"):
+            lookup = MatchIndex(index)
 
     if only_template is not None:
         if only_template not in all_local_slugs:
@@ -166,56 +1190,58 @@ def main(dry_run: bool, only_template: str | None = None) -> None:
     matched: dict[str, dict] = {}
     unmatched: list[str] = []
 
-    for slug in local_slugs:
-        entry = find_match(slug, by_id, by_norm)
+    def work(slug: str) -> tuple[dict | None, str | None]:
+        with span("template", slug):
+            return process_template(
+                slug,
+                lookup,
+                session,
+                dry_run,
+                cache,
+                limiter=limiter,
+                manifest=manifest,
+                normalizer=normalizer,
+            )
+
+    # Executor.map yields results in submission order, so output stays
+    # deterministic regardless of which download finishes first.
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = zip(local_slugs, pool.map(work, local_slugs))
+        for slug, (record, logo_error) in results:
+            if record is None:
+                unmatched.append(slug)
+                print(
+                    f"  {C.RED}✗{C.ENDC}  {C.RED}{slug:<20}{C.ENDC}"
+                    f"  {C.GREY}(no match in Dokploy index){C.ENDC}"
+                )
+                continue
+
+            if logo_error is not None:
+                print(f"    {C.RED}✗ Failed to download logo:{C.ENDC} {logo_error}")
+
+            matched[slug] = record
+
+            if record["logoUrl"] is not None:
+                status = f"{C.GREEN}✓{C.ENDC}"
+                slug_col = f"{slug:<20}"
+            else:
+                status = f"{C.ORANGE}~{C.ENDC}"
+                slug_col = f"{C.YELLOW}{slug:<20}{C.ENDC}"
 
-        if entry is None:
-            unmatched.append(slug)
+            dry_tag = f"  {C.GREY}(dry-run){C.ENDC}" if dry_run else ""
             print(
-                f"  {C.RED}✗{C.ENDC}  {C.RED}{slug:<20}{C.ENDC}"
-                f"  {C.GREY}(no match in Dokploy index){C.ENDC}"
+                f"  {status}  {slug_col}"
+                f" {C.GREY}→ {record['dokploy_id']}{C.ENDC}{dry_tag}"
             )
-            continue
-
-        dokploy_id = entry["id"]
-        logo_filename: str = entry.get("logo", "")
-        links: dict = entry.get("links", {})
-
-        # Determine logo destination
-        logo_ext = Path(logo_filename).suffix if logo_filename else ""
-        logo_dest = LOGOS_DIR / f"{slug}{logo_ext}"
-        logo_public_path = f"/logos/{slug}{logo_ext}" if logo_ext else None
-
-        # Download logo
-        logo_ok = False
-        if logo_filename and not dry_run:
-            logo_ok = download_logo(dokploy_id, logo_filename, logo_dest, session)
-        elif logo_filename and dry_run:
-            logo_ok = True  # pretend it succeeded in dry-run
-
-        matched[slug] = {
-            "dokploy_id": dokploy_id,
-            "name": entry["name"],
-            "description": entry.get("description", ""),
-            "tags": entry.get("tags", []),
-            "logoUrl": logo_public_path if logo_ok else None,
-            "githubUrl": links.get("github") or None,
-            "docsUrl": links.get("docs") or None,
-            "websiteUrl": links.get("website") or None,
-        }
-
-        if logo_ok:
-            status = f"{C.GREEN}✓{C.ENDC}"
-            slug_col = f"{slug:<20}"
-        else:
-            status = f"{C.ORANGE}~{C.ENDC}"
-            slug_col = f"{C.YELLOW}{slug:<20}{C.ENDC}"
 
-        dry_tag = f"  {C.GREY}(dry-run){C.ENDC}" if dry_run else ""
-        print(
-            f"  {status}  {slug_col}"
-            f" {C.GREY}→ {dokploy_id}{C.ENDC}{dry_tag}"
-        )
+    if not dry_run:
+        cache.save()
+        manifest.save()
+    instrumentation.count("cache.hits", cache.hits)
+    instrumentation.count("cache.misses", cache.misses)
+    instrumentation.count("cache.bytes_saved", cache.bytes_saved)
+    instrumentation.count("templates.matched", len(matched))
+    instrumentation.count("templates.unmatched", len(unmatched))
 
     # 2. Save match results
     if not dry_run:
@@ -224,7 +1250,8 @@ def main(dry_run: bool, only_template: str | None = None) -> None:
             existing: dict[str, dict] = json.loads(MATCHES_FILE.read_text())
             existing.update(matched)
             matched = existing
-        MATCHES_FILE.write_text(json.dumps(matched, indent=2))
+        with span("io.write", MATCHES_FILE.name):
+            MATCHES_FILE.write_text(json.dumps(matched, indent=2))
         print(
             f"\n{C.GREEN}Saved matches{C.ENDC}"
             f" {C.GREY}→ {MATCHES_FILE.relative_to(REPO_ROOT)}{C.ENDC}"
@@ -237,6 +1264,32 @@ def main(dry_run: bool, only_template: str | None = None) -> None:
     print(f"Unmatched: {unmatched_color}{len(unmatched)}{C.ENDC}")
     if unmatched:
         print(f"  {C.RED}{', '.join(unmatched)}{C.ENDC}")
+    if unmatched and suggest:
+        print(f"\n{C.BLUE}Suggestions{C.ENDC} {C.GREY}(add to SLUG_OVERRIDES){C.ENDC}")
+        for slug in unmatched:
+            ranked = lookup.search(slug, limit=suggest)
+            candidates = ", ".join(
+                f"{entry['id']} {C.GREY}({score:.2f}){C.ENDC}" for entry, score in ranked
+            )
+            print(f"  {C.YELLOW}{slug:<20}{C.ENDC} {candidates or C.GREY + '–' + C.ENDC}")
+    if not dry_run:
+        print(
+            f"Logos:     {C.GREEN}{manifest.written}{C.ENDC} written,"
+            f" {C.GREY}{manifest.unchanged} unchanged{C.ENDC}"
+        )
+    if normalizer is not None and normalizer.bytes_before:
+        print(
+            f"Logo size: {C.GREY}{normalizer.bytes_before / 1024:.1f} KiB →{C.ENDC}"
+            f" {C.GREEN}{normalizer.bytes_after / 1024:.1f} KiB{C.ENDC}"
+        )
+    print(
+        f"Cache:     {C.GREEN}{cache.hits}{C.ENDC} hits,"
+        f" {C.YELLOW}{cache.misses}{C.ENDC} misses,"
+        f" {C.GREY}{cache.bytes_saved / 1024:.1f} KiB saved{C.ENDC}"
+    )
+    peak = instrumentation.peak_rss()
+    if peak is not None:
+        print(f"Memory:    {C.GREY}peak RSS {peak / 2**20:.1f} MiB{C.ENDC}")
     if not dry_run:
         print(
             f"\n{C.BLUE}Run  python scripts/apply_dokploy_data.py"
@@ -244,8 +1297,9 @@ def main(dry_run: bool, only_template: str | None = None) -> None:
         )
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description=__doc__)
+def cli(argv: list[str] | None = None, prog: str | None = None) -> None:
+    """Command-line entry point, also run as `zane-templates <command>`."""
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__)
     parser.add_argument(
         "template",
         nargs="?",
@@ -257,13 +1311,71 @@ if __name__ == "__main__":
         action="store_true",
         help="Print what would happen without writing any files.",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of templates to process concurrently (default: 1).",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve meta.json and logos from the local cache without network access.",
+    )
+    parser.add_argument(
+        "--suggest",
+        type=int,
+        nargs="?",
+        const=DEFAULT_SUGGESTIONS,
+        default=0,
+        metavar="K",
+        help=(
+            "Show the top K fuzzy candidates for unmatched templates"
+            f" (default K: {DEFAULT_SUGGESTIONS})."
+        ),
+    )
+    parser.add_argument(
+        "--normalize-logos",
+        action="store_true",
+        help="Minify SVG logos and downsize raster logos before saving them.",
+    )
+    parser.add_argument(
+        "--logo-size",
+        type=int,
+        default=DEFAULT_LOGO_SIZE,
+        help=f"Max raster logo width/height in pixels (default: {DEFAULT_LOGO_SIZE}).",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Parse meta.json incrementally and keep only the entries that can"
+            " match a local template."
+        ),
+    )
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args(argv)
 
     if args.dry_run:
         print(f"{Colors.YELLOW}[DRY RUN]{Colors.ENDC} No files will be written.\n")
 
     try:
-        main(dry_run=args.dry_run, only_template=args.template)
+        with instrumentation.reporting(args, "fetch_dokploy_data"):
+            main(
+                dry_run=args.dry_run,
+                only_template=args.template,
+                jobs=args.jobs,
+                offline=args.offline,
+                logo_size=args.logo_size if args.normalize_logos else None,
+                suggest=args.suggest,
+                stream=args.stream,
+            )
     except requests.RequestException as exc:
-        print(f"\n{Colors.RED}Network error:{Colors.ENDC} {exc}", file=sys.stderr)
+        label = "Cache miss" if isinstance(exc, CacheMissError) else "Network error"
+        print(f"\n{Colors.RED}{label}:{Colors.ENDC} {exc}", file=sys.stderr)
         sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Wait for changes to template files, with inotify or by polling.
+
+A watcher covers the files named `names` (e.g. index.md, compose.yml) in
+every subdirectory of `root`, plus a few extra files such as
+scripts/dokploy-matches.json. Template directories added while it runs are
+picked up too.
+
+    with create_watcher(TEMPLATES_DIR, ("index.md",), [MATCHES_FILE]) as w:
+        for paths in batches(w, debounce=0.05):
+            ...  # every path changed at least once during the burst
+
+On Linux the watcher uses inotify through ctypes (no extra dependency):
+it sleeps until the kernel reports a write or rename. Elsewhere, or if
+inotify is unavailable (e.g. out of watches), it stats the files every
+`interval` seconds.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+# inotify(7) flags
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# A file counts as changed when it is written and closed, renamed into place
+# (atomic writes, most editors) or removed.
+FILE_EVENTS = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+_READ_SIZE = 64 * 1024
+
+DEFAULT_INTERVAL = 0.2  # seconds between polls
+
+
+class Watcher:
+    """Base class: `changes` blocks until something changed, or `timeout`."""
+
+    kind = "watcher"
+
+    def __init__(self, root: Path, names: Iterable[str], files: Iterable[Path]):
+        self.root = root
+        self.names = frozenset(names)
+        self.files = {Path(f) for f in files}
+
+    def changes(self, timeout: float | None = None) -> set[Path]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "Watcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PollingWatcher(Watcher):
+    """Compares (mtime_ns, size) of every watched file every `interval`."""
+
+    kind = "polling"
+
+    def __init__(
+        self,
+        root: Path,
+        names: Iterable[str],
+        files: Iterable[Path],
+        interval: float = DEFAULT_INTERVAL,
+    ) -> None:
+        super().__init__(root, names, files)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+        candidates = list(self.files)
+        try:
+            for directory in os.scandir(self.root):
+                if directory.is_dir():
+                    candidates += [Path(directory.path, n) for n in self.names]
+        except FileNotFoundError:
+            pass
+        for path in candidates:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def changes(self, timeout: float | None = None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {
+                path
+                for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.interval, remaining))
+
+
+class InotifyWatcher(Watcher):
+    """Linux inotify on `root`, each of its subdirectories and the
+    directories of `files`."""
+
+    kind = "inotify"
+
+    def __init__(self, root: Path, names: Iterable[str], files: Iterable[Path]):
+        super().__init__(root, names, files)
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._dirs: dict[int, Path] = {}
+        try:
+            self._add(root, FILE_EVENTS | IN_DELETE_SELF)
+            for directory in root.iterdir():
+                if directory.is_dir():
+                    self._add(directory, FILE_EVENTS)
+            for parent in {f.parent for f in self.files}:
+                if parent not in self._dirs.values():
+                    self._add(parent, FILE_EVENTS)
+        except BaseException:
+            self.close()
+            raise
+
+    def _add(self, directory: Path, mask: int) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), mask)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_add_watch: {os.strerror(error)}", directory)
+        self._dirs[wd] = directory
+
+    def _wanted(self, path: Path) -> bool:
+        if path in self.files:
+            return True
+        return path.name in self.names and path.parent.parent == self.root
+
+    def _read(self) -> set[Path]:
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_IGNORED:  # directory removed
+                    del self._dirs[wd]
+                    continue
+                path = directory / os.fsdecode(name)
+                if mask & IN_ISDIR:
+                    if directory == self.root and mask & (IN_CREATE | IN_MOVED_TO):
+                        # A new template: watch it, and report what it already
+                        # holds (files written before the watch existed).
+                        try:
+                            self._add(path, FILE_EVENTS)
+                        except OSError:  # already gone again
+                            continue
+                        changed.update(
+                            path / n for n in self.names if (path / n).exists()
+                        )
+                    elif directory == self.root:
+                        changed.update(path / n for n in self.names)
+                    continue
+                if self._wanted(path):
+                    changed.add(path)
+
+    def changes(self, timeout: float | None = None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+            try:
+                ready, _, _ = select.select([self._fd], [], [], remaining)
+            except InterruptedError:
+                continue
+            if not ready:
+                return set()
+            changed = self._read()
+            if changed:
+                return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(
+    root: Path,
+    names: Iterable[str],
+    files: Iterable[Path] = (),
+    poll: bool = False,
+    interval: float = DEFAULT_INTERVAL,
+) -> Watcher:
+    """An InotifyWatcher where possible, else a PollingWatcher."""
+    names, files = tuple(names), tuple(files)
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root, names, files)
+        except (OSError, AttributeError):  # no inotify, or out of watches
+            pass
+    return PollingWatcher(root, names, files, interval)
+
+
+def batches(watcher: Watcher, debounce: float) -> Iterator[set[Path]]:
+    """Yield the paths changed in each burst of activity.
+
+    A burst ends once nothing has changed for `debounce` seconds, so an
+    editor's save (write, rename, chmod) or a fetch run writing many files
+    is handled once.
+    """
+    while True:
+        batch = watcher.changes()
+        while more := watcher.changes(debounce):
+            batch |= more
+        yield batch
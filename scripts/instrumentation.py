@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Timing spans and run reports shared by the Python scripts.
+
+Code wraps the work it wants measured in `span(phase, key)`. Phases are
+coarse buckets such as "http", "yaml.parse", "io.write" or "template".
+Keys name the thing being processed (a slug, an endpoint), so the report can
+point at the slow ones. Recording is off unless a script was started with
+--report or --profile, and a disabled span costs one attribute check.
+
+    with span("yaml.parse", slug):
+        data = yaml.load(text, Loader=SafeLoader)
+
+    instrument_session(session)      # every response becomes an "http" span
+
+    with reporting(args, "fetch_dokploy_data"):
+        main(...)
+
+With --report json the run ends with a JSON summary on stderr (or in
+--report-file). It has count/total/mean/p50/p95/max and bytes per phase, the
+slowest keys per phase, counters and the peak RSS of the process. --profile
+PATH additionally writes a cProfile dump of the main thread, readable with
+`python -m pstats PATH`.
+"""
+
+import cProfile
+import json
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, NamedTuple
+from urllib.parse import urlsplit
+
+REPORT_FORMATS = ("json",)
+SLOWEST_KEYS = 10  # per phase, in the report
+SECRET_OPTIONS = ("--password", "--api-key")  # values redacted in the report
+
+
+class Sample(NamedTuple):
+    phase: str
+    key: str | None
+    seconds: float
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+
+class Span:
+    """Context manager that records its duration as one Sample."""
+
+    __slots__ = ("recorder", "phase", "key", "bytes_in", "bytes_out", "_start")
+
+    def __init__(self, recorder: "Recorder", phase: str, key: str | None) -> None:
+        self.recorder = recorder
+        self.phase = phase
+        self.key = key
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def __enter__(self) -> "Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.recorder.samples.append(
+            Sample(
+                self.phase,
+                self.key,
+                time.perf_counter() - self._start,
+                self.bytes_in,
+                self.bytes_out,
+            )
+        )
+
+
+class _NullSpan:
+    __slots__ = ()
+    bytes_in = bytes_out = 0
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def __setattr__(self, name, value) -> None:
+        pass  # `s.bytes_in = n` on a disabled span is a no-op
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Recorder:
+    """Collects samples and counters. Safe to use from worker threads:
+    `record` only appends to a list, which is atomic under the GIL, and the
+    read-modify-write updates (`count`, `merge`) hold a lock."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.samples: list[Sample] = []
+        self.counters: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def span(self, phase: str, key: str | None = None) -> Span | _NullSpan:
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, phase, key)
+
+    def record(
+        self,
+        phase: str,
+        seconds: float,
+        key: str | None = None,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+    ) -> None:
+        """Add a sample timed elsewhere (e.g. a response's `elapsed`)."""
+        if self.enabled:
+            self.samples.append(Sample(phase, key, seconds, bytes_in, bytes_out))
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += n
+
+    @contextmanager
+    def capture(self) -> Iterator[list[Sample]]:
+        """Record into a fresh list for the duration of the block.
+
+        For worker processes: they return the captured samples with their
+        result and the parent merges them back in with `merge`.
+        """
+        enabled, samples = self.enabled, self.samples
+        self.enabled, self.samples = True, []
+        try:
+            yield self.samples
+        finally:
+            self.enabled, self.samples = enabled, samples
+
+    def merge(self, samples: list[Sample]) -> None:
+        if self.enabled:
+            merged = [Sample(*s) for s in samples]
+            with self._lock:
+                self.samples.extend(merged)
+
+    def report(self, wall_seconds: float) -> dict:
+        with self._lock:
+            counters = dict(sorted(self.counters.items()))
+        by_phase: dict[str, list[Sample]] = defaultdict(list)
+        for sample in self.samples:
+            by_phase[sample.phase].append(sample)
+
+        phases = {}
+        slowest = {}
+        for phase, samples in sorted(by_phase.items()):
+            phases[phase] = summarize([s.seconds for s in samples])
+            phases[phase]["bytes_in"] = sum(s.bytes_in for s in samples)
+            phases[phase]["bytes_out"] = sum(s.bytes_out for s in samples)
+
+            by_key: dict[str, list[float]] = defaultdict(list)
+            for s in samples:
+                if s.key is not None:
+                    by_key[s.key].append(s.seconds)
+            if by_key:
+                ranked = sorted(by_key.items(), key=lambda kv: -sum(kv[1]))
+                slowest[phase] = [
+                    {
+                        "key": key,
+                        "count": len(times),
+                        "total": round(sum(times), 6),
+                        "max": round(max(times), 6),
+                    }
+                    for key, times in ranked[:SLOWEST_KEYS]
+                ]
+
+        return {
+            "wall_seconds": round(wall_seconds, 6),
+            "peak_rss_bytes": peak_rss(),
+            "phases": phases,
+            "slowest": slowest,
+            "counters": counters,
+        }
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Linearly interpolated percentile (q in 0–100) of a sorted list."""
+    if not sorted_values:
+        return 0.0
+    pos = (len(sorted_values) - 1) * q / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (
+        sorted_values[upper] - sorted_values[lower]
+    ) * (pos - lower)
+
+
+def summarize(seconds: list[float]) -> dict:
+    values = sorted(seconds)
+    total = sum(values)
+    return {
+        "count": len(values),
+        "total": round(total, 6),
+        "mean": round(total / len(values), 6) if values else 0.0,
+        "p50": round(percentile(values, 50), 6),
+        "p95": round(percentile(values, 95), 6),
+        "max": round(values[-1], 6) if values else 0.0,
+    }
+
+
+def peak_rss() -> int | None:
+    """Peak resident set size of this process in bytes, or None where the
+    platform has no `resource` module (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # macOS: bytes
+
+
+recorder = Recorder()
+span = recorder.span
+record = recorder.record
+count = recorder.count
+
+
+def instrument_session(session, phase: str = "http") -> None:
+    """Record every response of a requests.Session as a span keyed by
+    "METHOD host/path".
+
+    The duration is the response's `elapsed` (request sent → headers
+    parsed). Body bytes are only counted for non-streamed responses; code
+    that streams a body records it in its own span.
+    """
+
+    def hook(resp, *args, **kwargs):
+        if not recorder.enabled:
+            return resp
+        request = resp.request
+        url = urlsplit(request.url)
+        body = request.body or b""
+        bytes_in = 0
+        if not kwargs.get("stream"):
+            bytes_in = len(resp.content)
+        recorder.record(
+            phase,
+            resp.elapsed.total_seconds(),
+            key=f"{request.method} {url.netloc}{url.path}",
+            bytes_in=bytes_in,
+            bytes_out=len(body.encode() if isinstance(body, str) else body),
+        )
+        recorder.count(f"{phase}.status.{resp.status_code}")
+        return resp
+
+    session.hooks["response"].append(hook)
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────────
+
+
+def add_arguments(parser) -> None:
+    """Add --report, --report-file and --profile to an argparse parser."""
+    group = parser.add_argument_group("instrumentation")
+    group.add_argument(
+        "--report",
+        choices=REPORT_FORMATS,
+        default=None,
+        help="Print a per-phase timing summary (p50/p95, bytes, counts) at exit.",
+    )
+    group.add_argument(
+        "--report-file",
+        type=Path,
+        metavar="PATH",
+        default=None,
+        help="Write the --report summary to PATH instead of stderr.",
+    )
+    group.add_argument(
+        "--profile",
+        type=Path,
+        metavar="PATH",
+        default=None,
+        help="Write a cProfile dump of the main thread to PATH.",
+    )
+
+
+@contextmanager
+def reporting(args, script: str) -> Iterator[Recorder]:
+    """Enable recording for the block if args ask for a report or a profile,
+    and emit them when it exits (also on sys.exit)."""
+    report_format = getattr(args, "report", None)
+    profile_path = getattr(args, "profile", None)
+    if report_format is None and getattr(args, "report_file", None) is not None:
+        report_format = "json"
+    if report_format is None and profile_path is None:
+        yield recorder
+        return
+
+    recorder.enabled = True
+    profiler = cProfile.Profile() if profile_path is not None else None
+    started = time.perf_counter()
+    exit_code: int | str | None = 0
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield recorder
+    except SystemExit as e:
+        exit_code = e.code
+        raise
+    except BaseException as e:
+        exit_code = type(e).__name__
+        raise
+    finally:
+        wall = time.perf_counter() - started
+        if profiler is not None:
+            profiler.disable()
+            profile_path.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(profile_path)
+        if report_format is not None:
+            report = {
+                "script": script,
+                "argv": redact_argv(sys.argv[1:]),
+                "exit_code": exit_code,
+                **recorder.report(wall),
+            }
+            if profile_path is not None:
+                report["profile"] = str(profile_path)
+            write_report(report, args.report_file)
+        recorder.enabled = False
+
+
+def redact_argv(argv: list[str]) -> list[str]:
+    """argv with the values of SECRET_OPTIONS (or their argparse abbreviations)
+    replaced by "***", so reports can be shared as CI artifacts."""
+    redacted = []
+    secret_next = False
+    for arg in argv:
+        option, eq, _ = arg.partition("=")
+        is_secret = len(option) > 2 and any(
+            secret.startswith(option) for secret in SECRET_OPTIONS
+        )
+        if secret_next:
+            redacted.append("***")
+        elif is_secret and eq:
+            redacted.append(f"{option}=***")
+        else:
+            redacted.append(arg)
+        secret_next = is_secret and not eq and not secret_next
+    return redacted
+
+
+def write_report(report: dict, path: Path | None) -> None:
+    payload = json.dumps(report, indent=2)
+    if path is None:
+        print(payload, file=sys.stderr)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(payload + "\n")
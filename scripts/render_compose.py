@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+Render a ZaneOps compose file locally, without deploying it.
+
+Evaluates the `x-zane-env` template expressions ({{ generate_password | 32 }},
+{{ generate_domain }}, {{ network_alias | 'postgres' }}, ...) and the
+${VAR} substitutions the same way the server does on first deployment. Then
+prints the URLs, configs, volumes and env overrides that deploy_compose.py
+would show after a real deploy.
+
+Expressions and ${VAR} strings are each parsed once into a small AST and
+cached, so re-rendering a template (or many templates sharing values) only
+pays for evaluation.
+
+Usage:
+    python render_compose.py <compose_file> [--project P] [--env E] [--slug S]
+                                            [--seed N] [--set KEY=VALUE ...]
+                                            [--show-content]
+
+Example:
+    python render_compose.py ../src/content/templates/n8n/compose.yml --seed 1
+"""
+
+import argparse
+import base64
+import hashlib
+import random
+import re
+import secrets
+import sys
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+DEFAULT_ROOT_DOMAIN = "127-0-0-1.sslip.io"
+MIN_PASSWORD_LENGTH = 8
+ROUTE_LABEL_RE = re.compile(r"^zane\.http\.routes\.(\d+)\.(\w+)$")
+
+ADJECTIVES = (
+    "brave", "calm", "eager", "fancy", "gentle", "happy", "jolly", "kind",
+    "lively", "proud", "quick", "silly", "swift", "witty", "red", "blue",
+)  # fmt: skip
+ANIMALS = (
+    "cat", "dog", "fox", "owl", "lion", "bear", "wolf", "hawk", "seal", "yak",
+)  # fmt: skip
+NOUNS = (
+    "tree", "river", "mountain", "cloud", "stone", "field", "lake", "forest",
+)  # fmt: skip
+
+
+class TemplateError(ValueError):
+    """A template expression or ${VAR} reference that cannot be rendered."""
+
+
+# ── Template expressions: {{ function | argument }} ─────────────
+
+
+class Literal(NamedTuple):
+    text: str
+
+
+class Call(NamedTuple):
+    function: str
+    argument: int | str | None
+
+
+class Var(NamedTuple):
+    name: str
+    operator: str | None  # one of ":-", "-", ":+", "+", ":?", "?"
+    operand: tuple  # compiled nodes for the default / alternative / message
+
+
+_EXPRESSION_RE = re.compile(
+    r"\{\{\s*(?P<function>\w+)\s*"
+    r"(?:\|\s*(?P<argument>\d+|'[^']*'|\"[^\"]*\")\s*)?\}\}"
+)
+
+
+@lru_cache(maxsize=None)
+def compile_expression(value: str) -> tuple[Literal | Call, ...]:
+    """Parse a string with {{ ... }} expressions into Literal/Call nodes."""
+    nodes: list[Literal | Call] = []
+    pos = 0
+    for match in _EXPRESSION_RE.finditer(value):
+        if match.start() > pos:
+            nodes.append(Literal(value[pos : match.start()]))
+        function, raw = match["function"], match["argument"]
+        if function not in TEMPLATE_FUNCTIONS:
+            raise TemplateError(f"unknown template function {function!r} in {value!r}")
+        argument: int | str | None = None
+        if raw is not None:
+            argument = int(raw) if raw.isdigit() else raw[1:-1]
+        _check_argument(function, argument, value)
+        nodes.append(Call(function, argument))
+        pos = match.end()
+    rest = value[pos:]
+    if "{{" in rest:
+        raise TemplateError(f"malformed template expression in {value!r}")
+    if rest:
+        nodes.append(Literal(rest))
+    return tuple(nodes)
+
+
+def _check_argument(function: str, argument: int | str | None, value: str) -> None:
+    expected = TEMPLATE_FUNCTIONS[function][1]
+    if expected is None and argument is not None:
+        raise TemplateError(f"{function} takes no argument in {value!r}")
+    if expected is not None and not isinstance(argument, expected):
+        kind = "a length" if expected is int else "a quoted service name"
+        raise TemplateError(f"{function} needs {kind}, e.g. in {value!r}")
+    if function == "generate_password" and isinstance(argument, int):
+        if argument < MIN_PASSWORD_LENGTH or argument % 2:
+            raise TemplateError(
+                f"generate_password length must be even and >= {MIN_PASSWORD_LENGTH},"
+                f" got {argument}"
+            )
+
+
+class RenderContext:
+    """Values the server would take from the project, environment and stack.
+
+    With a `seed`, every generated value is reproducible, which makes previews
+    diffable; without one, values are cryptographically random like the
+    server's.
+    """
+
+    def __init__(
+        self,
+        project_slug: str = "compose",
+        env_slug: str = "production",
+        stack_slug: str = "stack",
+        root_domain: str = DEFAULT_ROOT_DOMAIN,
+        seed: int | None = None,
+    ) -> None:
+        self.project_slug = project_slug
+        self.env_slug = env_slug
+        self.stack_slug = stack_slug
+        self.root_domain = root_domain
+        self.random = random.Random(seed) if seed is not None else None
+        digest = hashlib.sha256(f"{project_slug}/{env_slug}/{stack_slug}".encode())
+        self.hash_prefix = digest.hexdigest()[:6]
+        self.network_alias_prefix = stack_slug
+
+    def token_bytes(self, n: int) -> bytes:
+        if self.random is None:
+            return secrets.token_bytes(n)
+        return self.random.randbytes(n)
+
+    def choice(self, options: tuple[str, ...]) -> str:
+        if self.random is None:
+            return secrets.choice(options)
+        return self.random.choice(options)
+
+    def number(self) -> int:
+        return int.from_bytes(self.token_bytes(1), "big") % 90 + 10
+
+
+def _generate_username(ctx: RenderContext, _: None) -> str:
+    return f"{ctx.choice(ADJECTIVES)}{ctx.choice(ANIMALS)}{ctx.number()}"
+
+
+def _generate_password(ctx: RenderContext, length: int) -> str:
+    return ctx.token_bytes(length // 2).hex()
+
+
+def _generate_base64(ctx: RenderContext, length: int) -> str:
+    return base64.b64encode(ctx.token_bytes(length)).decode()
+
+
+def _generate_slug(ctx: RenderContext, _: None) -> str:
+    return f"{ctx.choice(ADJECTIVES)}-{ctx.choice(NOUNS)}-{ctx.number()}"
+
+
+def _generate_domain(ctx: RenderContext, _: None) -> str:
+    suffix = ctx.token_bytes(3).hex()
+    return f"{ctx.project_slug}-{ctx.stack_slug}-{suffix}.{ctx.root_domain}"
+
+
+def _generate_uuid(ctx: RenderContext, _: None) -> str:
+    return str(uuid.UUID(bytes=ctx.token_bytes(16), version=4))
+
+
+def _generate_email(ctx: RenderContext, _: None) -> str:
+    return f"{_generate_username(ctx, None)}@example.com"
+
+
+def _network_alias(ctx: RenderContext, service: str) -> str:
+    return f"{ctx.network_alias_prefix}-{service}"
+
+
+def _global_alias(ctx: RenderContext, service: str) -> str:
+    return f"{ctx.hash_prefix}_{service}"
+
+
+# function name -> (implementation, expected argument type or None)
+TemplateFunction = Callable[[RenderContext, Any], str]
+TEMPLATE_FUNCTIONS: dict[str, tuple[TemplateFunction, type | None]] = {
+    "generate_username": (_generate_username, None),
+    "generate_password": (_generate_password, int),
+    "generate_base64": (_generate_base64, int),
+    "generate_slug": (_generate_slug, None),
+    "generate_domain": (_generate_domain, None),
+    "generate_uuid": (_generate_uuid, None),
+    "generate_email": (_generate_email, None),
+    "network_alias": (_network_alias, str),
+    "global_alias": (_global_alias, str),
+}
+
+
+def evaluate_expression(value: str, ctx: RenderContext) -> str:
+    parts = []
+    for node in compile_expression(value):
+        if isinstance(node, Literal):
+            parts.append(node.text)
+        else:
+            parts.append(TEMPLATE_FUNCTIONS[node.function][0](ctx, node.argument))
+    return "".join(parts)
+
+
+# ── ${VAR} interpolation ────────────────────────────────────────
+
+_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_OPERATORS = (":-", ":+", ":?", "-", "+", "?")
+
+
+@lru_cache(maxsize=None)
+def compile_interpolation(value: str) -> tuple[Literal | Var, ...]:
+    """Parse ${VAR}, ${VAR:-default} (nestable), ${VAR:+alt} and ${VAR:?msg}.
+
+    `$$` is an escape and, like a bare $VAR, is kept verbatim for Docker.
+    """
+    nodes, _ = _parse_interpolation(value, 0, nested=False)
+    return nodes
+
+
+def _parse_interpolation(
+    value: str, pos: int, nested: bool
+) -> tuple[tuple[Literal | Var, ...], int]:
+    nodes: list[Literal | Var] = []
+    text: list[str] = []
+    while pos < len(value):
+        char = value[pos]
+        if nested and char == "}":
+            break
+        if value.startswith("$$", pos):
+            text.append("$$")
+            pos += 2
+            continue
+        if not value.startswith("${", pos):
+            text.append(char)
+            pos += 1
+            continue
+
+        name = _NAME_RE.match(value, pos + 2)
+        if name is None:
+            raise TemplateError(f"invalid variable reference in {value!r}")
+        pos = name.end()
+        operator = next((op for op in _OPERATORS if value.startswith(op, pos)), None)
+        operand: tuple = ()
+        if operator is not None:
+            operand, pos = _parse_interpolation(value, pos + len(operator), nested=True)
+        if pos >= len(value) or value[pos] != "}":
+            raise TemplateError(f"unterminated ${{...}} in {value!r}")
+        pos += 1
+        if text:
+            nodes.append(Literal("".join(text)))
+            text = []
+        nodes.append(Var(name.group(), operator, operand))
+    if text:
+        nodes.append(Literal("".join(text)))
+    return tuple(nodes), pos
+
+
+class Interpolator:
+    """Expands ${VAR} references, looking names up with `lookup`.
+
+    Names referenced but never defined are collected in `missing` (they
+    expand to an empty string, as on the server).
+    """
+
+    def __init__(self, lookup: Callable[[str], str | None]) -> None:
+        self.lookup = lookup
+        self.missing: set[str] = set()
+
+    def expand(self, value: str) -> str:
+        if "${" not in value:
+            return value
+        return self._render(compile_interpolation(value))
+
+    def _render(self, nodes: tuple) -> str:
+        parts = []
+        for node in nodes:
+            if isinstance(node, Literal):
+                parts.append(node.text)
+                continue
+            current = self.lookup(node.name)
+            is_set = current is not None
+            is_empty = not current
+            op = node.operator
+            if op in (":-", "-") and (is_empty if op == ":-" else not is_set):
+                parts.append(self._render(node.operand))
+            elif op in (":+", "+"):
+                use_alt = not is_empty if op == ":+" else is_set
+                parts.append(self._render(node.operand) if use_alt else "")
+            elif op in (":?", "?") and (is_empty if op == ":?" else not is_set):
+                message = self._render(node.operand) or "required variable is not set"
+                raise TemplateError(f"{node.name}: {message}")
+            else:
+                if not is_set:
+                    self.missing.add(node.name)
+                parts.append(current or "")
+        return "".join(parts)
+
+
+def resolve_env(
+    env: dict[str, Any], ctx: RenderContext, overrides: dict[str, str] | None = None
+) -> dict[str, str]:
+    """Evaluate `x-zane-env`: template expressions first, then ${VAR} references
+    between the entries (in any order, cycles are an error).
+
+    `overrides` replace entries by name, like a stack's saved env overrides.
+    """
+    raw = {key: str(value) for key, value in (env or {}).items()}
+    for key, value in raw.items():
+        raw[key] = evaluate_expression(value, ctx)
+    raw.update(overrides or {})
+
+    resolved: dict[str, str] = {}
+    resolving: set[str] = set()
+
+    def lookup(name: str) -> str | None:
+        if name in resolved or name not in raw:
+            return resolved.get(name)
+        if name in resolving:
+            raise TemplateError(f"x-zane-env variable {name} references itself")
+        resolving.add(name)
+        resolved[name] = interpolator.expand(raw[name])
+        resolving.discard(name)
+        return resolved[name]
+
+    interpolator = Interpolator(lookup)
+    return {key: lookup(key) or "" for key in raw}
+
+
+# ── Compose rendering ───────────────────────────────────────────
+
+
+def _expand_tree(node: Any, interpolator: Interpolator) -> Any:
+    if isinstance(node, str):
+        return interpolator.expand(node)
+    if isinstance(node, dict):
+        return {key: _expand_tree(value, interpolator) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_expand_tree(item, interpolator) for item in node]
+    return node
+
+
+def _labels(service: dict) -> dict[str, str]:
+    labels: dict[str, str] = {}
+    for raw in ((service.get("deploy") or {}).get("labels"), service.get("labels")):
+        if isinstance(raw, dict):
+            labels.update({str(k): str(v) for k, v in raw.items()})
+        elif isinstance(raw, list):
+            for item in raw:
+                key, _, value = str(item).partition("=")
+                labels[key] = value
+    return labels
+
+
+def _routes(service: dict) -> list[dict]:
+    routes: dict[int, dict] = {}
+    for label, value in _labels(service).items():
+        match = ROUTE_LABEL_RE.match(label)
+        if match:
+            routes.setdefault(int(match[1]), {})[match[2]] = value
+    return [
+        {
+            "domain": route.get("domain", ""),
+            "base_path": route.get("base_path", "/"),
+            "port": route.get("port", ""),
+            "strip_prefix": route.get("strip_prefix", "true") == "true",
+        }
+        for _, route in sorted(routes.items())
+    ]
+
+
+def render_compose(
+    content: str, ctx: RenderContext, overrides: dict[str, str] | None = None
+) -> dict:
+    """Render compose content into a stack_snapshot-shaped dict.
+
+    Keys match what the API returns after a deploy (urls, configs,
+    computed_content, env_overrides), plus `missing`: ${VAR} names that were
+    referenced but never defined.
+    """
+    spec = yaml.load(content, Loader=SafeLoader)
+    if not isinstance(spec, dict):
+        raise TemplateError("compose file must be a YAML mapping")
+
+    env = resolve_env(spec.pop("x-zane-env", None) or {}, ctx, overrides)
+    interpolator = Interpolator(env.get)
+    computed = _expand_tree(spec, interpolator)
+
+    urls = {}
+    for name, service in (computed.get("services") or {}).items():
+        routes = _routes(service or {})
+        if routes:
+            urls[name] = routes
+
+    configs = {
+        name: {"content": config.get("content", ""), "version": 1}
+        for name, config in (computed.get("configs") or {}).items()
+        if isinstance(config, dict) and "content" in config
+    }
+    computed_content = yaml.dump(
+        computed, Dumper=SafeDumper, sort_keys=False, allow_unicode=True
+    )
+    return {
+        "urls": urls,
+        "configs": configs,
+        "computed_content": computed_content,
+        "env_overrides": [{"key": k, "value": v} for k, v in env.items()],
+        "missing": sorted(interpolator.missing),
+    }
+
+
+def print_stack_snapshot(snapshot: dict) -> None:
+    """Print the URLs, configs, volumes and env overrides of a stack snapshot.
+
+    Shared by deploy_compose.py (server snapshots) and local previews.
+    """
+    urls = snapshot.get("urls", {})
+    if urls:
+        print("\n--- URLs ---")
+        for service_name, routes in urls.items():
+            for route in routes:
+                domain = route.get("domain", "")
+                base_path = route.get("base_path", "/")
+                port = route.get("port", "")
+                print(f"  {service_name}: http://{domain}{base_path} -> port {port}")
+
+    configs = snapshot.get("configs", {})
+    if configs:
+        print("\n--- Configs ---")
+        for config_name in configs.keys():
+            print(f"  {config_name}")
+
+    # Extract volumes from computed_content if available
+    computed_content = snapshot.get("computed_content")
+    if computed_content:
+        try:
+            computed_spec = yaml.load(computed_content, Loader=SafeLoader)
+            volumes = computed_spec.get("volumes", {})
+            if volumes:
+                print("\n--- Volumes ---")
+                for volume_name in volumes.keys():
+                    print(f"  {volume_name}")
+        except yaml.YAMLError:
+            pass
+
+    env_overrides = snapshot.get("env_overrides", [])
+    if env_overrides:
+        print("\n--- Environment Overrides ---")
+        for override in env_overrides:
+            print(f"    {override['key']}={override['value']}")
+
+
+def print_preview(slug: str, snapshot: dict, show_content: bool = False) -> None:
+    """Print a rendered snapshot the way deploy_compose.py prints a deployment."""
+    print(f"Preview of stack '{slug}' (rendered locally, nothing deployed)")
+    print_stack_snapshot(snapshot)
+    if snapshot["missing"]:
+        print("\n--- Undefined Variables (expanded to '') ---")
+        for name in snapshot["missing"]:
+            print(f"    ${{{name}}}")
+    if show_content:
+        print("\n--- Computed Content ---")
+        print(snapshot["computed_content"])
+
+
+def parse_assignments(items: list[str]) -> dict[str, str]:
+    values = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {item!r}")
+        values[key] = value
+    return values
+
+
+def cli(argv: list[str] | None = None, prog: str | None = None) -> None:
+    """Command-line entry point, also run as `zane-templates <command>`."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Render a compose file's x-zane-env and ${VAR}s locally",
+    )
+    parser.add_argument("file", type=Path, help="Path to the compose YAML file")
+    parser.add_argument("--project", "-p", default="compose", help="Project slug")
+    parser.add_argument("--env", "-e", default="production", help="Environment slug")
+    parser.add_argument(
+        "--slug", "-s", help="Stack slug (default: file or template directory name)"
+    )
+    parser.add_argument(
+        "--root-domain",
+        default=DEFAULT_ROOT_DOMAIN,
+        help="Root domain used by generate_domain",
+    )
+    parser.add_argument(
+        "--seed", type=int, help="Make generated values reproducible"
+    )
+    parser.add_argument(
+        "--set",
+        metavar="KEY=VALUE",
+        nargs="*",
+        default=[],
+        help="Override x-zane-env entries",
+    )
+    parser.add_argument(
+        "--show-content", action="store_true", help="Also print the computed compose"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.file.exists():
+        print(f"Error: File not found: {args.file}", file=sys.stderr)
+        sys.exit(1)
+    slug = args.slug or (
+        args.file.parent.name
+        if args.file.stem in ("compose", "docker-compose")
+        else args.file.stem
+    )
+    ctx = RenderContext(args.project, args.env, slug, args.root_domain, args.seed)
+    try:
+        snapshot = render_compose(
+            args.file.read_text(), ctx, parse_assignments(args.set)
+        )
+    except (TemplateError, yaml.YAMLError, argparse.ArgumentTypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print_preview(slug, snapshot, args.show_content)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Sync the template search index into Typesense, sending only what changed.
+
+Unlike integrations/seed-typesense.ts, which recreates the collection and
+re-imports every document, this:
+
+  1. hashes each document of search-index.json (rebuilt from the templates
+     by build_search_index.py first, unless --index points elsewhere),
+  2. compares against the hashes already stored in the collection (each
+     document carries a non-indexed `content_hash` field), or against a local
+     manifest with --manifest,
+  3. upserts only new or changed documents as batched JSONL imports and
+     deletes the documents of templates that no longer exist.
+
+Usage:
+    python scripts/sync_typesense.py [--index PATH] [--collection NAME]
+                                     [--batch-size N] [--concurrency N]
+                                     [--manifest [PATH]] [--dry-run]
+
+Connection settings come from TYPESENSE_HOST, TYPESENSE_PORT,
+TYPESENSE_PROTOCOL and TYPESENSE_API_KEY (same defaults as the site).
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from build_search_index import OUTPUT_DIR, SEARCH_INDEX_FILE, build
+
+# requests and dotenv are imported when a sync starts, so --help is quick.
+if TYPE_CHECKING:
+    import requests
+
+COLLECTION_NAME = "templates"
+HASH_FIELD = "content_hash"
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_CONCURRENCY = 2
+REQUEST_TIMEOUT = (5.0, 60.0)
+MANIFEST_FILE = Path(__file__).parent / ".dokploy-cache" / "typesense-sync.json"
+
+# Same schema as integrations/seed-typesense.ts, plus the stored hash.
+COLLECTION_FIELDS = [
+    {"name": "id", "type": "string"},
+    {"name": "name", "type": "string", "sort": True},
+    {"name": "description", "type": "string"},
+    {"name": "tags", "type": "string[]"},
+    {"name": "url", "type": "string", "index": False},
+    {"name": "logoUrl", "type": "string", "index": False, "optional": True},
+    {"name": HASH_FIELD, "type": "string", "index": False, "optional": True},
+]
+
+
+class Colors:
+    GREEN = "\033[92m"
+    BLUE = "\033[94m"
+    YELLOW = "\033[33m"
+    RED = "\033[91m"
+    GREY = "\033[90m"
+    ENDC = "\033[0m"
+
+
+def document_hash(doc: dict) -> str:
+    """Hash of a document's content, independent of key order."""
+    content = {k: v for k, v in doc.items() if k != HASH_FIELD}
+    canonical = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def prepare_documents(docs: list[dict]) -> dict[str, dict]:
+    """{id: document} with empty logoUrl dropped (as seed-typesense.ts does)
+    and content_hash set."""
+    prepared = {}
+    for doc in docs:
+        doc = {k: v for k, v in doc.items() if k != "logoUrl" or v}
+        doc[HASH_FIELD] = document_hash(doc)
+        prepared[doc["id"]] = doc
+    return prepared
+
+
+class TypesenseClient:
+    """The few Typesense endpoints the sync needs, over one pooled session."""
+
+    def __init__(self, base_url: str, api_key: str, pool_size: int = 10) -> None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        self.session.headers["X-TYPESENSE-API-KEY"] = api_key
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        return self.session.request(method, f"{self.base_url}{path}", **kwargs)
+
+    def collection_exists(self, name: str) -> bool:
+        resp = self._request("GET", f"/collections/{name}")
+        if resp.status_code == 404:
+            return False
+        resp.raise_for_status()
+        return True
+
+    def create_collection(self, name: str) -> None:
+        resp = self._request(
+            "POST", "/collections", json={"name": name, "fields": COLLECTION_FIELDS}
+        )
+        resp.raise_for_status()
+
+    def export_hashes(self, name: str) -> dict[str, str | None]:
+        """{id: content_hash} of every stored document (None if it has none)."""
+        resp = self._request(
+            "GET",
+            f"/collections/{name}/documents/export",
+            params={"include_fields": f"id,{HASH_FIELD}"},
+            stream=True,
+        )
+        resp.raise_for_status()
+        hashes: dict[str, str | None] = {}
+        for line in resp.iter_lines():
+            if line:
+                doc = json.loads(line)
+                hashes[doc["id"]] = doc.get(HASH_FIELD)
+        return hashes
+
+    def import_batch(self, name: str, docs: list[dict]) -> list[dict]:
+        """Upsert docs as one JSONL import. Returns the failed result lines."""
+        body = "\n".join(json.dumps(doc, ensure_ascii=False) for doc in docs)
+        resp = self._request(
+            "POST",
+            f"/collections/{name}/documents/import",
+            params={"action": "upsert"},
+            data=body.encode("utf-8"),
+            headers={"Content-Type": "text/plain"},
+        )
+        resp.raise_for_status()
+        results = [json.loads(line) for line in resp.text.splitlines() if line]
+        return [r for r in results if not r.get("success")]
+
+    def delete_batch(self, name: str, ids: list[str]) -> int:
+        """Delete documents by id. Returns how many were deleted."""
+        quoted = ",".join(f"`{doc_id}`" for doc_id in ids)
+        resp = self._request(
+            "DELETE",
+            f"/collections/{name}/documents",
+            params={"filter_by": f"id:[{quoted}]"},
+        )
+        resp.raise_for_status()
+        return resp.json().get("num_deleted", 0)
+
+
+class SyncManifest:
+    """Local record of the hashes last synced per collection, so the sync
+    can skip exporting them. Only trustworthy if nothing else writes to the
+    collection."""
+
+    def __init__(self, path: Path, key: str) -> None:
+        self.path = path
+        self.key = key
+        try:
+            self._entries: dict[str, dict] = json.loads(path.read_text())
+        except (OSError, ValueError):
+            self._entries = {}
+        self.hashes: dict[str, str] = self._entries.get(key, {})
+
+    def save(self) -> None:
+        self._entries[self.key] = self.hashes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._entries, indent=2, sort_keys=True))
+
+
+def plan_sync(
+    docs: dict[str, dict], remote: dict[str, str | None]
+) -> tuple[list[dict], list[str]]:
+    """(documents to upsert, ids to delete), both in id order."""
+    upserts = [
+        doc
+        for doc_id, doc in sorted(docs.items())
+        if remote.get(doc_id) != doc[HASH_FIELD]
+    ]
+    deletes = sorted(set(remote) - set(docs))
+    return upserts, deletes
+
+
+def batched(items: list, size: int) -> list[list]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def load_documents(index_path: Path) -> list[dict]:
+    """Read the index, rebuilding the default one so template edits are synced.
+    build() leaves an unchanged file untouched, so this costs one walk of the
+    templates; a custom --index is only built when missing."""
+    default = OUTPUT_DIR / SEARCH_INDEX_FILE
+    if index_path.resolve() == default.resolve() or not index_path.exists():
+        build(index_path.parent)
+    return json.loads(index_path.read_text(encoding="utf-8"))
+
+
+def main(
+    index_path: Path,
+    collection: str,
+    base_url: str,
+    api_key: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    manifest_path: Path | None = None,
+    dry_run: bool = False,
+) -> None:
+    import requests
+
+    C = Colors
+    docs = prepare_documents(load_documents(index_path))
+    client = TypesenseClient(base_url, api_key, pool_size=max(10, concurrency))
+    manifest = None
+    if manifest_path is not None:
+        manifest = SyncManifest(manifest_path, f"{base_url}/{collection}")
+
+    try:
+        exists = client.collection_exists(collection)
+        created = not exists and not dry_run
+        if created:
+            client.create_collection(collection)
+        if not exists:
+            remote: dict[str, str | None] = {}
+        elif manifest is not None:
+            remote = dict(manifest.hashes)
+        else:
+            remote = client.export_hashes(collection)
+        upserts, deletes = plan_sync(docs, remote)
+
+        print(
+            f"{C.BLUE}Typesense{C.ENDC} {base_url} · {collection}"
+            f"{' (created)' if created else ''}: {len(docs)} documents,"
+            f" {C.GREEN}{len(upserts)} to upsert{C.ENDC},"
+            f" {C.YELLOW}{len(deletes)} to delete{C.ENDC},"
+            f" {C.GREY}{len(docs) - len(upserts)} unchanged{C.ENDC}"
+        )
+        if dry_run:
+            for doc in upserts:
+                print(f"  {C.GREEN}↑{C.ENDC}  {doc['id']}")
+            for doc_id in deletes:
+                print(f"  {C.YELLOW}✗{C.ENDC}  {doc_id}")
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            import_results = pool.map(
+                lambda batch: client.import_batch(collection, batch),
+                batched(upserts, batch_size),
+            )
+            delete_results = pool.map(
+                lambda ids: client.delete_batch(collection, ids),
+                batched(deletes, batch_size),
+            )
+            failures = [f for failed in import_results for f in failed]
+            deleted = sum(delete_results)
+    except requests.RequestException as e:
+        print(f"{C.RED}Error:{C.ENDC} {e}", file=sys.stderr)
+        sys.exit(1)
+
+    failed_ids = set()
+    for failure in failures:
+        doc_id = json.loads(failure.get("document", "{}")).get("id", "?")
+        failed_ids.add(doc_id)
+        print(
+            f"  {C.RED}✗{C.ENDC}  {doc_id}: {failure.get('error')}", file=sys.stderr
+        )
+
+    if manifest is not None:
+        manifest.hashes = {
+            doc_id: doc[HASH_FIELD] if doc_id not in failed_ids else remote[doc_id]
+            for doc_id, doc in docs.items()
+            if doc_id not in failed_ids or remote.get(doc_id)
+        }
+        manifest.save()
+
+    print(
+        f"Upserted {len(upserts) - len(failed_ids)}, deleted {deleted},"
+        f" failed {len(failed_ids)}"
+    )
+    if failed_ids:
+        sys.exit(1)
+
+
+def cli(argv: list[str] | None = None, prog: str | None = None) -> None:
+    """Command-line entry point, also run as `zane-templates <command>`."""
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__)
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=OUTPUT_DIR / SEARCH_INDEX_FILE,
+        help=(
+            "search-index.json to sync (default: rebuilt from the templates"
+            " first; a custom path is only built if missing)."
+        ),
+    )
+    parser.add_argument("--collection", default=COLLECTION_NAME)
+    parser.add_argument(
+        "--url", help="Typesense base URL (default from TYPESENSE_* variables)."
+    )
+    parser.add_argument("--api-key", help="API key (default: $TYPESENSE_API_KEY).")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Documents per JSONL import (and ids per delete).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Import/delete requests in flight at once.",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        nargs="?",
+        const=MANIFEST_FILE,
+        default=None,
+        help=(
+            "Compare against a local manifest of synced hashes instead of"
+            " exporting them from the collection."
+        ),
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print what would be upserted and deleted without changing anything.",
+    )
+    args = parser.parse_args(argv)
+
+    import dotenv
+
+    dotenv.load_dotenv()
+    env = os.environ.get
+    if args.url is None:
+        args.url = (
+            f"{env('TYPESENSE_PROTOCOL', 'http')}://"
+            f"{env('TYPESENSE_HOST', 'localhost')}:{env('TYPESENSE_PORT', '8108')}"
+        )
+    if args.api_key is None:
+        args.api_key = env("TYPESENSE_API_KEY", "typesense")
+    main(
+        args.index,
+        args.collection,
+        args.url,
+        args.api_key,
+        batch_size=max(1, args.batch_size),
+        concurrency=args.concurrency,
+        manifest_path=args.manifest,
+        dry_run=args.dry_run,
+    )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,62 @@
+"""Tests for fetch_dokploy_data.py. Run with `python -m pytest scripts`."""
+
+import hashlib
+import io
+
+import pytest
+
+from fetch_dokploy_data import LogoNormalizer, MatchIndex, RelevantEntries, find_match
+
+
+def entry(item_id, name):
+    return {"id": item_id, "name": name}
+
+
+def test_find_match_is_exact_only():
+    index = [entry("plausible", "Plausible Analytics"), entry("n8n-io", "N8N Cloud")]
+    lookup = MatchIndex(index)
+
+    assert find_match("plausible", lookup) is index[0]
+    assert find_match("Plausible", lookup) is index[0]
+    assert find_match("n8n", lookup) is None
+    assert [e["id"] for e, _ in lookup.search("n8n", limit=1)] == ["n8n-io"]
+
+
+def test_relevant_entries_keeps_suggestions_only_when_asked():
+    index = [entry("plausible", "Plausible"), entry("n8n-io", "N8N Cloud")]
+    for limit, kept in ((0, ["plausible"]), (1, ["plausible", "n8n-io"])):
+        relevant = RelevantEntries(["plausible", "n8n"], limit=limit)
+        for item in index:
+            relevant.add(item)
+        assert [e["id"] for e in relevant.entries()] == kept
+
+
+def write_logo(path, data):
+    path.write_bytes(data)
+    return path, hashlib.sha256(data).hexdigest()
+
+
+def test_normalize_resizes_raster(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    buf = io.BytesIO()
+    Image.new("RGB", (512, 512), "red").save(buf, format="PNG")
+    source, sha256 = write_logo(tmp_path / "logo.png", buf.getvalue())
+    normalizer = LogoNormalizer(tmp_path / "normalized", max_px=64)
+
+    out, out_sha256 = normalizer.normalize(source, sha256, ".png")
+
+    assert out != source
+    assert out_sha256 == hashlib.sha256(out.read_bytes()).hexdigest()
+    with Image.open(out) as img:
+        assert img.size == (64, 64)
+
+
+@pytest.mark.parametrize("suffix", [".png", ".jpg", ".webp"])
+def test_normalize_keeps_garbage_raster(tmp_path, suffix):
+    pytest.importorskip("PIL.Image")
+    source, sha256 = write_logo(tmp_path / f"logo{suffix}", b"<html>404</html>")
+    normalizer = LogoNormalizer(tmp_path / "normalized", max_px=64)
+
+    assert normalizer.normalize(source, sha256, suffix) == (source, sha256)
+    assert normalizer.bytes_before == normalizer.bytes_after == source.stat().st_size
+    assert not (tmp_path / "normalized").exists()
@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+Validate every template under src/content/templates/.
+
+Python port of validate-templates.ts, so the Python tooling can refuse to
+apply or deploy broken templates. Checks, per template:
+
+  compose.yml
+    - parses as YAML, `services` is a non-empty mapping
+    - every service has an `image` (build from source is not supported)
+    - `x-zane-env` values are strings, numbers or booleans, and their
+      {{ ... }} expressions are known template functions with valid arguments
+    - bind volumes use absolute source paths
+    - `zane.http.routes.N.*` labels: sequential indices from 0, a domain,
+      an integer port and a "true"/"false" strip_prefix
+    - no two configs of a service share a target; top-level configs use
+      `content`, not `file`
+  index.md
+    - frontmatter parses; docsUrl, websiteUrl and githubUrl are URLs
+    - logoUrl exists under public/
+
+compose.yml and index.md are parsed in a process pool (--jobs). Results are
+cached in scripts/.dokploy-cache/validation.json, keyed by a hash of both
+files and of the validation rules, so a warm run only hashes files and
+stats logos.
+
+Usage:
+    python scripts/validate_templates.py [--jobs N] [--no-cache] [template ...]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import yaml
+
+from render_compose import TemplateError, compile_expression
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+
+SCRIPTS_DIR = Path(__file__).parent
+REPO_ROOT = SCRIPTS_DIR.parent
+TEMPLATES_DIR = REPO_ROOT / "src" / "content" / "templates"
+PUBLIC_DIR = REPO_ROOT / "public"
+VALIDATION_CACHE_FILE = SCRIPTS_DIR / ".dokploy-cache" / "validation.json"
+
+REQUIRED_URL_FIELDS = ("docsUrl", "websiteUrl", "githubUrl")
+ROUTE_LABEL_RE = re.compile(r"^zane\.http\.routes\.(\d+)\.(.+)$")
+_FRONTMATTER_RE = re.compile(r"^---\r?\n(.*?)\r?\n---", re.DOTALL)
+_URL_SCHEME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.\-]*$")
+# Fewer files than this are validated in-process: a pool costs more to start.
+MIN_POOL_BATCH = 8
+
+
+class Colors:
+    GREEN = "\033[92m"
+    BLUE = "\033[94m"
+    YELLOW = "\033[33m"
+    RED = "\033[91m"
+    GREY = "\033[90m"
+    ENDC = "\033[0m"
+
+
+def _rules_hash() -> str:
+    """Fingerprint of the validation code: cached results die with rule changes."""
+    digest = hashlib.sha256()
+    for path in (Path(__file__), SCRIPTS_DIR / "render_compose.py"):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+# ── compose.yml ────────────────────────────────────────────────────────────────
+
+
+def _is_integer(value: str) -> bool:
+    """Mirror of JS Number.isInteger(Number(value)) for label values."""
+    text = value.replace("_", "").strip()
+    try:
+        return float(text).is_integer()
+    except ValueError:
+        pass
+    try:
+        int(text, 0)
+    except ValueError:
+        return False
+    return True
+
+
+def _validate_route_labels(service: str, labels: dict) -> list[str]:
+    routes: dict[int, dict[str, str]] = {}
+    for key, value in labels.items():
+        match = ROUTE_LABEL_RE.match(str(key))
+        if match:
+            routes.setdefault(int(match[1]), {})[match[2]] = _label_str(value)
+    if not routes:
+        return []
+
+    errors = []
+    indices = sorted(routes)
+    if indices != list(range(len(indices))):
+        found = ", ".join(map(str, indices))
+        errors.append(
+            f"service '{service}': route indices must be sequential starting"
+            f" from 0 (found {found})"
+        )
+    for index, route in routes.items():
+        if not route.get("domain"):
+            errors.append(
+                f"service '{service}': route {index} is missing required 'domain'"
+            )
+        port = route.get("port")
+        if not port:
+            errors.append(
+                f"service '{service}': route {index} is missing required 'port'"
+            )
+        elif not port.startswith("${") and not _is_integer(port):
+            errors.append(
+                f"service '{service}': route {index} has invalid port '{port}'"
+                " (must be a valid integer)"
+            )
+        strip_prefix = route.get("strip_prefix")
+        if strip_prefix is not None and strip_prefix not in ("true", "false"):
+            errors.append(
+                f"service '{service}': route {index} has invalid strip_prefix"
+                f" '{strip_prefix}' (must be \"true\" or \"false\")"
+            )
+    return errors
+
+
+def _label_str(value) -> str:
+    """String(value) as JavaScript would render a YAML scalar."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    return str(value)
+
+
+def _validate_service(name: str, service: dict) -> list[str]:
+    errors = []
+    for volume in service.get("volumes") or []:
+        source = None
+        if isinstance(volume, str):
+            parts = volume.split(":")
+            if len(parts) >= 2 and parts[0].startswith("."):
+                source = parts[0]
+        elif isinstance(volume, dict) and volume.get("type") == "bind":
+            raw = volume.get("source")
+            if raw is not None and not posixpath.isabs(str(raw)):
+                source = raw
+        if source is not None:
+            errors.append(
+                f"service '{name}' has a bind volume with relative source path"
+                f" '{source}'. Only absolute paths are supported for bind mounts."
+            )
+
+    labels = (service.get("deploy") or {}).get("labels")
+    if isinstance(labels, dict):
+        errors += _validate_route_labels(name, labels)
+
+    target_sources: dict[str, list[str]] = {}
+    for config in service.get("configs") or []:
+        if isinstance(config, str):
+            source, target = config, f"/{config}"
+        elif isinstance(config, dict):
+            source = config.get("source") or ""
+            target = config.get("target") or f"/{source}"
+        else:
+            continue
+        sources = target_sources.setdefault(target, [])
+        sources.append(source)
+        if len(sources) > 1:
+            quoted = " and ".join(f"'{s}'" for s in sources)
+            errors.append(
+                f"service '{name}' has two configs {quoted} pointing to the"
+                f" same target '{target}'."
+            )
+    return errors
+
+
+def validate_compose(text: str) -> list[str]:
+    """Return the error messages for one compose.yml (empty if valid)."""
+    try:
+        spec = yaml.load(text, Loader=SafeLoader)
+    except yaml.YAMLError as e:
+        return [f"invalid YAML: {e}"]
+    if not isinstance(spec, dict):
+        return ["compose file must be a YAML mapping"]
+
+    errors = []
+    env = spec.get("x-zane-env")
+    if env is not None and not isinstance(env, dict):
+        errors.append("x-zane-env: must be a mapping")
+    for key, value in (env if isinstance(env, dict) else {}).items():
+        if not isinstance(value, (str, int, float, bool)):
+            errors.append(
+                f"x-zane-env.{key}: must be a string, number or boolean,"
+                f" got {type(value).__name__}"
+            )
+        elif isinstance(value, str):
+            try:
+                compile_expression(value)
+            except TemplateError as e:
+                errors.append(f"x-zane-env.{key}: {e}")
+
+    services = spec.get("services")
+    if not isinstance(services, dict) or not services:
+        errors.append("services: `services` must be a non-empty object")
+        return errors
+    for name, service in services.items():
+        if not isinstance(service, dict):
+            errors.append(f"services.{name}: must be an object")
+        elif not isinstance(service.get("image"), str):
+            errors.append(
+                f"services.{name}.image: must have an 'image' field."
+                " Build from source is not supported."
+            )
+    configs = spec.get("configs")
+    if configs is not None and not isinstance(configs, dict):
+        errors.append("configs: must be an object")
+    if errors:
+        return errors
+
+    for name, service in services.items():
+        errors += _validate_service(name, service)
+    for name, config in (configs or {}).items():
+        if isinstance(config, dict) and "file" in config:
+            errors.append(
+                f"configs.{name}: Additional property 'file' is not allowed,"
+                " please use 'content' instead."
+            )
+    return errors
+
+
+# ── index.md ───────────────────────────────────────────────────────────────────
+
+
+def _is_url(value) -> bool:
+    if not isinstance(value, str):
+        return False
+    try:
+        parts = urlsplit(value)
+    except ValueError:
+        return False
+    if not _URL_SCHEME_RE.match(parts.scheme):
+        return False
+    return bool(parts.netloc or parts.path)
+
+
+def validate_index(text: str) -> tuple[list[str], str | None]:
+    """Return (errors, logoUrl) for one index.md.
+
+    The logo's existence is checked separately (see check_logo) so that the
+    result only depends on the file content and can be cached.
+    """
+    match = _FRONTMATTER_RE.match(text)
+    if match is None:
+        return [], None
+    try:
+        frontmatter = yaml.load(match.group(1), Loader=SafeLoader) or {}
+    except yaml.YAMLError as e:
+        return [f"invalid frontmatter YAML: {e}"], None
+    if not isinstance(frontmatter, dict):
+        return ["invalid frontmatter YAML: expected a mapping"], None
+
+    errors = [
+        f"frontmatter {field}: must be a valid URL"
+        for field in REQUIRED_URL_FIELDS
+        if not _is_url(frontmatter.get(field))
+    ]
+    logo_url = frontmatter.get("logoUrl")
+    return errors, logo_url if isinstance(logo_url, str) else None
+
+
+def check_logo(logo_url: str | None) -> list[str]:
+    if logo_url is None or (PUBLIC_DIR / logo_url.lstrip("/")).is_file():
+        return []
+    return [f"logoUrl '{logo_url}' does not exist in public/"]
+
+
+# ── Templates ──────────────────────────────────────────────────────────────────
+
+
+def _validate_contents(
+    compose_text: str | None, index_text: str | None
+) -> tuple[list[str], str | None]:
+    """Content-only checks for one template: (errors, logoUrl). Cacheable."""
+    if compose_text is None:
+        return ["compose.yml: missing compose.yml"], None
+    errors = [f"compose.yml: {m}" for m in validate_compose(compose_text)]
+    # Like validate-templates.ts, index.md is only checked once compose.yml is.
+    if errors or index_text is None:
+        return errors, None
+    index_errors, logo_url = validate_index(index_text)
+    return errors + [f"index.md: {message}" for message in index_errors], logo_url
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+class ValidationCache:
+    """Validation results keyed by a hash of the template files and the rules."""
+
+    def __init__(self, path: Path = VALIDATION_CACHE_FILE) -> None:
+        self.path = path
+        self.rules = _rules_hash()
+        self._dirty = False
+        self._entries: dict[str, dict] = {}
+        try:
+            data = json.loads(path.read_text())
+            if data.get("rules") == self.rules:
+                self._entries = data["templates"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    @staticmethod
+    def key(compose_text: str | None, index_text: str | None) -> str:
+        digest = hashlib.sha256()
+        for text in (compose_text, index_text):
+            digest.update(b"\0" if text is None else b"\1" + text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, slug: str, key: str) -> tuple[list[str], str | None] | None:
+        entry = self._entries.get(slug)
+        if entry is None or entry["key"] != key:
+            return None
+        return entry["errors"], entry["logoUrl"]
+
+    def put(
+        self, slug: str, key: str, errors: list[str], logo_url: str | None
+    ) -> None:
+        self._entries[slug] = {"key": key, "errors": errors, "logoUrl": logo_url}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache if anything changed since loading."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"rules": self.rules, "templates": self._entries})
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._dirty = False
+
+
+def validate_templates(
+    slugs: list[str] | None = None,
+    jobs: int | None = None,
+    cache: ValidationCache | None = None,
+    index_texts: dict[str, str] | None = None,
+) -> dict[str, list[str]]:
+    """Validate templates and return {slug: errors} (empty list if valid).
+
+    slugs:       templates to check (default: every template directory).
+    jobs:        worker processes for cache misses (default: CPU count).
+    cache:       results cache; None validates everything from scratch.
+    index_texts: index.md contents to validate instead of the files on disk,
+                 e.g. the frontmatter apply_dokploy_data.py is about to write.
+    """
+    if slugs is None:
+        slugs = sorted(p.name for p in TEMPLATES_DIR.iterdir() if p.is_dir())
+    index_texts = index_texts or {}
+
+    contents: dict[str, tuple[str | None, str | None]] = {}
+    results: dict[str, tuple[list[str], str | None]] = {}
+    keys: dict[str, str] = {}
+    for slug in slugs:
+        directory = TEMPLATES_DIR / slug
+        compose_text = _read(directory / "compose.yml")
+        index_text = index_texts.get(slug)
+        if index_text is None:
+            index_text = _read(directory / "index.md")
+        keys[slug] = ValidationCache.key(compose_text, index_text)
+        cached = cache.get(slug, keys[slug]) if cache is not None else None
+        if cached is not None:
+            results[slug] = cached
+        else:
+            contents[slug] = (compose_text, index_text)
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(contents) >= MIN_POOL_BATCH:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            outcomes = list(
+                pool.map(
+                    _validate_contents,
+                    [compose_text for compose_text, _ in contents.values()],
+                    [index_text for _, index_text in contents.values()],
+                    chunksize=max(1, len(contents) // (jobs * 4)),
+                )
+            )
+    else:
+        outcomes = [_validate_contents(*pair) for pair in contents.values()]
+
+    for slug, (errors, logo_url) in zip(contents, outcomes):
+        results[slug] = (errors, logo_url)
+        # Results for in-flight index.md contents don't describe the files on disk.
+        if cache is not None and slug not in index_texts:
+            cache.put(slug, keys[slug], errors, logo_url)
+
+    report = {}
+    for slug in slugs:
+        errors, logo_url = results[slug]
+        report[slug] = errors + [f"index.md: {m}" for m in check_logo(logo_url)]
+    return report
+
+
+def validate_compose_files(
+    files: list[Path], jobs: int | None = None, use_cache: bool = True
+) -> dict[Path, list[str]]:
+    """Validate compose files about to be deployed.
+
+    Files that are a template's compose.yml get the full template check
+    (cached); any other file only gets the compose.yml rules.
+    """
+    templates: dict[str, Path] = {}
+    results: dict[Path, list[str]] = {}
+    for file in files:
+        resolved = file.resolve()
+        in_templates = resolved.parent.parent == TEMPLATES_DIR.resolve()
+        if resolved.name == "compose.yml" and in_templates:
+            templates[resolved.parent.name] = file
+        else:
+            text = _read(file)
+            results[file] = (
+                validate_compose(text) if text is not None else ["file not found"]
+            )
+    if templates:
+        cache = ValidationCache() if use_cache else None
+        for slug, errors in validate_templates(list(templates), jobs, cache).items():
+            results[templates[slug]] = errors
+        if cache is not None:
+            cache.save()
+    return results
+
+
+def print_errors(errors: dict, label=str) -> int:
+    """Print grouped errors like validate-templates.ts. Returns the error count."""
+    C = Colors
+    failing = {name: messages for name, messages in errors.items() if messages}
+    separator = "─" * 60
+    for name, messages in failing.items():
+        print(f"{C.GREY}{separator}{C.ENDC}", file=sys.stderr)
+        print(f"{C.RED}[{label(name)}]{C.ENDC}", file=sys.stderr)
+        for message in messages:
+            print(f"  • {message}", file=sys.stderr)
+    if failing:
+        print(f"{C.GREY}{separator}{C.ENDC}", file=sys.stderr)
+    return len(failing)
+
+
+def main(templates: list[str], jobs: int | None, use_cache: bool) -> None:
+    C = Colors
+    cache = ValidationCache() if use_cache else None
+    unknown = [t for t in templates if not (TEMPLATES_DIR / t).is_dir()]
+    if unknown:
+        print(f"{C.RED}Error:{C.ENDC} unknown template(s): {', '.join(unknown)}")
+        sys.exit(1)
+
+    results = validate_templates(templates or None, jobs, cache)
+    if cache is not None:
+        cache.save()
+
+    for slug, errors in results.items():
+        if not errors:
+            print(f"{C.GREEN}✓{C.ENDC} {slug}")
+    if print_errors(results):
+        sys.exit(1)
+    print(f"\n{C.GREEN}✓{C.ENDC} All {len(results)} templates are valid.")
+
+
+def cli(argv: list[str] | None = None, prog: str | None = None) -> None:
+    """Command-line entry point, also run as `zane-templates <command>`."""
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__)
+    parser.add_argument(
+        "templates", nargs="*", help="Template slugs to validate (default: all)"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker processes for templates not in the cache (default: CPU count).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Validate every template from scratch and leave the cache untouched.",
+    )
+    args = parser.parse_args(argv)
+    main(args.templates, args.jobs, not args.no_cache)
+
+
+if __name__ == "__main__":
+    cli()
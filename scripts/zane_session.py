@@ -0,0 +1,76 @@
+"""
+requests.Session subclass used by deploy_compose.py.
+
+Kept out of deploy_compose.py so that importing it (for --help, --preview or
+the zane-templates CLI) does not import requests.
+"""
+
+import sys
+import threading
+import time
+from typing import Callable
+from urllib.parse import urlsplit
+
+import requests
+
+AUTH_FAILURE_STATUSES = frozenset({401, 403})
+
+
+class ZaneSession(requests.Session):
+    """requests.Session with a default timeout and optional latency logging."""
+
+    def __init__(self, timeout: tuple[float, float], verbose: bool = False) -> None:
+        super().__init__()
+        self.timeout = timeout
+        self.verbose = verbose
+        # Called to log in again when a request is rejected with 401/403.
+        self.reauthenticate: Callable[[], None] | None = None
+        self._auth_lock = threading.Lock()
+        self._auth_generation = 0
+        self._auth_state = threading.local()
+
+    def request(self, method, url, *args, **kwargs):  # type: ignore[override]
+        kwargs.setdefault("timeout", self.timeout)
+        generation = self._auth_generation
+        resp = self._request(method, url, *args, **kwargs)
+        if (
+            resp.status_code not in AUTH_FAILURE_STATUSES
+            or self.reauthenticate is None
+            or getattr(self._auth_state, "active", False)
+        ):
+            return resp
+
+        # Only the first thread to see the rejection logs in again; the
+        # others wait for it and retry with the fresh cookies.
+        with self._auth_lock:
+            if generation == self._auth_generation:
+                self._auth_state.active = True
+                try:
+                    self.reauthenticate()
+                finally:
+                    self._auth_state.active = False
+                self._auth_generation += 1
+        headers = kwargs.get("headers")
+        if headers and "X-CSRFToken" in headers:
+            csrf_token = self.cookies.get("csrftoken")
+            kwargs["headers"] = {**headers, "X-CSRFToken": csrf_token}
+        return self._request(method, url, *args, **kwargs)
+
+    def _request(self, method, url, *args, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        try:
+            resp = super().request(method, url, *args, **kwargs)
+        except requests.RequestException as exc:
+            self._log(method, url, type(exc).__name__, start)
+            raise
+        self._log(method, url, str(resp.status_code), start)
+        return resp
+
+    def _log(self, method: str, url: str, outcome: str, start: float) -> None:
+        if self.verbose:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            path = urlsplit(url).path
+            print(
+                f"  [http] {method} {path} → {outcome} ({elapsed_ms:.0f} ms)",
+                file=sys.stderr,
+            )
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+One entry point for the template tooling in scripts/.
+
+Each command runs the `cli()` of its script, which is only imported once the
+command is known: `zane-templates --help` imports none of them, and a command
+only pays for the libraries it uses (requests, PyYAML, dotenv, ...).
+
+Usage:
+    python scripts/zane_templates.py <command> [options]
+    python scripts/zane_templates.py <command> --help
+
+Link it onto PATH to call it as `zane-templates`:
+    ln -s "$PWD/scripts/zane_templates.py" ~/.local/bin/zane-templates
+"""
+
+import argparse
+import importlib
+import sys
+
+PROG = "zane-templates"
+
+# command -> (module in scripts/, one-line summary)
+COMMANDS: dict[str, tuple[str, str]] = {
+    "fetch": (
+        "fetch_dokploy_data",
+        "Fetch Dokploy metadata and logos for local templates",
+    ),
+    "apply": ("apply_dokploy_data", "Write fetched Dokploy data into frontmatter"),
+    "validate": ("validate_templates", "Validate compose.yml and index.md files"),
+    "preview": ("render_compose", "Render a compose file's x-zane-env locally"),
+    "deploy": ("deploy_compose", "Deploy compose stacks to ZaneOps"),
+    "cleanup": ("cleanup_stacks", "Archive leftover compose stacks in ZaneOps"),
+    "history": ("deploy_history", "List and compare recorded deployments"),
+    "build-index": (
+        "build_search_index",
+        "Write search-index.json and tags.json",
+    ),
+    "sync-search": ("sync_typesense", "Sync the search index into Typesense"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    width = max(len(name) for name in COMMANDS)
+    commands = "\n".join(
+        f"  {name:<{width}}  {summary}" for name, (_, summary) in COMMANDS.items()
+    )
+    parser = argparse.ArgumentParser(
+        prog=PROG,
+        description=__doc__,
+        epilog=f"commands:\n{commands}",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        usage=f"{PROG} [-h] <command> [options]",
+    )
+    parser.add_argument(
+        "command", choices=COMMANDS, metavar="command", help="one of the commands below"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    parser = build_parser()
+
+    # Only the command name is ours; everything after it (--help included)
+    # belongs to the command's own parser.
+    if argv and not argv[0].startswith("-"):
+        command = parser.parse_args(argv[:1]).command
+    else:
+        parser.parse_args(argv)  # -h, or the missing-command error
+        return
+
+    module_name, _ = COMMANDS[command]
+    module = importlib.import_module(module_name)
+    module.cli(argv[1:], prog=f"{PROG} {command}")
+
+
+if __name__ == "__main__":
+    main()